@@ -4,13 +4,19 @@ import subprocess
 import ctypes
 import platform
 import time
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 管理员权限在进程生命周期内不会改变，导入时检测一次
+try:
+    _IS_ADMIN = bool(ctypes.windll.shell32.IsUserAnAdmin())
+except:
+    _IS_ADMIN = False
 
 def is_admin():
     """检查是否具有管理员权限"""
-    try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
-    except:
-        return False
+    return _IS_ADMIN
 
 def run_as_admin():
     """以管理员权限重新运行当前脚本"""
@@ -24,75 +30,392 @@ def run_as_admin():
     ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, params, None, 1)
     sys.exit(0)
 
+# 常见的Python安装父目录（其下为 Python* 安装目录），导入时计算一次
+_PY_INSTALL_PARENTS = (
+    os.path.join(os.environ.get('SYSTEMDRIVE', 'C:'), 'Python'),
+    os.path.join(os.environ.get('ProgramFiles', 'C:\\Program Files'), 'Python'),
+    os.path.join(os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)'), 'Python'),
+    os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~\\AppData\\Local')), 'Programs', 'Python'),
+)
+
+def _which_all(name):
+    """在PATH中查找所有名为 name 的可执行文件（类似 shutil.which，但返回全部结果）"""
+    seen = set()
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+        if not directory:
+            continue
+        path = os.path.join(directory.strip('"'), name)
+        key = os.path.normcase(path)
+        if key not in seen and os.path.isfile(path):
+            seen.add(key)
+            yield path
+
+def _file_identity(path):
+    """返回文件的物理标识 (st_dev, st_ino)，用于识别指向同一文件的不同路径"""
+    try:
+        st = os.stat(path)
+        if st.st_ino:
+            return (st.st_dev, st.st_ino)
+    except OSError:
+        pass
+    return os.path.normcase(os.path.abspath(path))
+
 def find_system_python():
-    """查找系统Python安装"""
-    python_paths = []
+    """查找系统Python安装（生成器，按优先级逐个产出，找到合适版本后即可停止）"""
+    seen = set()
+    
+    def first_seen(path):
+        key = _file_identity(path)
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
     
-    # 使用where命令查找python.exe
+    # 在PATH中查找python.exe/python3.exe
+    for name in ('python.exe', 'python3.exe'):
+        for path in _which_all(name):
+            if first_seen(path):
+                yield path
+    
+    # 检查常见路径下的 Python* 安装目录
+    for parent in _PY_INSTALL_PARENTS:
+        try:
+            with os.scandir(parent) as entries:
+                install_dirs = [e.path for e in entries if e.name.lower().startswith('python') and e.is_dir()]
+        except OSError:
+            continue
+        # 同一目录下较新的Python版本优先
+        for install_dir in sorted(install_dirs, reverse=True):
+            path = os.path.join(install_dir, 'python.exe')
+            if os.path.isfile(path) and first_seen(path):
+                yield path
+
+# 版本检测结果缓存文件，键为 (路径, 大小, 修改时间)
+VERSION_CACHE_FILE = os.path.join(
+    os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'MaiCoreStart', 'python_version_cache.json'
+)
+
+def _load_cache():
+    """加载Python版本检测缓存"""
+    try:
+        with open(VERSION_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    """保存Python版本检测缓存"""
     try:
-        result = subprocess.run(['where', 'python.exe'], capture_output=True, text=True, check=True, timeout=10)
-        python_paths.extend(result.stdout.strip().split('\n'))
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        os.makedirs(os.path.dirname(VERSION_CACHE_FILE), exist_ok=True)
+        with open(VERSION_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+    except OSError:
         pass
+
+def _cache_key(python_exe):
+    """根据解释器的路径、大小和修改时间生成缓存键"""
+    st = os.stat(python_exe)
+    return f"{os.path.normcase(os.path.abspath(python_exe))}|{st.st_size}|{st.st_mtime_ns}"
+
+def check_python_version(python_exe):
+    """检查Python版本是否大于等于3.8.0且小于3.14.0（结果按解释器文件缓存）"""
+    return check_python_versions([python_exe])[0]
+
+def check_python_versions(python_paths):
+    """并行检查多个Python的版本，按输入顺序返回 (是否可用, 版本号) 列表"""
+    cache = _load_cache()
+    results = [(False, "未知")] * len(python_paths)
+    misses = []
     
-    # 检查常见路径
-    common_paths = [
-        os.path.join(os.environ.get('SYSTEMDRIVE', 'C:'), 'Python', 'Python*', 'python.exe'),
-        os.path.join(os.environ.get('ProgramFiles', 'C:\\Program Files'), 'Python', 'Python*', 'python.exe'),
-        os.path.join(os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)'), 'Python', 'Python*', 'python.exe'),
-        os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~\\AppData\\Local')), 'Programs', 'Python', 'Python*', 'python.exe'),
-    ]
-    
-    import glob
-    for path_pattern in common_paths:
-        for path in glob.glob(path_pattern):
-            if os.path.isfile(path):
-                python_paths.append(path)
+    for index, python_exe in enumerate(python_paths):
+        try:
+            key = _cache_key(python_exe)
+        except OSError:
+            continue
+        cached = cache.get(key)
+        if isinstance(cached, list) and len(cached) == 2:
+            results[index] = (bool(cached[0]), cached[1])
+        else:
+            misses.append((index, python_exe, key))
     
-    # 去重并排序（最新的Python版本优先）
-    python_paths = sorted(set(python_paths), reverse=True)
+    if misses:
+        # 每次检测都是独立的子进程，使用线程池并发启动
+        with ThreadPoolExecutor(max_workers=min(8, len(misses))) as executor:
+            probed = list(executor.map(_probe_python_version, [exe for _, exe, _ in misses]))
+        
+        for (index, _, key), (is_suitable, version_str) in zip(misses, probed):
+            results[index] = (is_suitable, version_str)
+            if version_str != "未知":
+                cache[key] = [is_suitable, version_str]
+        _save_cache(cache)
     
-    return python_paths
+    return results
 
-def check_python_version(python_exe):
-    """检查Python版本是否大于等于3.8.0且小于3.14.0"""
+# 探测类子进程（版本检测等）的超时时间，解释器正常启动远小于该值
+PROBE_TIMEOUT = 2
+
+# 支持的Python版本范围（sys.hexversion 格式）：>= 3.8.0 且 < 3.14.0
+MIN_HEXVERSION = 0x03080000
+MAX_HEXVERSION = 0x030E0000
+
+def _probe_python_version(python_exe):
+    """启动解释器获取 sys.hexversion 并判断是否可用"""
     try:
-        result = subprocess.run([python_exe, '--version'], capture_output=True, text=True, check=True, timeout=10)
-        version_str = result.stdout.strip().split()[1]
-        
-        # 解析版本号
-        parts = version_str.split('.')
-        major, minor = int(parts[0]), int(parts[1])
+        # -S 跳过 site 初始化，加快解释器启动
+        result = subprocess.run([python_exe, '-Sc', 'import sys;print(sys.hexversion)'],
+                                capture_output=True, text=True, check=True, timeout=PROBE_TIMEOUT)
+        hexversion = int(result.stdout.strip())
+        version_str = f"{(hexversion >> 24) & 0xFF}.{(hexversion >> 16) & 0xFF}.{(hexversion >> 8) & 0xFF}"
         
         # 检查版本是否 >= 3.14，如果是则标记为不可用
-        if major > 3 or (major == 3 and minor >= 14):
+        if hexversion >= MAX_HEXVERSION:
             print(f"[WARNING] 检测到Python版本 {version_str} >= 3.14，当前版本不可用")
             return False, version_str
         
         # 检查版本是否 >= 3.8 且 < 3.14
-        if major > 3 or (major == 3 and minor >= 8):
-            return True, version_str
-        else:
-            return False, version_str
-    except (subprocess.CalledProcessError, FileNotFoundError, ValueError, IndexError, subprocess.TimeoutExpired):
+        return hexversion >= MIN_HEXVERSION, version_str
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError, subprocess.TimeoutExpired):
         return False, "未知"
 
-def create_virtualenv(python_exe, target_dir):
-    """创建虚拟环境"""
+# 虚拟环境快照缓存目录
+VENV_CACHE_ROOT = os.path.join(
+    os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'MaiCoreStart', 'maicore_venv_cache'
+)
+
+def _venv_cache_dir(python_exe, target_dir):
+    """返回虚拟环境快照目录，按解释器文件与目标位置区分
+    
+    虚拟环境中的激活脚本和 Scripts 下的启动器记录了绝对路径，
+    因此快照只复用到同一个目标目录。
+    """
+    import hashlib
+    identity = f"{_cache_key(python_exe)}|{os.path.normcase(os.path.abspath(target_dir))}"
+    return os.path.join(VENV_CACHE_ROOT, hashlib.sha1(identity.encode('utf-8')).hexdigest())
+
+def _copy_venv_tree(src, dst):
+    """复制虚拟环境目录，优先使用硬链接，跨盘等情况回退为普通复制"""
+    import shutil
+    try:
+        shutil.copytree(src, dst, copy_function=os.link)
+    except (OSError, shutil.Error):
+        shutil.rmtree(dst, ignore_errors=True)
+        shutil.copytree(src, dst)
+
+def _restore_venv_cache(python_exe, target_dir):
+    """尝试从快照恢复虚拟环境，成功返回True"""
+    try:
+        cache_dir = _venv_cache_dir(python_exe, target_dir)
+    except OSError:
+        return False
+    if not os.path.isfile(os.path.join(cache_dir, 'pyvenv.cfg')):
+        return False
+    
+    print(f"发现虚拟环境快照，正在从缓存恢复: {cache_dir}")
+    try:
+        _copy_venv_tree(cache_dir, target_dir)
+        return True
+    except OSError as e:
+        print(f"从缓存恢复失败: {e}")
+        import shutil
+        shutil.rmtree(target_dir, ignore_errors=True)
+        return False
+
+def _save_venv_cache(python_exe, target_dir):
+    """将新建的虚拟环境保存为快照，供下次直接复用"""
+    import shutil
+    try:
+        cache_dir = _venv_cache_dir(python_exe, target_dir)
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        os.makedirs(VENV_CACHE_ROOT, exist_ok=True)
+        shutil.copytree(target_dir, cache_dir)
+    except OSError as e:
+        print(f"[WARNING] 保存虚拟环境快照失败: {e}")
+
+# pip 模板缓存目录（虚拟环境默认不安装pip，需要时再从这里链接过去）
+PIP_CACHE_ROOT = os.path.join(
+    os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'MaiCoreStart', 'pip_cache'
+)
+
+def _pip_entries(site_packages):
+    """返回 site-packages 中属于pip的目录名（pip 及 pip-*.dist-info）"""
+    try:
+        with os.scandir(site_packages) as entries:
+            return [e.name for e in entries
+                    if e.is_dir() and (e.name == 'pip' or (e.name.startswith('pip-') and e.name.endswith('.dist-info')))]
+    except OSError:
+        return []
+
+def ensure_pip(python_exe, venv_dir):
+    """确保虚拟环境中有pip，优先从缓存的pip模板链接，否则通过ensurepip安装并写入缓存"""
+    import shutil
+    site_packages = os.path.join(venv_dir, "Lib", "site-packages")
+    if os.path.isdir(os.path.join(site_packages, "pip")):
+        return True
+    
+    try:
+        import hashlib
+        cache_dir = os.path.join(PIP_CACHE_ROOT, hashlib.sha1(_cache_key(python_exe).encode('utf-8')).hexdigest())
+    except OSError:
+        cache_dir = None
+    
+    # 从缓存恢复
+    cached_entries = _pip_entries(cache_dir) if cache_dir else []
+    if 'pip' in cached_entries:
+        try:
+            for name in cached_entries:
+                _copy_venv_tree(os.path.join(cache_dir, name), os.path.join(site_packages, name))
+            print("已从缓存为虚拟环境安装pip")
+            return True
+        except OSError as e:
+            print(f"从缓存安装pip失败: {e}")
+    
+    # 使用ensurepip安装
+    print("正在为虚拟环境安装pip...")
+    venv_python = os.path.join(venv_dir, "Scripts", "python.exe")
+    try:
+        result = subprocess.run([venv_python, "-m", "ensurepip", "--default-pip"],
+                                capture_output=True, text=True, timeout=300)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"安装pip失败: {e}")
+        return False
+    if result.returncode != 0:
+        print(f"安装pip失败，返回码: {result.returncode}")
+        return False
+    
+    # 写入缓存供下次使用
+    if cache_dir:
+        try:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            os.makedirs(cache_dir, exist_ok=True)
+            for name in _pip_entries(site_packages):
+                shutil.copytree(os.path.join(site_packages, name), os.path.join(cache_dir, name))
+        except OSError as e:
+            print(f"[WARNING] 缓存pip失败: {e}")
+    return True
+
+def _is_valid_venv(target_dir):
+    """检查已有虚拟环境是否可用：pyvenv.cfg 指向的解释器存在且能正常启动"""
+    venv_python = os.path.join(target_dir, "Scripts", "python.exe")
+    cfg_path = os.path.join(target_dir, "pyvenv.cfg")
+    if not os.path.isfile(venv_python) or not os.path.isfile(cfg_path):
+        return False
+    
+    try:
+        home = None
+        with open(cfg_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                key, sep, value = line.partition('=')
+                if sep and key.strip().lower() == 'home':
+                    home = value.strip()
+                    break
+        if not home or not os.path.isdir(home):
+            return False
+        
+        result = subprocess.run([venv_python, "-c", "import sys"], capture_output=True, timeout=5)
+        return result.returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+def create_virtualenv(python_exe, target_dir, force=False):
+    """创建虚拟环境，已有可用的虚拟环境时直接复用（force=True 时强制重建）"""
     try:
         print(f"使用Python: {python_exe}")
         print(f"目标目录: {target_dir}")
         
+        if not force and _is_valid_venv(target_dir):
+            print("检测到可用的虚拟环境，跳过创建（使用 --force 强制重建）")
+            print(f"虚拟环境位置: {target_dir}")
+            return True
+        
         # 确保目标目录不存在
         if os.path.exists(target_dir):
             print(f"目录已存在，先删除: {target_dir}")
             import shutil
             shutil.rmtree(target_dir, ignore_errors=True)
-            time.sleep(1)  # 等待目录删除完成
+            # 等待目录删除完成（最多2秒）
+            deadline = time.monotonic() + 2.0
+            while os.path.exists(target_dir) and time.monotonic() < deadline:
+                time.sleep(0.02)
+        
+        # 优先从快照恢复；强制重建时跳过快照，重新创建后覆盖旧快照
+        if not force and _restore_venv_cache(python_exe, target_dir):
+            print("虚拟环境创建成功!")
+            print(f"虚拟环境位置: {target_dir}")
+            return True
+        
+        if _build_virtualenv(python_exe, target_dir):
+            _save_venv_cache(python_exe, target_dir)
+            return True
+        return False
         
+    except subprocess.TimeoutExpired:
+        print("创建虚拟环境超时")
+        return False
+    except Exception as e:
+        print(f"创建虚拟环境时发生未知错误: {e}")
+        return False
+
+def _has_virtualenv(python_exe):
+    """检查指定的Python是否安装了virtualenv"""
+    try:
+        result = subprocess.run(
+            [python_exe, "-c", "import importlib.util,sys;sys.exit(importlib.util.find_spec('virtualenv') is None)"],
+            capture_output=True, timeout=PROBE_TIMEOUT
+        )
+        return result.returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+def is_uv_available():
+    """检查uv是否可用（仅在PATH中查找，不启动子进程）"""
+    import shutil
+    return shutil.which("uv") is not None
+
+def _is_current_interpreter(python_exe):
+    """判断 python_exe 是否就是当前运行的解释器"""
+    try:
+        return os.path.samefile(python_exe, sys.executable)
+    except OSError:
+        return False
+
+def _build_virtualenv(python_exe, target_dir):
+    """依次尝试多种方式新建虚拟环境"""
+    # 优先使用uv创建（速度更快，且默认不安装pip）
+    if is_uv_available():
+        print("尝试使用uv创建虚拟环境...")
+        try:
+            result = subprocess.run(["uv", "venv", "--python", python_exe, target_dir],
+                                    capture_output=True, text=True, timeout=60)
+            if result.returncode == 0:
+                print("虚拟环境创建成功!")
+                print(f"虚拟环境位置: {target_dir}")
+                return True
+            print(f"uv创建失败，返回码: {result.returncode}")
+            if result.stderr:
+                print(f"错误输出: {result.stderr}")
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"uv创建失败: {e}")
+    
+    # 选中的Python就是当前解释器时，直接在进程内创建，省去一次解释器启动
+    if _is_current_interpreter(python_exe):
+        print("尝试在当前进程中使用venv模块创建...")
+        try:
+            import venv
+            venv.EnvBuilder(with_pip=False, symlinks=False).create(target_dir)
+            print("虚拟环境创建成功!")
+            print(f"虚拟环境位置: {target_dir}")
+            return True
+        except Exception as e:
+            print(f"进程内创建失败: {e}")
+    
+    # 方法1运行的同时预先检测virtualenv是否可用，方法1失败时无需再等待方法2的探测
+    executor = ThreadPoolExecutor(max_workers=1)
+    virtualenv_probe = executor.submit(_has_virtualenv, python_exe)
+    try:
         # 方法1: 使用venv模块
         print("尝试方法1: 使用venv模块...")
-        result = subprocess.run([python_exe, "-m", "venv", target_dir], 
+        result = subprocess.run([python_exe, "-m", "venv", "--without-pip", target_dir], 
                                capture_output=True, text=True, timeout=120)
         
         if result.returncode == 0:
@@ -108,22 +431,22 @@ def create_virtualenv(python_exe, target_dir):
             
             # 方法2: 使用virtualenv (如果安装)
             print("尝试方法2: 使用virtualenv...")
-            try:
-                result = subprocess.run([python_exe, "-m", "virtualenv", target_dir], 
+            if virtualenv_probe.result():
+                result = subprocess.run([python_exe, "-m", "virtualenv", "--no-pip", target_dir], 
                                        capture_output=True, text=True, timeout=120)
                 if result.returncode == 0:
                     print("虚拟环境创建成功!")
                     return True
                 else:
                     print(f"方法2失败，返回码: {result.returncode}")
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            else:
                 print("virtualenv未安装")
             
             # 方法3: 直接调用venv模块的main函数
             print("尝试方法3: 直接调用venv...")
             try:
                 import venv
-                builder = venv.EnvBuilder(with_pip=True)
+                builder = venv.EnvBuilder(with_pip=False)
                 builder.create(target_dir)
                 print("虚拟环境创建成功!")
                 return True
@@ -131,13 +454,8 @@ def create_virtualenv(python_exe, target_dir):
                 print(f"方法3失败: {e}")
                 
         return False
-        
-    except subprocess.TimeoutExpired:
-        print("创建虚拟环境超时")
-        return False
-    except Exception as e:
-        print(f"创建虚拟环境时发生未知错误: {e}")
-        return False
+    finally:
+        executor.shutdown(wait=False)
 
 def main():
     # 检查是否有传递工作目录参数
@@ -150,7 +468,8 @@ def main():
             break
     
     print(f"工作目录: {working_dir}")
-    print(f"当前目录: {os.getcwd()}")
+    current_dir = os.getcwd()
+    print(f"当前目录: {current_dir}")
     
     # 检查管理员权限
     if not is_admin():
@@ -160,11 +479,11 @@ def main():
         return
     
     print("已获取管理员权限")
-    print(f"管理员模式下的当前目录: {os.getcwd()}")
+    print(f"管理员模式下的当前目录: {current_dir}")
     
     # 查找系统Python
     print("正在查找系统Python安装...")
-    python_paths = find_system_python()
+    python_paths = list(find_system_python())
     
     if not python_paths:
         print("未找到Python安装，请确保Python已安装")
@@ -173,10 +492,9 @@ def main():
     
     print(f"找到以下Python安装: {python_paths}")
     
-    # 检查Python版本
+    # 并行检查Python版本，按优先级顺序选择第一个合适的版本
     suitable_python = None
-    for python_exe in python_paths:
-        is_suitable, version = check_python_version(python_exe)
+    for python_exe, (is_suitable, version) in zip(python_paths, check_python_versions(python_paths)):
         if is_suitable:
             print(f"找到合适的Python版本: {python_exe} (版本 {version})")
             suitable_python = python_exe
@@ -204,7 +522,7 @@ def main():
         print(f"写入权限检查失败: {e}")
         print("可能需要手动设置目录权限")
     
-    if create_virtualenv(suitable_python, venv_dir):
+    if create_virtualenv(suitable_python, venv_dir, force='--force' in sys.argv[1:]):
         print("虚拟环境创建成功，正在安装依赖...")
         requirements_path = os.path.join(working_dir, "requirements.txt")
         venv_python = os.path.join(venv_dir, "Scripts", "python.exe")
@@ -216,35 +534,47 @@ def main():
             # 安装依赖
             print(f"正在安装依赖: {requirements_path}")
             
-            # 检查uv是否可用
-            def is_uv_available():
-                try:
-                    subprocess.run(["uv", "--version"], check=True, capture_output=True)
-                    return True
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    return False
-            
             # 运行命令并实时显示输出
-            def run_command_with_output(cmd, description):
+            # passthrough=True 时子进程直接继承终端输出（适用于自带进度条的uv）
+            def run_command_with_output(cmd, description, passthrough=False):
                 print(f"正在{description}...")
                 try:
-                    # 使用Popen来实时显示输出
-                    process = subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        bufsize=1,
-                        universal_newlines=True
-                    )
+                    if passthrough:
+                        sys.stdout.flush()
+                        returncode = subprocess.run(cmd, check=False).returncode
+                        if returncode == 0:
+                            print(f"{description}完成")
+                            return True
+                        print(f"{description}失败，返回码: {returncode}")
+                        return False
+                    
+                    # 输出由系统直接写入日志文件，后台线程按块读取日志并显示到终端
+                    log_path = os.path.join(working_dir, "install.log")
+                    with open(log_path, "wb") as log_file:
+                        process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT)
+                    
+                    finished = threading.Event()
+                    
+                    def tail_log():
+                        out = sys.stdout.buffer
+                        with open(log_path, "rb") as f:
+                            while True:
+                                chunk = f.read(65536)
+                                if chunk:
+                                    out.write(chunk)
+                                    out.flush()
+                                elif finished.is_set():
+                                    break
+                                else:
+                                    time.sleep(0.1)
                     
-                    # 实时读取输出
-                    if process.stdout:
-                        for line in process.stdout:
-                            print(line, end='')  # 直接打印到终端
+                    tail_thread = threading.Thread(target=tail_log, daemon=True)
+                    tail_thread.start()
                     
-                    # 等待进程完成
+                    # 等待进程完成并输出剩余日志
                     process.wait()
+                    finished.set()
+                    tail_thread.join()
                     
                     if process.returncode == 0:
                         print(f"{description}完成")
@@ -263,9 +593,11 @@ def main():
                 install_cmd = [
                     "uv", "pip", "install", "-r", requirements_path,
                     "-i", "https://pypi.tuna.tsinghua.edu.cn/simple",
-                    "--python", venv_python
+                    "--python", venv_python,
+                    # 从uv缓存硬链接到虚拟环境，并跳过pyc预编译以减少磁盘写入
+                    "--link-mode=hardlink", "--no-compile-bytecode"
                 ]
-                success = run_command_with_output(install_cmd, "使用uv安装依赖")
+                success = run_command_with_output(install_cmd, "使用uv安装依赖", passthrough=True)
                 
                 if success:
                     print("✅ uv依赖安装完成!")
@@ -273,12 +605,12 @@ def main():
                     print("⚠️ uv安装失败，尝试使用pip...")
                     # uv失败后回退到pip
                     install_cmd = [venv_python, "-m", "pip", "install", "-r", requirements_path, "-i", "https://pypi.tuna.tsinghua.edu.cn/simple"]
-                    success = run_command_with_output(install_cmd, "使用pip安装依赖")
+                    success = ensure_pip(suitable_python, venv_dir) and run_command_with_output(install_cmd, "使用pip安装依赖")
             else:
                 print("未检测到uv，使用pip安装依赖...")
                 # 回退到pip
                 install_cmd = [venv_python, "-m", "pip", "install", "-r", requirements_path, "-i", "https://pypi.tuna.tsinghua.edu.cn/simple"]
-                success = run_command_with_output(install_cmd, "使用pip安装依赖")
+                success = ensure_pip(suitable_python, venv_dir) and run_command_with_output(install_cmd, "使用pip安装依赖")
             
             if success:
                 print("依赖安装完成!")
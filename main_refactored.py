@@ -5,45 +5,116 @@ MCStart主程序
 import sys
 import os
 import time
+import bisect
 import threading
 from pathlib import Path
 from typing import Tuple, Any
 
+# 项目根目录（本文件所在目录）
+HERE = os.path.dirname(os.path.abspath(__file__))
+
 # 添加项目根目录到Python路径
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
 
-import structlog
 from src.core.logging import setup_logging, get_logger
+
+# 设置日志（先于其它模块导入，加载配置时产生的日志也能写入文件）
+setup_logging()
+
 from src.core.config import config_manager
 from src.ui.interface import ui
-from src.modules.launcher import launcher
 from src.modules.config_manager import config_mgr
-from src.modules.knowledge import knowledge_builder
-from src.utils.common import setup_console
+from src.utils.common import setup_console, wait_for_console_input
 from src.utils.system_tray import SystemTrayManager
 from src.core.p_config import p_config_manager
- 
-# 设置日志
-setup_logging()
+from rich.console import Group
+from rich.text import Text
+
 logger = get_logger(__name__)
 
 
+# 判断目录是否为MaiBot实例所用的文件/目录名
+_MAIBOT_KEY_FILES = frozenset(("bot.py", "main.py", "package.json"))
+_MAIBOT_INDICATORS = frozenset(("src", "plugins", "config", "adapter"))
+
+# 进程监控界面的可用命令（已排序，供前缀补全二分查找）
+_MONITOR_COMMANDS = sorted(("stop", "restart", "details", "stopall", "quit", "q"))
+
+# 较重的功能模块在首次使用时才导入，缩短启动器的启动时间
+_LAZY_ATTRS = {
+    "launcher": "src.modules.launcher",
+    "knowledge_builder": "src.modules.knowledge",
+    "component_manager": "src.modules.component_download.component_manager",
+    "deployment_manager": "src.modules.deployment",
+}
+
+
+def __getattr__(name: str):
+    """按需导入模块级对象（PEP 562）"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _complete_prefix(candidates, prefix: str, allow_exact: bool = True):
+    """在已排序的候选列表中二分查找第一个以 prefix 开头的项，没有则返回 None"""
+    index = bisect.bisect_left(candidates, prefix)
+    if not allow_exact and index < len(candidates) and candidates[index] == prefix:
+        index += 1
+    if index < len(candidates) and candidates[index].startswith(prefix):
+        return candidates[index]
+    return None
+
+
+# 固定菜单文本的渲染缓存：键为 (文本, 样式) 行序列，主题颜色修改后自然对应新的键
+_STATIC_PANEL_CACHE = {}
+
+
+def _render_static(lines) -> Group:
+    """将固定的菜单文本行构造成一个 Group 并缓存，避免每次进入菜单逐行打印"""
+    group = _STATIC_PANEL_CACHE.get(lines)
+    if group is None:
+        group = Group(*(Text(text, style=style) for text, style in lines))
+        _STATIC_PANEL_CACHE[lines] = group
+    return group
+
+
 class MaiMaiLauncher:
     """MCStart主程序类"""
     
     def __init__(self):
         self.running = True
         self._keep_processes_on_exit = False
-        base_dir = Path(getattr(sys, "_MEIPASS", Path(__file__).parent))
+        base_dir = Path(getattr(sys, "_MEIPASS", HERE))
         self.tray_manager = SystemTrayManager(base_dir / "output.ico")
         self.tray_manager.apply_console_icon()
         self._tray_restore_event = threading.Event()
         self._tray_exit_event = threading.Event()
+        # 进程监控后台线程发布的最新数据：(版本号, 进程表, PID补全候选)
+        self._latest_process_data = (0, None, [])
+        # 退出时对托管进程的处理方式，程序设置菜单修改后同步更新
+        self._exit_action = p_config_manager.get("on_exit.process_action", "ask")
+        # 主菜单选项 -> 处理方法（A 需要根据是否有活跃实例决定，Q 单独处理退出）
+        self._menu_handlers = {
+            "B": self.handle_config_menu,
+            "C": self.handle_knowledge_menu,
+            "D": self.handle_migration,
+            "E": ui.show_plugin_menu,  # 插件管理
+            "F": self.handle_deployment_menu,
+            "G": self.handle_process_status,
+            "H": self.handle_misc_menu,
+            "R": self._refresh_quote_in_main_menu,
+        }
         setup_console()
         logger.info("MCStart已启动")
     
     def handle_launch_mai(self):
         """处理启动实例的菜单"""
+        from src.modules.launcher import launcher
         try:
             ui.clear_screen()
             # 选择配置
@@ -55,8 +126,7 @@ class MaiMaiLauncher:
             errors = launcher.validate_configuration(config)
             if errors:
                 ui.print_error("发现配置错误：")
-                for error in errors:
-                    ui.console.print(f"  • {error}", style=ui.colors["error"])
+                ui.console.print(Group(*(Text(f"  • {error}", style=ui.colors["error"]) for error in errors)))
                 ui.pause()
                 return
             
@@ -132,22 +202,11 @@ class MaiMaiLauncher:
             if choice == "Q":
                 break
             elif choice in ["A", "B", "D", "G", "H"]:
-                # 需要选择配置的操作
-                config = config_mgr.select_configuration()
-                if not config:
-                    continue
-                
-                # 找到配置名称
-                config_name = None
-                for name, cfg in configurations.items():
-                    if cfg == config:
-                        config_name = name
-                        break
-                
-                if not config_name:
-                    ui.print_error("无法找到配置名称")
-                    ui.pause()
+                # 需要选择配置的操作，选择时直接带回配置集名称，无需反查
+                selected = config_mgr.select_named_configuration()
+                if not selected:
                     continue
+                config_name, config = selected
                 
                 if choice == "A":
                     # 查看配置详情
@@ -163,8 +222,7 @@ class MaiMaiLauncher:
                     errors = launcher.validate_configuration(config)
                     if errors:
                         ui.print_error("发现配置错误：")
-                        for error in errors:
-                            ui.console.print(f"  • {error}", style=ui.colors["error"])
+                        ui.console.print(Group(*(Text(f"  • {error}", style=ui.colors["error"]) for error in errors)))
                     else:
                         ui.print_success("配置验证通过")
                     ui.pause()
@@ -180,14 +238,16 @@ class MaiMaiLauncher:
             elif choice == "C":
                 # 可视化编辑配置，直接在新窗口中运行 run_with_ui_port.py
                 import subprocess
-                import sys
-                import os
-                script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "run_with_ui_port.py")
-                # Windows下用start命令新开窗口
+                script_path = os.path.join(HERE, "run_with_ui_port.py")
+                # Windows下直接以新控制台窗口启动，无需经由 cmd 的 start 命令
                 if sys.platform.startswith("win"):
-                    subprocess.Popen(["start", "", sys.executable, script_path], shell=True)
+                    subprocess.Popen(
+                        [sys.executable, script_path],
+                        creationflags=subprocess.CREATE_NEW_CONSOLE,
+                        close_fds=True,
+                    )
                 else:
-                    subprocess.Popen([sys.executable, script_path])
+                    subprocess.Popen([sys.executable, script_path], close_fds=True, start_new_session=True)
                 ui.print_info("已在新窗口启动可视化配置界面。请在浏览器中操作。")
                 ui.pause()
 
@@ -214,19 +274,21 @@ class MaiMaiLauncher:
     
     def handle_knowledge_menu(self):
         """处理知识库菜单"""
+        from src.modules.knowledge import knowledge_builder
         while True:
             ui.clear_screen()
-            ui.console.print("[🔧 知识库构建]", style=ui.colors["secondary"])
-            ui.console.print("================")
-            ui.console.print(">>> LPMM功能仅适用于支持LPMM知识库的版本，如'0.6.3-alpha' <<<", style=ui.colors["error"])
-            
-            ui.console.print(" [A] LPMM知识库一条龙构建", style=ui.colors["secondary"])
-            ui.console.print(" [B] LPMM知识库文本分割", style="#02A18F")
-            ui.console.print(" [C] LPMM知识库实体提取", style="#02A18F")
-            ui.console.print(" [D] LPMM知识库知识图谱导入", style="#02A18F")
-            ui.console.print(" [E] 旧版知识库构建（仅0.6.0-alpha及更早版本）", style="#924444")
-            ui.console.print(" [Q] 返回主菜单", style="#7E1DE4")
-            ui.console.print(">>> 仍使用旧版知识库的版本（如0.6.0-alpha）请选择选项 [E] <<<", style=ui.colors["error"])
+            ui.console.print(_render_static((
+                ("[🔧 知识库构建]", ui.colors["secondary"]),
+                ("================", ""),
+                (">>> LPMM功能仅适用于支持LPMM知识库的版本，如'0.6.3-alpha' <<<", ui.colors["error"]),
+                (" [A] LPMM知识库一条龙构建", ui.colors["secondary"]),
+                (" [B] LPMM知识库文本分割", "#02A18F"),
+                (" [C] LPMM知识库实体提取", "#02A18F"),
+                (" [D] LPMM知识库知识图谱导入", "#02A18F"),
+                (" [E] 旧版知识库构建（仅0.6.0-alpha及更早版本）", "#924444"),
+                (" [Q] 返回主菜单", "#7E1DE4"),
+                (">>> 仍使用旧版知识库的版本（如0.6.0-alpha）请选择选项 [E] <<<", ui.colors["error"]),
+            )))
             
             choice = ui.get_choice("请选择操作", ["A", "B", "C", "D", "E", "Q"])
             
@@ -256,10 +318,13 @@ class MaiMaiLauncher:
     
     def handle_migration(self):
         """处理数据库迁移"""
+        from src.modules.knowledge import knowledge_builder
         ui.clear_screen()
-        ui.console.print("[🔄 知识库迁移]", style="#28DCF0")
-        ui.console.print("MongoDB → SQLite 数据迁移")
-        ui.console.print("================")
+        ui.console.print(_render_static((
+            ("[🔄 知识库迁移]", "#28DCF0"),
+            ("MongoDB → SQLite 数据迁移", ""),
+            ("================", ""),
+        )))
         
         knowledge_builder.migrate_mongodb_to_sqlite()
         ui.pause()
@@ -268,13 +333,14 @@ class MaiMaiLauncher:
         """处理部署菜单"""
         while True:
             ui.clear_screen()
-            ui.console.print("[部署辅助系统]", style=ui.colors["primary"])
-            ui.console.print("=================")
-            
-            ui.console.print(" [A] 实例部署", style=ui.colors["success"])
-            ui.console.print(" [B] 实例更新", style=ui.colors["warning"])
-            ui.console.print(" [C] 实例删除", style=ui.colors["error"])
-            ui.console.print(" [Q] 返回主菜单", style="#7E1DE4")
+            ui.console.print(_render_static((
+                ("[部署辅助系统]", ui.colors["primary"]),
+                ("=================", ""),
+                (" [A] 实例部署", ui.colors["success"]),
+                (" [B] 实例更新", ui.colors["warning"]),
+                (" [C] 实例删除", ui.colors["error"]),
+                (" [Q] 返回主菜单", "#7E1DE4"),
+            )))
             
             choice = ui.get_choice("请选择操作", ["A", "B", "C", "Q"])
             
@@ -302,38 +368,35 @@ class MaiMaiLauncher:
     def handle_about_menu(self):
         """处理关于菜单"""
         ui.clear_screen()
-        ui.console.print("=========>>>关于本程序<<<=========", style=ui.colors["primary"])
-        ui.console.print("麦麦核心启动器控制台 MaiCore Start", style=ui.colors["primary"])
-        ui.console.print("=================================")
-        
-        ui.console.print("版本：V4.2.0-beta", style=ui.colors["info"])
-        ui.console.print("新增亮点：", style=ui.colors["success"])
-        ui.console.print("  • 模块化部署逻辑", style="white")
-        ui.console.print("  • 精确的资源监控器", style="white")
-        ui.console.print("  • 丰富的可自定义UI界面（rich）", style="white")
-        ui.console.print("  • 改进的错误处理", style="white")
-        ui.console.print("  • 实例多开端口自动分配", style="white")
-        ui.console.print("  • 代理功能", style="white")
-        ui.console.print("  • 插件功能", style="white")
-        
-        ui.console.print("\n技术栈：", style=ui.colors["info"])
-        ui.console.print("  • Python 3.12.8", style="white")
-        ui.console.print("  • structlog - 结构化日志", style="white")
-        ui.console.print("  • rich - 终端UI", style="white")
-        ui.console.print("  • toml - 配置管理", style="white")        
-        
-        ui.console.print("\n开源许可：Apache License 2.0", style=ui.colors["secondary"])
-        ui.console.print("GitHub：https://github.com/MaiCore-Start/MaiCore-Start", style="#46AEF8")
-        ui.console.print("你喜欢的话，请给个Star支持一下哦~", style="white")
-        ui.console.print("欢迎加入我们的社区！（我们的QQ群聊：1025509724）", style="white")
-        ui.console.print("查看文档中心获取帮助：", style="white")
-        ui.console.print("https://docs.mmcstart.cn:8850/", style="#46AEF8")
-
-        ui.console.print("\n感谢以下为此项目做出贡献的开发者：", style=ui.colors["header"])
-        ui.console.print("  • 小城之雪（xiaoCZX） - 整个项目的提出者和主要开发者", style="white")
-        ui.console.print("  • 一闪 - 为此项目的v4.0版本重构提供了大量支持", style="white")
-        ui.console.print("  • 其他贡献者：Lui", style="white")
-
+        ui.console.print(_render_static((
+            ("=========>>>关于本程序<<<=========", ui.colors["primary"]),
+            ("麦麦核心启动器控制台 MaiCore Start", ui.colors["primary"]),
+            ("=================================", ""),
+            ("版本：V4.2.0-beta", ui.colors["info"]),
+            ("新增亮点：", ui.colors["success"]),
+            ("  • 模块化部署逻辑", "white"),
+            ("  • 精确的资源监控器", "white"),
+            ("  • 丰富的可自定义UI界面（rich）", "white"),
+            ("  • 改进的错误处理", "white"),
+            ("  • 实例多开端口自动分配", "white"),
+            ("  • 代理功能", "white"),
+            ("  • 插件功能", "white"),
+            ("\n技术栈：", ui.colors["info"]),
+            ("  • Python 3.12.8", "white"),
+            ("  • logging - 结构化日志（JSONL）", "white"),
+            ("  • rich - 终端UI", "white"),
+            ("  • toml - 配置管理", "white"),
+            ("\n开源许可：Apache License 2.0", ui.colors["secondary"]),
+            ("GitHub：https://github.com/MaiCore-Start/MaiCore-Start", "#46AEF8"),
+            ("你喜欢的话，请给个Star支持一下哦~", "white"),
+            ("欢迎加入我们的社区！（我们的QQ群聊：1025509724）", "white"),
+            ("查看文档中心获取帮助：", "white"),
+            ("https://docs.mmcstart.cn:8850/", "#46AEF8"),
+            ("\n感谢以下为此项目做出贡献的开发者：", ui.colors["header"]),
+            ("  • 小城之雪（xiaoCZX） - 整个项目的提出者和主要开发者", "white"),
+            ("  • 一闪 - 为此项目的v4.0版本重构提供了大量支持", "white"),
+            ("  • 其他贡献者：Lui", "white"),
+        )))
         ui.pause()
 
     def handle_misc_menu(self):
@@ -355,44 +418,37 @@ class MaiMaiLauncher:
 
     def handle_program_settings(self):
         """处理程序设置"""
-        while True:
-            # 重新加载颜色以反映实时变化
-            from src.ui.theme import COLORS
-            current_colors = p_config_manager.get_theme_colors()
-            current_log_days = p_config_manager.get("logging.log_rotation_days", 30)
-            on_exit_action = p_config_manager.get("on_exit.process_action", "ask")
-            minimize_to_tray = p_config_manager.get("ui.minimize_to_tray", False)
-            notifications_enabled = p_config_manager.get("notifications.windows_center_enabled", False)
+        from src.ui.theme import COLORS
+
+        def _read_settings() -> dict:
+            """读取设置菜单展示用的全部配置值（键名与 show_program_settings_menu 的参数一致）"""
             monitor_cfg = p_config_manager.get("monitor", {}) or {}
-            monitor_data_interval = monitor_cfg.get("data_refresh_interval", 2.0)
-            monitor_ui_interval = monitor_cfg.get("ui_refresh_interval", 0.3)
-            monitor_input_interval = monitor_cfg.get("input_poll_interval", 0.05)
-            
-            # 获取代理配置
             proxy_config = p_config_manager.get_proxy_config()
-            proxy_enabled = proxy_config.get("enabled", False)
-            proxy_type = proxy_config.get("type", "http")
-            proxy_host = proxy_config.get("host", "")
-            proxy_port = proxy_config.get("port", "")
-            
-            ui.show_program_settings_menu(
-                current_colors,
-                current_log_days,
-                on_exit_action,
-                minimize_to_tray,
-                notifications_enabled,
-                monitor_data_interval,
-                monitor_ui_interval,
-                monitor_input_interval,
-                proxy_enabled,
-                proxy_type,
-                proxy_host,
-                proxy_port,
-            )
+            return {
+                "current_colors": p_config_manager.get_theme_colors(),
+                "current_log_days": p_config_manager.get("logging.log_rotation_days", 30),
+                "on_exit_action": p_config_manager.get("on_exit.process_action", "ask"),
+                "minimize_to_tray_enabled": p_config_manager.get("ui.minimize_to_tray", False),
+                "notifications_enabled": p_config_manager.get("notifications.windows_center_enabled", False),
+                "monitor_data_interval": monitor_cfg.get("data_refresh_interval", 2.0),
+                "monitor_ui_interval": monitor_cfg.get("ui_refresh_interval", 0.3),
+                "monitor_input_interval": monitor_cfg.get("input_poll_interval", 0.05),
+                "proxy_enabled": proxy_config.get("enabled", False),
+                "proxy_type": proxy_config.get("type", "http"),
+                "proxy_host": proxy_config.get("host", ""),
+                "proxy_port": proxy_config.get("port", ""),
+            }
+
+        # 只在进入菜单时读取一次配置，之后每次修改保存后同步更新本地副本
+        settings = _read_settings()
+        while True:
+            ui.show_program_settings_menu(**settings)
             
             choice = ui.get_choice("请选择操作", ["L", "E", "C", "R", "T", "N", "M", "P", "Q"])
             
             if choice == "Q":
+                # 同步主循环缓存的退出设置
+                self._exit_action = settings["on_exit_action"]
                 break
             
             elif choice == "L":
@@ -404,6 +460,7 @@ class MaiMaiLauncher:
                         if new_days > 0:
                             p_config_manager.set("logging.log_rotation_days", new_days)
                             p_config_manager.save()
+                            settings["current_log_days"] = new_days
                             ui.print_success(f"日志保留天数已更新为 {new_days} 天。")
                             ui.pause()
                             break
@@ -430,6 +487,7 @@ class MaiMaiLauncher:
                     if selected_action in actions:
                         p_config_manager.set("on_exit.process_action", selected_action)
                         p_config_manager.save()
+                        settings["on_exit_action"] = selected_action
                         ui.print_success(f"退出时操作已更新为: {action_map[selected_action]}")
                         ui.pause()
                         break
@@ -437,7 +495,7 @@ class MaiMaiLauncher:
                         ui.print_error("无效输入。")
 
             elif choice == "C":
-                color_keys = list(current_colors.keys())
+                color_keys = list(settings["current_colors"].keys())
                 while True:
                     idx_input = ui.get_input("请输入要修改的颜色选项数字 (或 Q 返回): ")
                     if idx_input.upper() == 'Q':
@@ -452,6 +510,7 @@ class MaiMaiLauncher:
                             p_config_manager.save()
                             # 动态更新导入的COLORS
                             COLORS[key_to_edit] = new_value
+                            settings["current_colors"] = p_config_manager.get_theme_colors()
                             ui.print_success(f"'{key_to_edit}' 已更新为 '{new_value}'")
                             ui.pause()
                             break
@@ -467,21 +526,25 @@ class MaiMaiLauncher:
                         default_colors = p_config_manager.DEFAULT_CONFIG['theme']
                         for k, v in default_colors.items():
                             COLORS[k] = v
+                        # 整个配置被替换为默认值，重新读取全部设置
+                        settings = _read_settings()
                         ui.print_success("已成功恢复默认颜色设置。")
                     else:
                         ui.print_error("恢复默认设置失败。")
                     ui.pause()
             elif choice == "T":
-                new_value = not minimize_to_tray
+                new_value = not settings["minimize_to_tray_enabled"]
                 p_config_manager.set("ui.minimize_to_tray", new_value)
                 p_config_manager.save()
+                settings["minimize_to_tray_enabled"] = new_value
                 state_text = "开启" if new_value else "关闭"
                 ui.print_success(f"最小化到托盘功能已{state_text}。")
                 ui.pause()
             elif choice == "N":
-                new_value = not notifications_enabled
+                new_value = not settings["notifications_enabled"]
                 p_config_manager.set("notifications.windows_center_enabled", new_value)
                 p_config_manager.save()
+                settings["notifications_enabled"] = new_value
                 state_text = "开启" if new_value else "关闭"
                 ui.print_success(f"Windows 通知功能已{state_text}。")
                 ui.pause()
@@ -489,6 +552,8 @@ class MaiMaiLauncher:
             elif choice == "P":
                 # 配置网络代理
                 self.handle_proxy_config()
+                # 代理子菜单可能修改了多项代理设置，重新读取
+                settings = _read_settings()
 
             elif choice == "M":
                 # 调整监控刷新间隔
@@ -505,14 +570,17 @@ class MaiMaiLauncher:
                         except ValueError:
                             ui.print_error("请输入有效数字。")
 
-                new_data_interval = _read_positive_float("数据刷新间隔(秒)", monitor_data_interval)
-                new_ui_interval = _read_positive_float("UI刷新间隔(秒)", monitor_ui_interval)
-                new_input_interval = _read_positive_float("输入轮询间隔(秒)", monitor_input_interval)
+                new_data_interval = _read_positive_float("数据刷新间隔(秒)", settings["monitor_data_interval"])
+                new_ui_interval = _read_positive_float("UI刷新间隔(秒)", settings["monitor_ui_interval"])
+                new_input_interval = _read_positive_float("输入轮询间隔(秒)", settings["monitor_input_interval"])
 
                 p_config_manager.set("monitor.data_refresh_interval", new_data_interval)
                 p_config_manager.set("monitor.ui_refresh_interval", new_ui_interval)
                 p_config_manager.set("monitor.input_poll_interval", new_input_interval)
                 p_config_manager.save()
+                settings["monitor_data_interval"] = new_data_interval
+                settings["monitor_ui_interval"] = new_ui_interval
+                settings["monitor_input_interval"] = new_input_interval
 
                 ui.print_success("监控刷新间隔已更新。")
                 ui.pause()
@@ -690,16 +758,24 @@ class MaiMaiLauncher:
                 ui.components.show_title("组件下载中心", symbol="📥")
                 
                 # 显示组件选择菜单
-                component_key = component_manager.show_component_download_menu()
-                if not component_key:
+                component_keys = component_manager.show_component_download_menu()
+                if not component_keys:
                     break
                 
-                # 执行组件下载
-                success = component_manager.download_component(component_key)
-                if success:
-                    ui.print_success(f"组件下载完成！")
+                # 执行组件下载；选择多个组件时批量下载（版本列表并发预取）
+                if len(component_keys) == 1:
+                    success = component_manager.download_component(component_keys[0])
+                    if success:
+                        ui.print_success(f"组件下载完成！")
+                    else:
+                        ui.print_error(f"组件下载失败！")
                 else:
-                    ui.print_error(f"组件下载失败！")
+                    results = component_manager.download_multiple_components(component_keys)
+                    failed = [component_manager.components_info[key]['name'] for key, ok in results.items() if not ok]
+                    if failed:
+                        ui.print_error(f"以下组件下载失败：{', '.join(failed)}")
+                    else:
+                        ui.print_success(f"全部 {len(results)} 个组件下载完成！")
                 
                 ui.pause()
                 
@@ -712,13 +788,14 @@ class MaiMaiLauncher:
         """处理实例运行数据查看"""
         try:
             ui.clear_screen()
-            ui.console.print("[📊 实例运行数据查看]", style=ui.colors["secondary"])
-            ui.console.print("==================")
-            
-            ui.console.print("请选择数据来源方式（此功能目前仅支持MaiBot实例）：", style=ui.colors["info"])
-            ui.console.print(" [A] 从已配置的实例中选择", style=ui.colors["success"])
-            ui.console.print(" [B] 直接输入实例路径", style=ui.colors["warning"])
-            ui.console.print(" [Q] 返回上级菜单", style=ui.colors["exit"])
+            ui.console.print(_render_static((
+                ("[📊 实例运行数据查看]", ui.colors["secondary"]),
+                ("==================", ""),
+                ("请选择数据来源方式（此功能目前仅支持MaiBot实例）：", ui.colors["info"]),
+                (" [A] 从已配置的实例中选择", ui.colors["success"]),
+                (" [B] 直接输入实例路径", ui.colors["warning"]),
+                (" [Q] 返回上级菜单", ui.colors["exit"]),
+            )))
             
             choice = ui.get_choice("请选择操作", ["A", "B", "Q"])
             
@@ -794,27 +871,26 @@ class MaiMaiLauncher:
     def _validate_maibot_instance(self, instance_path: str) -> bool:
         """验证是否为有效的MaiBot实例"""
         try:
-            # 检查关键文件是否存在
-            key_files = ["bot.py", "main.py", "package.json"]
-            for file in key_files:
-                if not os.path.exists(os.path.join(instance_path, file)):
-                    return False
-            
-            # 检查是否有MaiBot相关的目录结构
-            subdirs = os.listdir(instance_path)
-            maibot_indicators = ["src", "plugins", "config", "adapter"]
-            has_maibot_structure = any(indicator in subdirs for indicator in maibot_indicators)
-            
-            return has_maibot_structure
-            
-        except Exception:
+            # 一次目录读取得到全部条目名，后续检查都在内存中完成
+            with os.scandir(instance_path) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
             return False
+        
+        # 检查关键文件是否存在
+        if not _MAIBOT_KEY_FILES.issubset(names):
+            return False
+        
+        # 检查是否有MaiBot相关的目录结构
+        return not _MAIBOT_INDICATORS.isdisjoint(names)
 
     def handle_refresh_daily_quote(self):
         """处理刷新每日一言"""
         ui.clear_screen()
-        ui.console.print("[🔄 刷新每日一言]", style=ui.colors["secondary"])
-        ui.console.print("==================")
+        ui.console.print(_render_static((
+            ("[🔄 刷新每日一言]", ui.colors["secondary"]),
+            ("==================", ""),
+        )))
         
         # 获取当前每日一言
         old_quote = ui.menus.daily_quote
@@ -822,11 +898,12 @@ class MaiMaiLauncher:
         # 刷新每日一言
         new_quote = ui.menus.refresh_daily_quote()
         
-        # 显示结果
-        ui.console.print(f"原每日一言: {old_quote}", style=ui.colors["info"])
-        ui.console.print(f"新每日一言: {new_quote}", style=ui.colors["success"])
-        
+        # 显示结果，仅在内容变化时展示新旧对比
         if old_quote != new_quote:
+            ui.console.print(Group(
+                Text(f"原每日一言: {old_quote}", style=ui.colors["info"]),
+                Text(f"新每日一言: {new_quote}", style=ui.colors["success"]),
+            ))
             ui.print_success("每日一言刷新成功！")
         else:
             ui.print_info("每日一言未发生变化（可能是随机选择了相同内容）")
@@ -835,6 +912,7 @@ class MaiMaiLauncher:
 
     def handle_process_status(self):
         """处理进程状态查看，支持自动刷新和交互式命令（最终优化版）。"""
+        from src.modules.launcher import launcher
         import msvcrt
         from rich.live import Live
         from rich.panel import Panel
@@ -846,12 +924,12 @@ class MaiMaiLauncher:
         monitor_cfg = p_config_manager.get("monitor", {}) or {}
         DATA_REFRESH_INTERVAL = float(monitor_cfg.get("data_refresh_interval", 2.0) or 2.0)
         UI_REFRESH_INTERVAL = float(monitor_cfg.get("ui_refresh_interval", 0.3) or 0.3)
-        INPUT_POLL_INTERVAL = float(monitor_cfg.get("input_poll_interval", 0.05) or 0.05)
 
         # 合理下限保护，避免配置过小导致高占用
         DATA_REFRESH_INTERVAL = max(0.5, DATA_REFRESH_INTERVAL)
         UI_REFRESH_INTERVAL = max(0.1, UI_REFRESH_INTERVAL)
-        INPUT_POLL_INTERVAL = max(0.01, INPUT_POLL_INTERVAL)
+        # 按键触发重绘的最短间隔：按住键自动重复时最多约 20 次/秒
+        INPUT_RENDER_INTERVAL = 0.05
 
         # 预先构造不会变化的表格，避免循环内重复生成
         base_command_table = Table.grid(padding=(0, 1))
@@ -860,102 +938,142 @@ class MaiMaiLauncher:
         base_command_table.add_row("details <PID>", "查看指定PID的进程详情"); base_command_table.add_row("stopall", "终止所有受管进程")
         base_command_table.add_row("q / quit", "退出状态监控")
         base_command_table.add_row("Tab键", "补全指令或PID")
+        command_panel = Panel(base_command_table, title="[bold]可用命令[/bold]", border_style="dim")
+
+        # 进程枚举放到后台线程定时执行，界面线程只读取最近一次发布的结果，
+        # 避免 psutil 查询较慢时卡住按键响应。发布的是 (版本号, 进程表, PID补全候选) 元组
+        stop_collector = threading.Event()
+        wake_collector = threading.Event()
+
+        def _collect_process_data():
+            table = launcher.show_running_processes()
+            pids = sorted(str(pid) for pid in launcher.get_managed_pids())
+            self._latest_process_data = (self._latest_process_data[0] + 1, table, pids)
+
+        def _collector_loop():
+            while True:
+                wake_collector.wait(DATA_REFRESH_INTERVAL)
+                wake_collector.clear()
+                if stop_collector.is_set():
+                    break
+                try:
+                    _collect_process_data()
+                except Exception as e:
+                    logger.error("后台采集进程数据失败", error=str(e))
+
+        # 首次数据同步获取，保证界面打开时即有内容
+        _collect_process_data()
+        collector = threading.Thread(target=_collector_loop, name="process-monitor", daemon=True)
+        collector.start()
+
+        try:
+            should_quit_monitor = False
+            while not should_quit_monitor:
+                command_result = None
+                # 每次处理完一个命令（如查看详情）后，重新创建一个Live实例
+                with Live(auto_refresh=False, screen=True, transient=True) as live:
+                    input_buffer = ""
+                    last_ui_refresh = 0
+                    input_pending = False
+                    # 读取后台线程最近一次发布的进程表和PID补全候选
+                    data_version, process_table, pid_candidates = self._latest_process_data
+
+                    # 布局骨架只构建一次：之后只替换进程表区域和输入面板的内容
+                    input_panel = Panel(Text("> ", no_wrap=True), border_style="cyan", title="输入命令", height=3)
+                    layout = Layout()
+                    layout.split_column(
+                        Layout(command_panel, name="commands"),
+                        Layout(process_table, name="processes"),
+                        Layout(input_panel, name="input"),
+                    )
+                    live.update(layout)
 
-        should_quit_monitor = False
-        while not should_quit_monitor:
-            command_result = None
-            # 每次处理完一个命令（如查看详情）后，重新创建一个Live实例
-            with Live(auto_refresh=False, screen=True, transient=True) as live:
-                input_buffer = ""
-                last_data_refresh = 0
-                last_ui_refresh = 0
-                COMMANDS = ["stop", "restart", "details", "stopall", "quit", "q"]
-                # 初始数据获取
-                process_table = launcher.show_running_processes()
-
-                while True: # Live 渲染循环
-                    now = time.time()
+                    while True: # Live 渲染循环
+                        now = time.time()
                     
-                    # --- 1. 处理输入 (非阻塞) ---
-                    input_changed = False
-                    if msvcrt.kbhit():
+                        # --- 1. 处理输入 (非阻塞) ---
+                        input_changed = False
+                        # 逐个处理缓冲区中的全部按键，粘贴的整段文本在一次循环内完成输入
                         while msvcrt.kbhit():
                             char = msvcrt.getwch()
-                        input_changed = True
-                        
-                        if char == '\r':  # Enter
-                            command_result = self._handle_process_command(input_buffer.strip())
-                            if command_result:
-                                break
-                            input_buffer = ""
-                        elif char == '\t':  # Tab
-                            parts = input_buffer.split(" ", 1)
-                            # 场景1: 补全指令
-                            if len(parts) == 1:
-                                suggestion = next((cmd for cmd in COMMANDS if cmd.startswith(parts[0].lower()) and parts[0]), None)
-                                if suggestion:
-                                    input_buffer = suggestion + " " if suggestion in ["stop", "restart", "details"] else suggestion
-                            # 场景2: 补全PID
-                            elif len(parts) == 2 and parts[0] in ["stop", "restart", "details"]:
-                                pid_prefix = parts[1]
-                                if pid_prefix.isdigit() or pid_prefix == "":
-                                    all_pids = launcher.get_managed_pids()
-                                    matching_pid = next((str(p) for p in all_pids if str(p).startswith(pid_prefix)), None)
-                                    if matching_pid:
-                                        input_buffer = f"{parts[0]} {matching_pid}"
-
-                        elif char == '\x08':  # Backspace
-                            input_buffer = input_buffer[:-1]
-                        elif char not in ('\x00', '\xe0'):  # 忽略功能键
-                            input_buffer += char
+                            input_changed = True
+
+                            if char in ('\x00', '\xe0'):  # 忽略功能键（前缀及随后的扫描码）
+                                if msvcrt.kbhit():
+                                    msvcrt.getwch()
+                            elif char == '\r':  # Enter
+                                command_result = self._handle_process_command(input_buffer.strip())
+                                wake_collector.set()
+                                if command_result:
+                                    break
+                                input_buffer = ""
+                            elif char == '\t':  # Tab
+                                parts = input_buffer.split(" ", 1)
+                                # 场景1: 补全指令
+                                if len(parts) == 1:
+                                    suggestion = _complete_prefix(_MONITOR_COMMANDS, parts[0].lower()) if parts[0] else None
+                                    if suggestion:
+                                        input_buffer = suggestion + " " if suggestion in ["stop", "restart", "details"] else suggestion
+                                # 场景2: 补全PID
+                                elif len(parts) == 2 and parts[0] in ["stop", "restart", "details"]:
+                                    pid_prefix = parts[1]
+                                    if pid_prefix.isdigit() or pid_prefix == "":
+                                        matching_pid = _complete_prefix(pid_candidates, pid_prefix)
+                                        if matching_pid:
+                                            input_buffer = f"{parts[0]} {matching_pid}"
+
+                            elif char == '\x08':  # Backspace
+                                input_buffer = input_buffer[:-1]
+                            else:
+                                input_buffer += char
                     
-                    if command_result:
-                        break
+                        if command_result:
+                            break
 
-                    # --- 2. 刷新进程数据 (定时) ---
-                    data_changed = False
-                    if now - last_data_refresh > DATA_REFRESH_INTERVAL:
-                        last_data_refresh = now
-                        process_table = launcher.show_running_processes()
-                        data_changed = True
-
-                    # --- 3. 刷新UI (按需) ---
-                    if input_changed or data_changed or (now - last_ui_refresh > UI_REFRESH_INTERVAL):
-                        last_ui_refresh = now
-
-                        suggestion = ""
-                        parts = input_buffer.split(" ", 1)
-                        if len(parts) == 1 and parts[0]:
-                             suggestion = next((cmd for cmd in COMMANDS if cmd.startswith(parts[0].lower()) and cmd != parts[0].lower()), "")
-
-                        input_text = Text(f"> {input_buffer}", no_wrap=True)
-                        if suggestion:
-                            input_text.append(suggestion[len(input_buffer):], style="italic dim")
+                        # --- 2. 取用后台线程发布的新数据 ---
+                        data_changed = False
+                        latest_data = self._latest_process_data
+                        if latest_data[0] != data_version:
+                            data_version, process_table, pid_candidates = latest_data
+                            layout["processes"].update(process_table)
+                            data_changed = True
+
+                        # --- 3. 刷新UI (按需，按键引起的重绘做节流) ---
+                        input_pending = input_pending or input_changed
+                        input_due = input_pending and now - last_ui_refresh >= INPUT_RENDER_INTERVAL
+                        if input_due or data_changed or (now - last_ui_refresh > UI_REFRESH_INTERVAL):
+                            last_ui_refresh = now
+                            input_pending = False
+
+                            suggestion = ""
+                            parts = input_buffer.split(" ", 1)
+                            if len(parts) == 1 and parts[0]:
+                                 suggestion = _complete_prefix(_MONITOR_COMMANDS, parts[0].lower(), allow_exact=False) or ""
+
+                            input_text = Text(f"> {input_buffer}", no_wrap=True)
+                            if suggestion:
+                                input_text.append(suggestion[len(input_buffer):], style="italic dim")
                         
-                        if int(now * 2) % 2 == 0:
-                           input_text.append("_") # ▋
-
-                        layout = Layout()
-                        layout.split_column(
-                            Panel(base_command_table, title="[bold]可用命令[/bold]", border_style="dim"),
-                            process_table,
-                            Panel(input_text, border_style="cyan", title="输入命令", height=3)
-                        )
-                        live.update(layout)
-                        live.refresh()
-
-                    # --- 4. 自适应休眠，减少空转 ---
-                    next_data_due = last_data_refresh + DATA_REFRESH_INTERVAL
-                    next_ui_due = last_ui_refresh + UI_REFRESH_INTERVAL
-                    next_tick = min(next_data_due, next_ui_due)
-                    sleep_for = max(0.0, min(INPUT_POLL_INTERVAL, next_tick - time.time()))
-                    time.sleep(sleep_for)
-
-            # --- 4. Live循环结束后，处理命令结果 ---
-            if isinstance(command_result, dict):
-                self._show_process_details(command_result)
-            elif command_result == "quit":
-                should_quit_monitor = True
+                            if int(now * 2) % 2 == 0:
+                               input_text.append("_") # ▋
+
+                            input_panel.renderable = input_text
+                            live.refresh()
+
+                        # --- 4. 等待按键或下一次定时刷新，按键到达时立即唤醒 ---
+                        # 有尚未显示的输入时，在节流窗口结束时补绘
+                        next_ui_due = last_ui_refresh + (INPUT_RENDER_INTERVAL if input_pending else UI_REFRESH_INTERVAL)
+                        wait_for_console_input(next_ui_due - time.time())
+
+                # --- 4. Live循环结束后，处理命令结果 ---
+                if isinstance(command_result, dict):
+                    self._show_process_details(command_result)
+                elif command_result == "quit":
+                    should_quit_monitor = True
+        finally:
+            stop_collector.set()
+            wake_collector.set()
+            collector.join(timeout=1.0)
 
         ui.print_info("\n已退出进程状态监控。")
         logger.info("用户退出进程状态监控")
@@ -973,6 +1091,24 @@ class MaiMaiLauncher:
         ui.console.print(Panel(Text(detail_text.strip()), title=f"进程 {pid} 详细信息", border_style="yellow", subtitle="按任意键返回监控..."))
         ui.pause("") # 传入空字符串以避免默认提示
 
+    # 需要PID参数的命令：命令 -> (launcher方法名, 成功提示, 失败提示)；成功提示为None时直接返回方法结果
+    _PID_COMMANDS = {
+        "stop": ("stop_process", "已发送停止命令到 PID {pid}", "无法停止 PID {pid}，可能不是受管进程。"),
+        "restart": ("restart_process", "成功重启进程 (原PID: {pid})", "无法重启 PID {pid}"),
+        "details": ("get_process_details", None, "无法获取 PID {pid} 的详细信息。"),
+    }
+
+    def _run_with_pid(self, cmd: str, args: list) -> Any:
+        """校验PID参数并调用对应的launcher方法。"""
+        from src.modules.launcher import launcher
+        if not args or not args[0].isdigit(): return ("message", f"用法: {cmd} <PID>", "yellow")
+        pid = int(args[0])
+        method_name, success_text, failure_text = self._PID_COMMANDS[cmd]
+        result = getattr(launcher, method_name)(pid)
+        if not result: return ("message", failure_text.format(pid=pid), "red")
+        if success_text is None: return result
+        return ("message", success_text.format(pid=pid), "green")
+
     def _handle_process_command(self, command: str) -> Any:
         """解析并执行进程管理命令，返回结果用于主循环处理。"""
         parts = command.strip().lower().split()
@@ -980,29 +1116,14 @@ class MaiMaiLauncher:
         cmd, args = parts[0], parts[1:]
 
         if cmd in ("q", "quit"): return "quit"
-        
-        if cmd == "stop":
-            if not args or not args[0].isdigit(): return ("message", "用法: stop <PID>", "yellow")
-            pid = int(args[0])
-            if launcher.stop_process(pid): return ("message", f"已发送停止命令到 PID {pid}", "green")
-            return ("message", f"无法停止 PID {pid}，可能不是受管进程。", "red")
-
-        elif cmd == "restart":
-            if not args or not args[0].isdigit(): return ("message", "用法: restart <PID>", "yellow")
-            pid = int(args[0])
-            if launcher.restart_process(pid): return ("message", f"成功重启进程 (原PID: {pid})", "green")
-            return ("message", f"无法重启 PID {pid}", "red")
-
-        elif cmd == "stopall":
+
+        if cmd in self._PID_COMMANDS:
+            return self._run_with_pid(cmd, args)
+
+        if cmd == "stopall":
+            from src.modules.launcher import launcher
             launcher.stop_all_processes()
             return ("message", "所有受管进程已停止。", "green")
-
-        elif cmd == "details":
-            if not args or not args[0].isdigit(): return ("message", "用法: details <PID>", "yellow")
-            pid = int(args[0])
-            details = launcher.get_process_details(pid)
-            if details: return details
-            return ("message", f"无法获取 PID {pid} 的详细信息。", "red")
         
         return ("message", f"未知命令: '{cmd}'", "red")
 
@@ -1043,8 +1164,10 @@ class MaiMaiLauncher:
 
     def _handle_exit_request(self) -> bool:
         """统一处理退出逻辑，返回是否完成退出。"""
+        from src.modules.launcher import launcher
+        # 每次退出尝试只枚举一次托管进程
         has_child_processes = len(launcher.get_managed_pids()) > 1
-        action = p_config_manager.get("on_exit.process_action", "ask")
+        action = self._exit_action
 
         do_exit = False
         if not has_child_processes:
@@ -1087,6 +1210,7 @@ class MaiMaiLauncher:
 
     def _has_active_instance(self) -> bool:
         """检查是否有活跃的实例"""
+        from src.modules.launcher import launcher
         try:
             # 检查是否有正在运行的进程
             managed_pids = launcher.get_managed_pids()
@@ -1119,9 +1243,8 @@ class MaiMaiLauncher:
                 logger.debug("用户选择", choice=choice)
                 
                 if choice == "Q":
-                    if self._try_minimize_to_tray():
-                        continue
-                    self._handle_exit_request()
+                    if not self._try_minimize_to_tray():
+                        self._handle_exit_request()
                 elif choice == "A":
                     if has_active:
                         # 有活跃实例时，显示实例多开菜单
@@ -1129,37 +1252,13 @@ class MaiMaiLauncher:
                     else:
                         # 没有活跃实例时，运行正常实例
                         self.handle_launch_mai()
-                elif choice == "B":
-                    self.handle_config_menu()
-                elif choice == "C":
-                    self.handle_knowledge_menu()
-                elif choice == "D":
-                    self.handle_migration()
-                elif choice == "E":
-                    # 插件管理
-                    ui.show_plugin_menu()
-                elif choice == "F":
-                    self.handle_deployment_menu()
-                elif choice == "G":
-                    self.handle_process_status()
-                elif choice == "H":
-                    self.handle_misc_menu()
-                elif choice == "R":
-                    # 直接在主菜单刷新每日一言
-                    old_quote = ui.menus.daily_quote
-                    new_quote = ui.menus.refresh_daily_quote()
-                    
-                    if old_quote != new_quote:
-                        ui.print_success("每日一言已刷新！")
-                    else:
-                        ui.print_info("每日一言未发生变化")
-                    
-                    # 短暂暂停后重新显示主菜单
-                    time.sleep(1)
-                    continue
                 else:
-                    ui.print_error("无效选项")
-                    ui.countdown(1)
+                    handler = self._menu_handlers.get(choice)
+                    if handler:
+                        handler()
+                    else:
+                        ui.print_error("无效选项")
+                        ui.countdown(1)
                     
         except KeyboardInterrupt:
             ui.print_info("\n程序被用户中断")
@@ -1171,9 +1270,23 @@ class MaiMaiLauncher:
             self.tray_manager.stop()
             # 除非明确指示，否则停止所有进程
             if not self._keep_processes_on_exit:
+                from src.modules.launcher import launcher
                 launcher.stop_all_processes()
             logger.info("启动器程序结束")
     
+    def _refresh_quote_in_main_menu(self):
+        """直接在主菜单刷新每日一言"""
+        old_quote = ui.menus.daily_quote
+        new_quote = ui.menus.refresh_daily_quote()
+        
+        if old_quote != new_quote:
+            ui.print_success("每日一言已刷新！")
+        else:
+            ui.print_info("每日一言未发生变化")
+        
+        # 短暂暂停后重新显示主菜单
+        time.sleep(1)
+    
     def handle_multi_instance_menu(self):
         """处理实例多开菜单"""
         try:
@@ -6,19 +6,15 @@ def get_venv_exe_path():
         base_dir = Path(sys.executable).parent
     else:
         base_dir = Path(__file__).parent
-    candidate = base_dir / 'create_venv.exe'
-    if candidate.exists():
-        return candidate
-    # 2. 当前工作目录
-    candidate = Path.cwd() / 'create_venv.exe'
-    if candidate.exists():
-        return candidate
-    # 3. 项目根目录（假设 run.py 在根目录或 src 下）
-    candidate = base_dir.parent / 'create_venv.exe'
-    if candidate.exists():
-        return candidate
+    candidates = (
+        base_dir / 'create_venv.exe',
+        # 2. 当前工作目录
+        Path.cwd() / 'create_venv.exe',
+        # 3. 项目根目录（假设 run.py 在根目录或 src 下）
+        base_dir.parent / 'create_venv.exe',
+    )
     # 4. 兜底：直接返回 base_dir / 'create_venv.exe'
-    return base_dir / 'create_venv.exe'
+    return next((candidate for candidate in candidates if candidate.is_file()), candidates[0])
 import os
 import sys
 import subprocess
@@ -34,11 +30,11 @@ PYTHON_DOWNLOAD_URL = 'https://www.python.org/ftp/python/3.12.8/python-3.12.8-am
 PRIMARY_PIP_INDEX = os.environ.get('PIP_PRIMARY_INDEX', 'https://pypi.tuna.tsinghua.edu.cn/simple')
 FALLBACK_PIP_INDEX = os.environ.get('PIP_FALLBACK_INDEX', 'https://pypi.org/simple')
 
-def find_existing_venv():
-    cwd = Path.cwd()
+def find_existing_venv(cwd=None):
+    cwd = cwd or Path.cwd()
     for name in VENV_DIRS:
         venv_path = cwd / name
-        if (venv_path / 'Scripts' / 'python.exe').exists():
+        if (venv_path / 'Scripts' / 'python.exe').is_file():
             return venv_path
     return None
 
@@ -63,54 +59,6 @@ def run_in_venv(python_exe, args):
         sys.exit(result.returncode)
 
 def main():
-    def find_installed_python():
-        # 检查注册表，返回可用python.exe路径和版本
-        for hive in [winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER]:
-            try:
-                with winreg.OpenKey(hive, r"SOFTWARE\Python\PythonCore") as pycore:
-                    for i in range(0, winreg.QueryInfoKey(pycore)[0]):
-                        try:
-                            version = winreg.EnumKey(pycore, i)
-                            version_tuple = tuple(map(int, version.split('.')))
-                            
-                            # 检查Python版本是否 >= 3.14，如果是则标记为不可用
-                            if version_tuple >= (3, 14):
-                                print(f"[WARNING] 检测到Python版本 {version} >= 3.14，当前版本不可用")
-                                continue
-                            
-                            # 检查版本是否 >= 3.8 且 < 3.14
-                            if version_tuple >= (3, 8) and version_tuple < (3, 14):
-                                with winreg.OpenKey(pycore, version + r"\InstallPath") as ipath:
-                                    path, _ = winreg.QueryValueEx(ipath, "")
-                                    exe = Path(path) / 'python.exe'
-                                    if exe.exists():
-                                        return str(exe), version
-                        except Exception:
-                            continue
-            except Exception:
-                continue
-        return None, None
-
-    def prompt_install_python():
-        print("[ERROR] 未检测到可用 Python 环境 (>=3.8 且 <3.14)。")
-        choice = input("是否安装 Python 3.12.8？(Y/N): ").strip().lower()
-        if choice == 'y':
-            if PYTHON_INSTALLER.exists():
-                print(f"[INFO] 正在运行安装包: {PYTHON_INSTALLER}")
-                print("[INFO] 安装过程将阻塞等待完成，请耐心等待...")
-                # 使用阻塞方式运行安装程序
-                result = subprocess.run([str(PYTHON_INSTALLER)], shell=True)
-                if result.returncode == 0:
-                    print("[INFO] Python安装完成")
-                else:
-                    print(f"[ERROR] Python安装失败，返回码: {result.returncode}")
-            else:
-                print(f"[ERROR] 未找到 Python 安装包！您可以前往以下网址下载安装包：\n{PYTHON_DOWNLOAD_URL}")
-            input("请安装完成后按回车键继续...")
-        else:
-            print("[INFO] 用户取消安装。程序退出。")
-            sys.exit(1)
-
     venv_path = find_existing_venv()
     if venv_path is None:
             print("[INFO] 未检测到可用虚拟环境，强制调用 create_venv.exe 创建虚拟环境...")
@@ -163,27 +111,40 @@ def main():
     run_in_venv(python_exe, [MAIN_SCRIPT])
 
 # 注册表检测和安装引导函数移到主作用域
+def _parse_version(version):
+    try:
+        return tuple(map(int, version.split('.')))
+    except ValueError:
+        return None
+
 def find_installed_python():
+    # 检查注册表，返回可用python.exe路径和版本；按版本从高到低检查，找到即返回
     for hive in [winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER]:
         try:
             with winreg.OpenKey(hive, r"SOFTWARE\Python\PythonCore") as pycore:
+                versions = []
                 for i in range(0, winreg.QueryInfoKey(pycore)[0]):
+                    version = winreg.EnumKey(pycore, i)
+                    version_tuple = _parse_version(version)
+                    if version_tuple is not None:
+                        versions.append((version_tuple, version))
+                versions.sort(reverse=True)
+
+                for version_tuple, version in versions:
+                    # 检查Python版本是否 >= 3.14，如果是则标记为不可用
+                    if version_tuple >= (3, 14):
+                        print(f"[WARNING] 检测到Python版本 {version} >= 3.14，当前版本不可用")
+                        continue
+                    
+                    # 检查版本是否 >= 3.8 且 < 3.14；更低的版本无需再检查
+                    if version_tuple < (3, 8):
+                        break
                     try:
-                        version = winreg.EnumKey(pycore, i)
-                        version_tuple = tuple(map(int, version.split('.')))
-                        
-                        # 检查Python版本是否 >= 3.14，如果是则标记为不可用
-                        if version_tuple >= (3, 14):
-                            print(f"[WARNING] 检测到Python版本 {version} >= 3.14，当前版本不可用")
-                            continue
-                        
-                        # 检查版本是否 >= 3.8 且 < 3.14
-                        if version_tuple >= (3, 8) and version_tuple < (3, 14):
-                            with winreg.OpenKey(pycore, version + r"\InstallPath") as ipath:
-                                path, _ = winreg.QueryValueEx(ipath, "")
-                                exe = Path(path) / 'python.exe'
-                                if exe.exists():
-                                    return str(exe), version
+                        with winreg.OpenKey(pycore, version + r"\InstallPath") as ipath:
+                            path, _ = winreg.QueryValueEx(ipath, "")
+                            exe = Path(path) / 'python.exe'
+                            if exe.exists():
+                                return str(exe), version
                     except Exception:
                         continue
         except Exception:
@@ -198,7 +159,7 @@ def prompt_install_python():
             print(f"[INFO] 正在运行安装包: {PYTHON_INSTALLER}")
             print("[INFO] 安装过程将阻塞等待完成，请耐心等待...")
             # 使用阻塞方式运行安装程序
-            result = subprocess.run([str(PYTHON_INSTALLER)], shell=True)
+            result = subprocess.run([str(PYTHON_INSTALLER)])
             if result.returncode == 0:
                 print("[INFO] Python安装完成")
             else:
@@ -4,24 +4,23 @@ import subprocess
 import threading
 import time
 import webbrowser
-import json
-import os
-import subprocess
-import ctypes
+import shutil
+import socket
 import sys
 
 
 # 读取 .config_UI.json 中的端口号
-json_path = os.path.join(os.path.dirname(__file__), 'src', 'config_UI', '.config_UI.json')
-if not os.path.exists(json_path):
-    port = 8000
-else:
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-        port = data.get('ui_settings', {}).get('port', 8000)
+def _read_port(default=8000):
+    json_path = os.path.join(os.path.dirname(__file__), 'src', 'config_UI', '.config_UI.json')
+    try:
+        with open(json_path, 'rb') as f:
+            data = json.loads(f.read())
+    except FileNotFoundError:
+        return default
+    return data.get('ui_settings', {}).get('port', default)
 
 # 启动后端服务的函数
-def start_backend():
+def start_backend(port):
     # 确定虚拟环境中的uvicorn路径
     venv_path = os.path.join(os.path.dirname(__file__), 'venv')
     if sys.platform == "win32":
@@ -31,27 +30,44 @@ def start_backend():
 
     if os.path.exists(uvicorn_executable):
         # 使用虚拟环境中的uvicorn
-        cmd = f'"{uvicorn_executable}" src.config_UI.config_UI:app --reload --port {port}'
-        print(f"[INFO] 在虚拟环境中启动: {cmd}")
+        cmd = [uvicorn_executable]
+        print(f"[INFO] 在虚拟环境中启动: {uvicorn_executable}")
     else:
         # 回退到全局uvicorn，并发出警告
         print("[WARNING] 未找到项目虚拟环境中的uvicorn，将尝试使用全局uvicorn。")
         print("[WARNING] 如果后端闪退，请确保已在全局环境中安装了 'uvicorn' 和 'fastapi'。")
-        cmd = f"uvicorn src.config_UI.config_UI:app --reload --port {port}"
-        print(f"[INFO] 启动命令: {cmd}")
-        
-    subprocess.run(cmd, shell=True)
+        global_uvicorn = shutil.which("uvicorn")
+        cmd = [global_uvicorn] if global_uvicorn else [sys.executable, "-m", "uvicorn"]
+    cmd += ["src.config_UI.config_UI:app", "--reload", "--port", str(port)]
+    print(f"[INFO] 启动命令: {subprocess.list2cmdline(cmd)}")
+
+    # 直接启动uvicorn进程（不经过shell），参数以列表传递，路径含空格也无需额外引号
+    return subprocess.Popen(cmd)
 
 # 启动前端页面的函数
-def open_frontend():
-    # 等待后端启动
-    time.sleep(2)
+def _wait_port(port, timeout=10):
+    # 轮询端口直到后端开始接受连接，超时返回 False
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.settimeout(0.1)
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                return True
+        time.sleep(0.05)
+    return False
+
+def open_frontend(port):
+    # 等待后端启动（端口可连接后立即打开，而不是固定等待）
+    if not _wait_port(port):
+        print("[WARNING] 等待后端启动超时，仍尝试打开前端页面。")
     url = f"http://127.0.0.1:{port}/src/config_UI/config_UI.html"
     print(f"[INFO] 打开前端页面: {url}")
     webbrowser.open(url)
 
 if __name__ == "__main__":
-    t = threading.Thread(target=open_frontend)
+    port = _read_port()
+    t = threading.Thread(target=open_frontend, args=(port,))
     t.daemon = True
     t.start()
-    start_backend()
+    backend = start_backend(port)
+    backend.wait()
@@ -1,24 +1,53 @@
+import os
+import sys
+import copy
+import functools
+import logging
+import asyncio
+import contextlib
+import threading
+import time
+
+# 添加项目根目录到路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
 import tomli
+import tomli_w
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi import Request
 from fastapi.staticfiles import StaticFiles
-import os
-import json
-import sys
+from starlette.concurrency import run_in_threadpool
 
-# 添加项目根目录到路径
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from src.core.fileio import atomic_write, drop_none
+
+logger = logging.getLogger(__name__)
 
 try:
+    from src.core.logging import setup_logging
     from src.utils.proxy_manager import proxy_manager
     PROXY_AVAILABLE = True
 except ImportError:
     PROXY_AVAILABLE = False
     proxy_manager = None
 
-app = FastAPI()
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    # 启动时同步 UI 配置，同时填充两个文件的解析缓存；顺带初始化代理管理器，首个请求无需冷启动
+    sync_ui_json_with_toml()
+    if PROXY_AVAILABLE:
+        # 代理管理器使用启动器的结构化日志，需要由本服务自行初始化
+        setup_logging()
+        try:
+            proxy_manager.get_proxy_info()
+        except Exception:
+            pass
+    yield
+    flush_ui_settings_on_shutdown()
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -32,56 +61,136 @@ JSON_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '.config_UI.
 
 app.mount("/src/config_UI", StaticFiles(directory=os.path.dirname(__file__)), name="static")
 
+# 解析结果缓存：文件 (修改时间, 大小) 未变化时直接复用上次的解析结果，避免每个请求都重新解析
+_config_cache = {"stamp": None, "data": None}
+# names 为实例名索引，随 data 一起在文件变化或写入时重建
+_ui_cache = {"stamp": None, "data": None, "names": frozenset()}
+
+# 写操作在线程池中并发执行，"读取-修改-写回" 需要互斥，避免相互覆盖
+_write_lock = threading.Lock()
+
+def _serialized(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _write_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+def _file_stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+def _update_cache(cache, path, data):
+    # 写入后同步缓存，后续读取无需重新解析刚写入的文件
+    cache["data"] = copy.deepcopy(data)
+    cache["stamp"] = _file_stamp(path)
+
 def load_config():
-    with open(CONFIG_PATH, "rb") as f:
-        return tomli.load(f)
+    stamp = _file_stamp(CONFIG_PATH)
+    if _config_cache["stamp"] != stamp:
+        with open(CONFIG_PATH, "rb") as f:
+            _config_cache["data"] = tomli.load(f)
+        _config_cache["stamp"] = stamp
+    # 调用方会直接修改返回的字典，返回副本以免污染缓存
+    return copy.deepcopy(_config_cache["data"])
 
 def save_config(data):
-    # 这里只做示例，实际应使用toml库写回
-    import toml
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        toml.dump(data, f)
+    atomic_write(CONFIG_PATH, tomli_w.dumps(drop_none(data)).encode("utf-8"))
+    _update_cache(_config_cache, CONFIG_PATH, data)
 
-def load_ui_json():
+def _index_ui_names(data):
+    _ui_cache["names"] = frozenset(i["name"] for i in data.get("instances", []))
+
+def _refresh_ui_cache():
+    # 返回 False 表示 json 文件不存在
     if not os.path.exists(JSON_PATH):
+        return False
+    stamp = _file_stamp(JSON_PATH)
+    if _ui_cache["stamp"] != stamp:
+        with open(JSON_PATH, "rb") as f:
+            _ui_cache["data"] = orjson.loads(f.read())
+        _index_ui_names(_ui_cache["data"])
+        _ui_cache["stamp"] = stamp
+    return True
+
+def load_ui_json():
+    if not _refresh_ui_cache():
         return {"instances": [], "ui_settings": {}}
-    with open(JSON_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return copy.deepcopy(_ui_cache["data"])
+
+def ui_instance_names():
+    # json 中已有的实例名集合，直接使用缓存的索引，无需复制整个 json
+    if not _refresh_ui_cache():
+        return frozenset()
+    return _ui_cache["names"]
 
 def save_ui_json(data):
-    with open(JSON_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    atomic_write(JSON_PATH, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    _update_cache(_ui_cache, JSON_PATH, data)
+    _index_ui_names(data)
 
 def sync_ui_json_with_toml():
     config = load_config()
     ui_json = load_ui_json()
-    toml_names = set(config.get("configurations", {}).keys())
+    toml_names = config.get("configurations", {}).keys()
     # 只保留 json 中 name 在 toml 里的实例，且只保留指定字段
-    new_instances = []
-    for i in ui_json["instances"]:
-        if i["name"] in toml_names:
-            # 只保留 name/absolute_serial_number/serial_number/nickname_path
-            new_instances.append({
-                "name": i.get("name"),
-                "absolute_serial_number": i.get("absolute_serial_number"),
-                "serial_number": i.get("serial_number"),
-                "nickname_path": i.get("nickname_path")
-            })
-    ui_json["instances"] = new_instances
+    # 只保留 name/absolute_serial_number/serial_number/nickname_path
+    ui_json["instances"] = [
+        {
+            "name": i["name"],
+            "absolute_serial_number": i.get("absolute_serial_number"),
+            "serial_number": i.get("serial_number"),
+            "nickname_path": i.get("nickname_path")
+        }
+        for i in ui_json["instances"]
+        if i["name"] in toml_names
+    ]
     save_ui_json(ui_json)
 
-@app.get("/api/configs")
-def get_configs():
+def _etag(*paths):
+    # 弱 ETag：由各文件的修改时间和大小组成，文件不存在时记为 0-0
+    parts = []
+    for path in paths:
+        try:
+            mtime_ns, size = _file_stamp(path)
+        except OSError:
+            mtime_ns, size = 0, 0
+        parts.append(f"{mtime_ns:x}-{size:x}")
+    return f'W/"{"-".join(parts)}"'
+
+def _not_modified(request: Request, etag):
+    # 客户端缓存仍然有效时返回 304，跳过解析和 JSON 编码
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+# 处理函数直接返回响应对象，跳过 FastAPI 对返回值的 jsonable_encoder 处理
+# 固定的成功响应体只编码一次；响应对象每次新建，因为中间件会修改其响应头
+_SUCCESS_BODY = orjson.dumps({"success": True})
+
+def _success():
+    return Response(_SUCCESS_BODY, media_type="application/json")
+
+@app.get("/api/configs", response_model=None)
+def get_configs(request: Request):
+    etag = _etag(CONFIG_PATH)
+    cached = _not_modified(request, etag)
+    if cached:
+        return cached
     config = load_config()
     configs = config.get("configurations", {})
-    return JSONResponse(configs)
+    return ORJSONResponse(configs, headers={"ETag": etag})
 
-@app.post("/api/configs/batch_delete")
+@app.post("/api/configs/batch_delete", response_model=None)
 async def batch_delete_configs(request: Request):
+    data = await request.json()
+    # 文件读写放到线程池中执行，避免阻塞事件循环
+    return await run_in_threadpool(_batch_delete_configs, data.get("names", []))
+
+@_serialized
+def _batch_delete_configs(names):
     config = load_config()
     ui_json = load_ui_json()
-    data = await request.json()
-    names = data.get("names", [])
     
     deleted_count = 0
     for name in names:
@@ -93,15 +202,20 @@ async def batch_delete_configs(request: Request):
         save_config(config)
         # Sync UI JSON
         # Filter out deleted instances
-        ui_json["instances"] = [i for i in ui_json["instances"] if i["name"] not in names]
+        deleted_names = set(names)
+        ui_json["instances"] = [i for i in ui_json["instances"] if i["name"] not in deleted_names]
         save_ui_json(ui_json)
         
-    return {"success": True, "deleted": deleted_count}
+    return ORJSONResponse({"success": True, "deleted": deleted_count})
 
-@app.post("/api/configs/{name}")
+@app.post("/api/configs/{name}", response_model=None)
 async def update_config(name: str, request: Request):
-    config = load_config()
     data = await request.json()
+    return await run_in_threadpool(_update_config, name, data)
+
+@_serialized
+def _update_config(name, data):
+    config = load_config()
     if name in config["configurations"]:
         for k, v in data.items():
             if k == "absolute_serial_number":
@@ -109,35 +223,56 @@ async def update_config(name: str, request: Request):
             else:
                 config["configurations"][name][k] = v
         save_config(config)
-        return {"success": True}
-    return {"success": False, "msg": "配置不存在"}
+        return _success()
+    return ORJSONResponse({"success": False, "msg": "配置不存在"})
 
-import os
+# 新建配置时需要校验的路径字段
+PATH_FIELDS = ("mai_path", "mofox_path", "adapter_path", "napcat_path", "venv_path", "mongodb_path", "webui_path")
+
+# 路径存在性检查结果缓存 5 秒：界面批量填充配置时各请求会反复检查相同的安装路径
+PATH_CHECK_TTL = 5
+
+@functools.lru_cache(maxsize=256)
+def _exists_cached(path, time_bucket):
+    # time_bucket 每 PATH_CHECK_TTL 秒变化一次，旧结果随之失效
+    return os.path.exists(path)
 
 def is_valid_path(path):
-    return not path or os.path.exists(path)
+    return not path or _exists_cached(path, int(time.monotonic() // PATH_CHECK_TTL))
 
-@app.post("/api/configs")
+def find_invalid_path_field(config):
+    # 相同路径只检查一次，返回第一个路径无效的字段名
+    paths = {k: config.get(k, "") for k in PATH_FIELDS}
+    invalid = {p for p in set(paths.values()) if not is_valid_path(p)}
+    if invalid:
+        for k, p in paths.items():
+            if p in invalid:
+                return k
+    return None
+
+@app.post("/api/configs", response_model=None)
 async def create_config(request: Request):
+    data = await request.json()
+    return await run_in_threadpool(_create_config, data)
+
+@_serialized
+def _create_config(data):
     config = load_config()
     ui_json = load_ui_json()
-    data = await request.json()
     name = data.get("name")
     new_config = data.get("config", {})
     # 检查名称和用户序列号唯一性
     for n, v in config["configurations"].items():
         if n == name or v.get("serial_number") == new_config.get("serial_number"):
-            return {"success": False, "msg": "配置集名称或用户序列号已存在"}
+            return ORJSONResponse({"success": False, "msg": "配置集名称或用户序列号已存在"})
     # 自动分配绝对序列号
     used_nums = {int(v.get("absolute_serial_number", 0)) for v in config["configurations"].values()}
-    abs_num = len(used_nums) + 1
-    while abs_num in used_nums:
-        abs_num += 1
+    abs_num = max(used_nums, default=0) + 1
     new_config["absolute_serial_number"] = abs_num
     # 路径校验
-    for k in ["mai_path", "mofox_path", "adapter_path", "napcat_path", "venv_path", "mongodb_path", "webui_path"]:
-        if not is_valid_path(new_config.get(k, "")):
-            return {"success": False, "msg": f"路径无效: {k}"}
+    invalid_field = find_invalid_path_field(new_config)
+    if invalid_field:
+        return ORJSONResponse({"success": False, "msg": f"路径无效: {invalid_field}"})
     config["configurations"][name] = new_config
     save_config(config)
     # 只在新建时写入 json，且只保留指定字段
@@ -148,97 +283,172 @@ async def create_config(request: Request):
         "nickname_path": new_config.get("nickname_path")
     })
     save_ui_json(ui_json)
-    return {"success": True}
+    return _success()
 
-@app.get("/api/configs/{name}/uiinfo")
-def get_uiinfo(name: str):
+@app.get("/api/configs/{name}/uiinfo", response_model=None)
+def get_uiinfo(name: str, request: Request):
     # 只有 json 和 toml 同时存在的配置集才可编辑安装项
+    etag = _etag(CONFIG_PATH, JSON_PATH)
+    cached = _not_modified(request, etag)
+    if cached:
+        return cached
     config = load_config()
-    ui_json = load_ui_json()
-    toml_names = set(config.get("configurations", {}).keys())
-    for inst in ui_json["instances"]:
-        if inst["name"] == name and name in toml_names:
-            return {"editable_install_options": True}
-    return {"editable_install_options": False}
-
-@app.on_event("startup")
-def startup_event():
-    sync_ui_json_with_toml()
+    editable = name in config.get("configurations", {}) and name in ui_instance_names()
+    return ORJSONResponse({"editable_install_options": editable}, headers={"ETag": etag})
 
-@app.delete("/api/configs/{name}")
+@app.delete("/api/configs/{name}", response_model=None)
+@_serialized
 def delete_config(name: str):
+    # 同步处理函数由 FastAPI 在线程池中执行，这里只需与其它写操作互斥
     config = load_config()
     ui_json = load_ui_json()
     if name not in config["configurations"]:
-        return {"success": False, "msg": "配置集不存在"}
+        return ORJSONResponse({"success": False, "msg": "配置集不存在"})
     del config["configurations"][name]
     save_config(config)
     # 同步删除 UI 配置
     ui_json["instances"] = [i for i in ui_json["instances"] if i["name"] != name]
     save_ui_json(ui_json)
-    return {"success": True}
+    return _success()
+
+# ui_settings 延迟写盘：短时间内的连续修改先合并在内存中，最后一次修改后统一写入一次
+UI_SETTINGS_FLUSH_DELAY = 0.25
+_pending_ui_settings = {}
+# 已取出、正在写盘的设置；写盘完成前读取接口仍需合并这部分，否则会返回旧值
+_inflight_ui_settings = {}
+# 保护上面两个字典：POST 在事件循环线程修改，GET 和写盘在线程池中读取
+_ui_settings_lock = threading.Lock()
+_last_ui_settings_change = 0.0
+_flush_task = None
+
+def _write_ui_settings(settings):
+    # 合并新设置到原有 ui_settings
+    with _write_lock:
+        data = load_ui_json()
+        ui_settings = data.get("ui_settings", {})
+        ui_settings.update(settings)
+        data["ui_settings"] = ui_settings
+        save_ui_json(data)
 
-@app.get("/api/ui_settings")
-def get_ui_settings():
+def _take_pending_ui_settings():
+    global _pending_ui_settings
+    with _ui_settings_lock:
+        pending, _pending_ui_settings = _pending_ui_settings, {}
+        _inflight_ui_settings.update(pending)
+    return pending
+
+def _finish_ui_settings_write(settings, ok):
+    global _pending_ui_settings
+    with _ui_settings_lock:
+        _inflight_ui_settings.clear()
+        if not ok:
+            # 写盘失败时放回待写入队列（之后的新修改优先），下次修改时重试
+            _pending_ui_settings = {**settings, **_pending_ui_settings}
+
+def _flush_ui_settings(settings):
+    try:
+        _write_ui_settings(settings)
+    except Exception:
+        _finish_ui_settings_write(settings, False)
+        logger.exception("写入 ui_settings 失败")
+        return False
+    _finish_ui_settings_write(settings, True)
+    return True
+
+def _unsaved_ui_settings():
+    with _ui_settings_lock:
+        if not _inflight_ui_settings and not _pending_ui_settings:
+            return None
+        return {**_inflight_ui_settings, **_pending_ui_settings}
+
+async def _delayed_flush(delay):
+    loop = asyncio.get_running_loop()
+    # 写盘期间又有新修改时继续下一轮，直到没有待写入的设置
+    while _pending_ui_settings:
+        # 距最后一次修改满 delay 秒才写盘，期间的新修改只会推迟写盘时间
+        remaining = _last_ui_settings_change + delay - loop.time()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+            continue
+        if not await run_in_threadpool(_flush_ui_settings, _take_pending_ui_settings()):
+            break
+
+def flush_ui_settings_on_shutdown():
+    pending = _take_pending_ui_settings()
+    if pending:
+        _flush_ui_settings(pending)
+
+@app.get("/api/ui_settings", response_model=None)
+def get_ui_settings(request: Request):
+    unsaved = _unsaved_ui_settings()
+    if unsaved is not None:
+        # 还有未写盘完成的修改时，文件的 ETag 不能代表当前内容
+        ui_settings = load_ui_json().get("ui_settings", {})
+        ui_settings.update(unsaved)
+        return ORJSONResponse(ui_settings)
+    etag = _etag(JSON_PATH)
+    cached = _not_modified(request, etag)
+    if cached:
+        return cached
     data = load_ui_json()
-    return data.get("ui_settings", {})
+    return ORJSONResponse(data.get("ui_settings", {}), headers={"ETag": etag})
 
-@app.post("/api/ui_settings")
+@app.post("/api/ui_settings", response_model=None)
 async def set_ui_settings(request: Request):
-    data = load_ui_json()
+    global _flush_task, _last_ui_settings_change
     settings = await request.json()
-    # 合并新设置到原有 ui_settings
-    ui_settings = data.get("ui_settings", {})
-    ui_settings.update(settings)
-    data["ui_settings"] = ui_settings
-    save_ui_json(data)
-    return {"success": True}
+    with _ui_settings_lock:
+        _pending_ui_settings.update(settings)
+    _last_ui_settings_change = asyncio.get_running_loop().time()
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_delayed_flush(UI_SETTINGS_FLUSH_DELAY))
+    return _success()
 
 # ==================== 代理设置 API ====================
 
-@app.get("/api/proxy")
+@app.get("/api/proxy", response_model=None)
 def get_proxy_config():
     """获取代理配置"""
     if not PROXY_AVAILABLE:
-        return {"success": False, "msg": "代理管理器不可用"}
+        return ORJSONResponse({"success": False, "msg": "代理管理器不可用"})
     try:
-        return {"success": True, "data": proxy_manager.get_proxy_info()}
+        return ORJSONResponse({"success": True, "data": proxy_manager.get_proxy_info()})
     except Exception as e:
-        return {"success": False, "msg": str(e)}
+        return ORJSONResponse({"success": False, "msg": str(e)})
 
-@app.post("/api/proxy")
+@app.post("/api/proxy", response_model=None)
 async def update_proxy_config(request: Request):
     """更新代理配置"""
     if not PROXY_AVAILABLE:
-        return {"success": False, "msg": "代理管理器不可用"}
+        return ORJSONResponse({"success": False, "msg": "代理管理器不可用"})
     try:
         settings = await request.json()
         
         # 验证必要字段
         if settings.get('enabled'):
             if not settings.get('host') or not settings.get('port'):
-                return {"success": False, "msg": "启用代理时必须提供主机和端口"}
+                return ORJSONResponse({"success": False, "msg": "启用代理时必须提供主机和端口"})
         
         # 更新配置
         success = proxy_manager.update_config(**settings)
         
         if success:
-            return {"success": True, "msg": "代理配置已保存"}
+            return ORJSONResponse({"success": True, "msg": "代理配置已保存"})
         else:
-            return {"success": False, "msg": "保存代理配置失败"}
+            return ORJSONResponse({"success": False, "msg": "保存代理配置失败"})
             
     except Exception as e:
-        return {"success": False, "msg": str(e)}
+        return ORJSONResponse({"success": False, "msg": str(e)})
 
-@app.post("/api/proxy/test")
+@app.post("/api/proxy/test", response_model=None)
 async def test_proxy_connection(request: Request):
     """测试代理连接"""
     if not PROXY_AVAILABLE:
-        return {"success": False, "msg": "代理管理器不可用"}
+        return ORJSONResponse({"success": False, "msg": "代理管理器不可用"})
     try:
         data = await request.json()
         test_url = data.get('test_url', 'https://www.baidu.com')
         result = proxy_manager.test_connection(test_url)
-        return result
+        return ORJSONResponse(result)
     except Exception as e:
-        return {"success": False, "msg": str(e)}
\ No newline at end of file
+        return ORJSONResponse({"success": False, "msg": str(e)})
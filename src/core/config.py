@@ -3,11 +3,21 @@
 负责配置文件的加载、保存和管理
 """
 import os
-import toml
-import structlog
-from typing import Dict, Any, Optional
+import copy
+import contextlib
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+import tomli_w
+from .logging import get_logger
+from .fileio import atomic_write, drop_none
+from typing import Dict, Any, Optional, Set, Tuple
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
+
+# 解析结果缓存：{文件路径: ((修改时间, 大小), 配置字典)}，文件未变化时无需重新解析
+_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
 
 class Config:
@@ -35,25 +45,70 @@ class Config:
     
     def __init__(self):
         self.config: Dict[str, Any] = {}
+        # 最近一次加载/保存时配置文件的 (修改时间, 大小)，用于判断文件是否在外部被修改
+        self._file_stamp: Optional[Tuple[int, int]] = None
+        # 是否有未写入文件的修改，以及 batch() 的嵌套层数
+        self._dirty = False
+        self._batch_depth = 0
+        # 已使用的绝对序列号集合及其最大值，首次使用时构建，重新加载配置后失效
+        self._used_serials: Optional[Set[Any]] = None
+        self._max_serial: Any = 0
         self.load()
     
+    def _stat_config_file(self) -> Optional[Tuple[int, int]]:
+        """获取配置文件的 (修改时间, 大小)，文件不存在时返回None"""
+        try:
+            st = os.stat(self.CONFIG_FILE)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+    
+    def has_changed(self) -> bool:
+        """配置文件自上次加载/保存后是否被修改（如可视化配置界面写入）"""
+        stamp = self._stat_config_file()
+        return stamp is not None and stamp != self._file_stamp
+    
+    def reload_if_changed(self) -> bool:
+        """
+        配置文件自上次加载/保存后被修改时重新加载
+        
+        Returns:
+            是否重新加载了配置
+        """
+        if not self.has_changed():
+            return False
+        logger.info("检测到配置文件已被修改，重新加载", file=self.CONFIG_FILE)
+        self.load()
+        return True
+    
     def load(self) -> Dict[str, Any]:
         """加载配置文件"""
+        # 先记录文件状态：加载失败时也不会在文件再次变化前反复重试
+        self._file_stamp = self._stat_config_file()
+        self._used_serials = None
         try:
-            if not os.path.exists(self.CONFIG_FILE):
+            # stat 已经说明文件是否存在，无需再调用 os.path.exists
+            if self._file_stamp is None:
                 logger.warning("配置文件不存在，使用默认配置", file=self.CONFIG_FILE)
-                self.config = self.CONFIG_TEMPLATE.copy()
+                self.config = copy.deepcopy(self.CONFIG_TEMPLATE)
                 self.save()
                 return self.config
             
-            with open(self.CONFIG_FILE, 'r', encoding='utf-8') as f:
-                self.config = toml.load(f)
+            cached = _CACHE.get(self.CONFIG_FILE)
+            if cached is not None and cached[0] == self._file_stamp:
+                # 缓存的是已经过结构检查和序列号校验的配置，无需重复检查
+                self.config = copy.deepcopy(cached[1])
+                logger.debug("配置文件未变化，使用已解析的配置")
+                return self.config
+            
+            with open(self.CONFIG_FILE, 'rb') as f:
+                self.config = tomllib.load(f)
                 logger.info("成功加载配置文件", current_config=self.config.get('current_config'))
                 
             # 确保配置结构完整
             if "configurations" not in self.config:
                 logger.warning("配置缺少 'configurations'，使用默认值")
-                self.config["configurations"] = self.CONFIG_TEMPLATE["configurations"].copy()
+                self.config["configurations"] = copy.deepcopy(self.CONFIG_TEMPLATE["configurations"])
                 
             if "current_config" not in self.config:
                 logger.warning("配置缺少 'current_config'，使用默认值 'default'")
@@ -61,20 +116,44 @@ class Config:
             
             # 验证并修复序列号
             if self._validate_and_repair_serials():
-                self.save()
+                self.save()  # 保存时同时更新缓存
+            else:
+                _CACHE[self.CONFIG_FILE] = (self._file_stamp, copy.deepcopy(self.config))
                 
             return self.config
             
         except Exception as e:
             logger.error("加载配置文件失败，使用默认配置", error=str(e))
-            self.config = self.CONFIG_TEMPLATE.copy()
+            self.config = copy.deepcopy(self.CONFIG_TEMPLATE)
             return self.config
     
+    @contextlib.contextmanager
+    def batch(self):
+        """批量修改配置：期间调用 save() 只记录待保存，退出时最多写入一次文件"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+    
+    def flush(self) -> bool:
+        """有未保存的修改时写入文件"""
+        if not self._dirty:
+            return True
+        return self.save()
+    
     def save(self) -> bool:
-        """保存配置文件"""
+        """保存配置文件（在 batch() 中调用时推迟到退出 batch 时统一保存）"""
+        if self._batch_depth:
+            self._dirty = True
+            return True
         try:
-            with open(self.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                toml.dump(self.config, f)
+            atomic_write(self.CONFIG_FILE, tomli_w.dumps(drop_none(self.config)).encode("utf-8"))
+            self._file_stamp = self._stat_config_file()
+            _CACHE[self.CONFIG_FILE] = (self._file_stamp, copy.deepcopy(self.config))
+            self._dirty = False
             logger.info("配置文件保存成功")
             return True
         except Exception as e:
@@ -88,6 +167,9 @@ class Config:
     def set(self, key: str, value: Any) -> None:
         """设置配置值"""
         self.config[key] = value
+        self._dirty = True
+        if key == "configurations":
+            self._used_serials = None
     
     def get_current_config(self) -> Optional[Dict[str, Any]]:
         """获取当前激活的配置"""
@@ -96,7 +178,8 @@ class Config:
         return configurations.get(current_name)
     
     def get_all_configurations(self) -> Dict[str, Any]:
-        """获取所有配置"""
+        """获取所有配置（配置文件未变化时只需一次stat，直接返回已解析的配置）"""
+        self.reload_if_changed()
         return self.config.get("configurations", {})
     
     def add_configuration(self, name: str, config: Dict[str, Any]) -> bool:
@@ -106,13 +189,18 @@ class Config:
                 self.config["configurations"] = {}
             
             # 检查 absolute_serial_number 的唯一性
-            new_serial = config.get("absolute_serial_number")
-            for existing_config in self.config["configurations"].values():
-                if existing_config.get("absolute_serial_number") == new_serial:
-                    logger.error("添加配置失败：absolute_serial_number 已存在", new_serial=new_serial)
-                    return False
+            used_serials = self._get_used_serials()
+            new_serial = self._serial_of(config)
+            if new_serial in used_serials:
+                logger.error("添加配置失败：absolute_serial_number 已存在", new_serial=new_serial)
+                return False
             
+            replaced = self.config["configurations"].get(name)
+            if replaced is not None:
+                self._discard_serial(replaced)
             self.config["configurations"][name] = config
+            used_serials.add(new_serial)
+            self._max_serial = max(self._max_serial, new_serial)
             logger.info("添加新配置", name=name)
             return True
         except Exception as e:
@@ -123,7 +211,7 @@ class Config:
         """删除配置"""
         try:
             if name in self.config.get("configurations", {}):
-                del self.config["configurations"][name]
+                self._discard_serial(self.config["configurations"].pop(name))
                 logger.info("删除配置", name=name)
                 return True
             else:
@@ -133,11 +221,32 @@ class Config:
             logger.error("删除配置失败", name=name, error=str(e))
             return False
     
+    @staticmethod
+    def _serial_of(config: Dict[str, Any]) -> Any:
+        return config.get("absolute_serial_number", 0)
+    
+    def _get_used_serials(self) -> Set[Any]:
+        """获取已使用的绝对序列号集合，未构建时根据当前配置构建"""
+        if self._used_serials is None:
+            self._used_serials = {self._serial_of(cfg) for cfg in self.config.get("configurations", {}).values()}
+            self._max_serial = max(self._used_serials, default=0)
+        return self._used_serials
+    
+    def _discard_serial(self, config: Dict[str, Any]) -> None:
+        """从已使用集合中移除配置的序列号，移除的是最大值时重新计算最大值"""
+        if self._used_serials is None:
+            return
+        serial = self._serial_of(config)
+        self._used_serials.discard(serial)
+        if serial == self._max_serial:
+            self._max_serial = max(self._used_serials, default=0)
+    
     def generate_unique_serial(self) -> int:
         """生成唯一的绝对序列号"""
-        configurations = self.get_all_configurations()
-        existing_serials = {cfg.get("absolute_serial_number", 0) for cfg in configurations.values()}
-        return max(existing_serials) + 1 if existing_serials else 1
+        # 配置文件被外部修改时先重新加载，随后序列号集合会重新构建
+        self.reload_if_changed()
+        self._get_used_serials()
+        return self._max_serial + 1
 
     def _validate_and_repair_serials(self) -> bool:
         """验证并修复绝对序列号，确保其唯一且升序"""
@@ -150,12 +259,21 @@ class Config:
         config_items = list(configurations.items())
 
         # 检查是否存在问题（重复或不连续），并确保类型为整数
-        try:
-            serials = [int(cfg.get("absolute_serial_number")) for _, cfg in config_items]
-            is_problematic = len(serials) != len(set(serials)) or sorted(serials) != list(range(1, len(serials) + 1))
-        except (ValueError, TypeError):
-            # 如果转换失败或存在None，则认为有问题，需要修复
-            is_problematic = True
+        # n 个互不重复且都在 1..n 之间的序列号必然恰好是 1..n，单次遍历即可判断，发现问题立即停止
+        count = len(config_items)
+        seen = set()
+        is_problematic = False
+        for _, cfg in config_items:
+            try:
+                serial = int(cfg.get("absolute_serial_number"))
+            except (ValueError, TypeError):
+                # 如果转换失败或存在None，则认为有问题，需要修复
+                is_problematic = True
+                break
+            if not 1 <= serial <= count or serial in seen:
+                is_problematic = True
+                break
+            seen.add(serial)
 
         if is_problematic:
             logger.warning("检测到绝对序列号存在问题，开始修复...")
@@ -163,6 +281,7 @@ class Config:
             # 按原始顺序重新分配序列号
             for i, (name, config) in enumerate(config_items):
                 self.config["configurations"][name]["absolute_serial_number"] = i + 1
+            self._used_serials = None
             
             logger.info("绝对序列号修复完成。")
 
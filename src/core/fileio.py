@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+文件读写工具
+配置文件、界面设置等共用的序列化与原子写入函数
+"""
+
+import os
+import tempfile
+from typing import Any
+
+
+def drop_none(value: Any) -> Any:
+    """TOML 没有空值；与原先 toml.dump 的行为一致，直接省略值为 None 的键"""
+    if isinstance(value, dict):
+        return {k: drop_none(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [drop_none(v) for v in value if v is not None]
+    return value
+
+
+def atomic_write(path: str, payload: bytes) -> None:
+    """先写入同目录下的临时文件再一次性替换，写入中途崩溃不会留下写了一半的文件"""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
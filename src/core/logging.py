@@ -1,51 +1,232 @@
 """
 日志配置模块
-使用 structlog 提供结构化日志，支持控制台和JSONL文件输出。
+基于标准库 logging 提供轻量的结构化日志，支持控制台和JSONL文件输出。
 """
 import sys
 import os
-import glob
 import logging
 import json
-from functools import partial
+import re
+import time
+import copy
+import queue
+import atexit
+import logging.handlers
 from datetime import datetime, timedelta
-import structlog
-from rich.logging import RichHandler
 
-# 从程序配置模块导入 p_config_manager
-from .p_config import p_config_manager
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时退回标准库 json
+    orjson = None
 
 LOG_DIR = "log"
+# 日志文件名中的时间格式；该格式按字典序比较即为时间先后
+LOG_TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+_LOG_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}")
+# 距上次轮转不足该时长（秒）时跳过日志目录扫描
+LOG_ROTATION_INTERVAL = 3600
+
+
+class StructuredLogger:
+    """
+    结构化日志器。
+    
+    保持 logger.info("事件", key=value) 的调用方式，额外的关键字参数作为结构化字段输出。
+    级别未启用时直接返回，不做任何格式化工作。
+    """
+    __slots__ = ("_logger",)
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+
+    @property
+    def name(self) -> str:
+        return self._logger.name
+
+    def isEnabledFor(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    def _log(self, level: int, event: str, args: tuple, fields: dict):
+        exc_info = fields.pop("exc_info", None)
+        self._logger._log(level, event, args, exc_info=exc_info, extra={"fields": fields})
+
+    def debug(self, event: str, *args, **fields):
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, event, args, fields)
+
+    def info(self, event: str, *args, **fields):
+        if self._logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, event, args, fields)
+
+    def warning(self, event: str, *args, **fields):
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, event, args, fields)
+
+    warn = warning
+
+    def error(self, event: str, *args, **fields):
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, event, args, fields)
+
+    def exception(self, event: str, *args, **fields):
+        if self._logger.isEnabledFor(logging.ERROR):
+            fields.setdefault("exc_info", True)
+            self._log(logging.ERROR, event, args, fields)
+
+    def critical(self, event: str, *args, **fields):
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._log(logging.CRITICAL, event, args, fields)
+
+
+def _dumps(entry: dict) -> str:
+    """把日志条目编码为一行JSON，优先使用 orjson"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # orjson 不支持的值（如超过64位的整数），交给标准库处理
+    return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class JSONLFormatter(logging.Formatter):
+    """将日志记录渲染为一行JSON（字段：event、结构化字段、logger、level、timestamp）"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 同一秒内的日志共用已格式化的 "日期T时间" 部分，只需拼接微秒
+        self._cached_second = None
+        self._cached_prefix = ""
+
+    def _format_timestamp(self, created: float) -> str:
+        """与 datetime.fromtimestamp(created).isoformat() 输出相同"""
+        second = int(created)
+        microsecond = round((created - second) * 1_000_000)
+        if microsecond >= 1_000_000:
+            return datetime.fromtimestamp(created).isoformat()
+        if second != self._cached_second:
+            self._cached_prefix = datetime.fromtimestamp(second).isoformat()
+            self._cached_second = second
+        if microsecond:
+            return f"{self._cached_prefix}.{microsecond:06d}"
+        return self._cached_prefix
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {"event": record.getMessage()}
+        entry.update(getattr(record, "fields", None) or {})
+        entry["logger"] = record.name
+        entry["level"] = record.levelname.lower()
+        entry["timestamp"] = self._format_timestamp(record.created)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return _dumps(entry)
+
+
+class ConsoleFormatter(logging.Formatter):
+    """控制台格式化器：事件文本后附加 key=value 形式的结构化字段"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        fields = getattr(record, "fields", None)
+        if fields:
+            message += " " + " ".join(f"{key}={value!r}" for key, value in fields.items())
+        return message
+
+
+class PlainConsoleFormatter(ConsoleFormatter):
+    """不使用rich时的控制台格式化器：补上级别名称和异常堆栈"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = f"{record.levelname} {super().format(record)}"
+        if record.exc_info:
+            message += "\n" + self.formatException(record.exc_info)
+        return message
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    只在进程内传递日志记录的QueueHandler。
+    
+    默认实现会在入队前把异常信息格式化进消息文本，这会丢失结构化字段的分离，
+    这里只预先合并消息参数，保留 exc_info 交给后台线程中的各个handler处理。
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    带缓冲的文件handler：按时间间隔刷新到磁盘，ERROR及以上级别立即刷新。
+    """
+
+    def __init__(self, filename, mode='a', encoding=None, flush_interval: float = 1.0,
+                 buffer_size: int = 64 * 1024):
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def _open(self):
+        # 使用较大的写缓冲，两次刷新之间的日志先累积在内存中
+        return open(self.baseFilename, self.mode, encoding=self.encoding,
+                    errors=self.errors, buffering=self.buffer_size)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            now = time.monotonic()
+            if record.levelno >= logging.ERROR or now - self._last_flush >= self.flush_interval:
+                self.flush()
+                self._last_flush = now
+        except Exception:
+            self.handleError(record)
+
+
+def get_logger(name: str) -> StructuredLogger:
+    """
+    获取一个结构化日志器实例。
+    
+    Args:
+        name: 日志器名称 (通常是 __name__)
+        
+    Returns:
+        一个结构化日志器实例
+    """
+    return StructuredLogger(logging.getLogger(name))
+
 
 # 创建一个模块级别的logger实例，供本模块内部函数使用
-# 注意：在setup_logging完成前，它可能不会按预期工作
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 # --- 动态级别控制 ---
 _default_console_level = logging.WARNING
 
+# 当前使用的控制台handler、后台日志线程与日志文件路径（由setup_logging设置）
+_console_handler = None
+_queue_listener = None
+_log_file_path = None
+
 def set_console_log_level(level: str):
     """动态设置控制台日志级别"""
     try:
         level_val = getattr(logging, level.upper())
-        root_logger = logging.getLogger()
-        for handler in root_logger.handlers:
-            if isinstance(handler, RichHandler):
-                handler.setLevel(level_val)
-                logger.debug(f"控制台日志级别已临时设置为 {level}")
-                break
+        if _console_handler is not None:
+            _console_handler.setLevel(level_val)
+            logger.debug(f"控制台日志级别已临时设置为 {level}")
     except Exception as e:
         logger.error("设置控制台日志级别失败", error=str(e))
 
 def reset_console_log_level():
     """将控制台日志级别恢复为默认值"""
     try:
-        root_logger = logging.getLogger()
-        for handler in root_logger.handlers:
-            if isinstance(handler, RichHandler):
-                handler.setLevel(_default_console_level)
-                logger.debug("控制台日志级别已恢复为默认")
-                break
+        if _console_handler is not None:
+            _console_handler.setLevel(_default_console_level)
+            logger.debug("控制台日志级别已恢复为默认")
     except Exception as e:
         logger.error("恢复控制台日志级别失败", error=str(e))
 
@@ -56,41 +237,55 @@ def rotate_logs():
     """
     try:
         # 从配置中获取日志保留天数，如果获取失败则默认为30天
-        retention_days = p_config_manager.get("logging.log_rotation_days", 30)
+        # 延迟导入：程序配置模块本身也依赖本模块提供的日志器
+        try:
+            from .p_config import p_config_manager
+        except ImportError:
+            p_config_manager = None
+        if p_config_manager is None:
+            retention_days = 30
+        else:
+            # 最近刚轮转过则无需再次扫描日志目录
+            last_rotation = p_config_manager.get("logging.last_rotation_ts", 0)
+            if isinstance(last_rotation, (int, float)) and 0 <= time.time() - last_rotation < LOG_ROTATION_INTERVAL:
+                return
+            retention_days = p_config_manager.get("logging.log_rotation_days", 30)
         
         # 确保保留天数是有效的正整数
         if not isinstance(retention_days, int) or retention_days <= 0:
-            retention_days = 30
             logger.warning(
                 "无效的日志保留天数配置，将使用默认值30天",
-                config_value=p_config_manager.get("logging.log_rotation_days")
+                config_value=retention_days
             )
+            retention_days = 30
 
-        cutoff_date = datetime.now() - timedelta(days=retention_days)
+        # 截止时间格式化为与文件名相同的字符串，之后逐个文件只需字符串比较，无需 strptime
+        cutoff_str = (datetime.now() - timedelta(days=retention_days)).strftime(LOG_TIMESTAMP_FORMAT)
         
         # 检查日志目录是否存在
         if not os.path.isdir(LOG_DIR):
             return
 
-        # 遍历目录中的所有 .jsonl 文件
-        for log_file in glob.glob(os.path.join(LOG_DIR, "*.jsonl")):
+        # 遍历目录中的所有 .jsonl 文件：scandir 直接给出文件名和类型，无需逐个 stat；
+        # 先收集再删除，避免在遍历目录的同时修改目录
+        with os.scandir(LOG_DIR) as entries:
+            log_files = [
+                entry for entry in entries
+                if entry.name.endswith(".jsonl") and entry.is_file(follow_symlinks=False)
+            ]
+        for entry in log_files:
+            log_file = entry.path
+            # 从文件名中提取日期部分 (e.g., "2025-10-07_14-24-31.jsonl")
+            timestamp_str = entry.name.split('.')[0]
+            if not _LOG_TIMESTAMP_RE.fullmatch(timestamp_str):
+                # 如果文件名格式不正确，记录警告并跳过
+                logger.warning("无法解析日志文件名，跳过轮转检查", file=log_file)
+                continue
             try:
-                # 从文件名中提取日期部分 (e.g., "2025-10-07_14-24-31.jsonl")
-                filename = os.path.basename(log_file)
-                timestamp_str = filename.split('.')[0]
-                log_date = datetime.strptime(timestamp_str, "%Y-%m-%d_%H-%M-%S")
-                
                 # 如果日志文件早于截止日期，则删除它
-                if log_date < cutoff_date:
+                if timestamp_str < cutoff_str:
                     os.remove(log_file)
                     logger.info("已删除旧日志文件", file=log_file)
-            except (ValueError, IndexError) as e:
-                # 如果文件名格式不正确，记录警告并跳过
-                logger.warning(
-                    "无法解析日志文件名，跳过轮转检查",
-                    file=log_file,
-                    error=str(e)
-                )
             except Exception as e:
                 # 捕获其他删除文件时可能发生的异常
                 logger.error(
@@ -98,18 +293,54 @@ def rotate_logs():
                     file=log_file,
                     error=str(e)
                 )
+
+        if p_config_manager is not None:
+            p_config_manager.set("logging.last_rotation_ts", int(time.time()))
+            p_config_manager.save()
     except Exception as e:
         # 捕获在读取配置或执行轮转时发生的任何顶层异常
         logger.error("日志轮转失败", error=str(e))
 
 
+def _create_console_handler() -> logging.Handler:
+    """
+    创建控制台handler。
+    
+    在交互终端中（或设置了环境变量 MAI_RICH_LOGS 时）使用RichHandler美化输出；
+    输出被重定向时（如可视化配置界面的后端）使用普通StreamHandler，无需导入rich。
+    """
+    stream = sys.stderr
+    if os.environ.get("MAI_RICH_LOGS") or (stream is not None and stream.isatty()):
+        from rich.logging import RichHandler
+        handler = RichHandler(
+            rich_tracebacks=True,
+            show_time=True,
+            show_level=True,
+            show_path=False
+        )
+        # rich会自动处理日志级别和时间，这里我们只需要消息本身和结构化字段
+        handler.setFormatter(ConsoleFormatter())
+    else:
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(PlainConsoleFormatter())
+    # 设置控制台只显示WARNING及以上级别的日志
+    handler.setLevel(_default_console_level)
+    return handler
+
+
 def setup_logging(level: str = "INFO"):
     """
     设置结构化日志，支持同时输出到控制台和JSONL文件。
     
+    由程序入口调用；重复调用不会重新配置。设置环境变量 MAI_NOLOG 时不做任何配置。
+    
     Args:
         level: 日志级别 (DEBUG, INFO, WARNING, ERROR)
     """
+    global _console_handler, _queue_listener, _log_file_path
+    if _queue_listener is not None or os.environ.get("MAI_NOLOG"):
+        return
+    
     # 1. 确保日志目录存在
     os.makedirs(LOG_DIR, exist_ok=True)
     
@@ -118,71 +349,50 @@ def setup_logging(level: str = "INFO"):
     rotate_logs()
     
     # 3. 创建本次运行的日志文件名
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    timestamp = datetime.now().strftime(LOG_TIMESTAMP_FORMAT)
     log_file_path = os.path.join(LOG_DIR, f"{timestamp}.jsonl")
 
-    # 4. 配置structlog
-    # structlog的处理器是按顺序执行的，最终结果交给logger处理
-    structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"), # 使用ISO 8601格式时间戳
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            # 这个处理器会把日志事件渲染成JSON字符串，用于文件输出
-            # 使用 functools.partial 来确保中文字符被正确编码
-            structlog.processors.JSONRenderer(serializer=partial(json.dumps, ensure_ascii=False)),
-        ],
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
-        cache_logger_on_first_use=True,
-    )
-
-    # 5. 配置Python标准logging，作为structlog的输出端
+    # 4. 配置Python标准logging
     # 我们配置两个handler：一个用于控制台，一个用于文件
     
-    # 控制台handler，使用RichHandler美化输出
-    console_handler = RichHandler(
-        rich_tracebacks=True,
-        show_time=True,
-        show_level=True,
-        show_path=False
-    )
-    # 为控制台handler单独设置一个更易读的格式化器
-    # rich会自动处理日志级别和时间，这里我们只需要消息本身
-    console_formatter = logging.Formatter('%(message)s')
-    console_handler.setFormatter(console_formatter)
-    # 设置控制台只显示WARNING及以上级别的日志
-    console_handler.setLevel(_default_console_level)
+    # 控制台handler：交互终端中使用RichHandler美化输出
+    console_handler = _create_console_handler()
 
-    # 文件handler，写入JSONL文件
-    file_handler = logging.FileHandler(log_file_path, mode='w', encoding='utf-8')
-    # 文件handler的格式化器很简单，因为它接收的已经是JSON字符串了
-    file_formatter = logging.Formatter('%(message)s')
-    file_handler.setFormatter(file_formatter)
+    # 文件handler，每条日志写入一行JSON，缓冲写入并定期刷新
+    file_handler = BufferedFileHandler(log_file_path, mode='w', encoding='utf-8')
+    file_handler.setFormatter(JSONLFormatter())
+
+    # 5. 日志调用只负责入队，格式化和写入由后台线程完成，避免阻塞界面
+    log_queue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    _console_handler = console_handler
+    _log_file_path = log_file_path
 
     # 获取根logger并配置
     root_logger = logging.getLogger()
     root_logger.setLevel(level.upper())
-    root_logger.handlers = [console_handler, file_handler]
+    root_logger.handlers = [_InProcessQueueHandler(log_queue)]
 
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
-    """
-    获取一个已配置的结构化日志器实例。
-    
-    Args:
-        name: 日志器名称 (通常是 __name__)
-        
-    Returns:
-        一个绑定的structlog日志器实例
-    """
-    return structlog.get_logger(name)
+def shutdown_logging():
+    """停止后台日志线程，写出队列中剩余的日志；本次运行没有写入任何日志时删除空日志文件"""
+    global _queue_listener, _log_file_path
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+    if _log_file_path is not None:
+        try:
+            if os.path.getsize(_log_file_path) == 0:
+                os.remove(_log_file_path)
+        except OSError:
+            pass
+        _log_file_path = None
+
+
+atexit.register(shutdown_logging)
 
-# 在模块加载时自动初始化日志系统
-setup_logging()
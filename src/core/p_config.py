@@ -3,11 +3,28 @@
 负责程序本身配置文件的加载、保存和管理（例如UI主题）
 """
 import os
-import toml
-import structlog
-from typing import Dict, Any, Optional
+import copy
+import contextlib
+import functools
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+import tomli_w
+from .logging import get_logger
+from .fileio import atomic_write, drop_none
+from typing import Dict, Any, Optional, Tuple
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
+
+# 解析结果缓存：{文件路径: ((修改时间, 大小), 配置字典)}，文件未变化时无需重新解析
+_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """拆分点分隔的配置键；调用方使用的键是固定的几十个，拆分结果可以一直缓存"""
+    return tuple(key.split('.'))
 
 class PConfig:
     """程序配置管理类"""
@@ -37,7 +54,8 @@ class PConfig:
             "attention": "#FF45F6"
         },
         "logging": {
-            "log_rotation_days": 30
+            "log_rotation_days": 30,
+            "last_rotation_ts": 0  # 上次执行日志轮转的时间戳
         },
         "display": {
             "max_versions_display": 20
@@ -82,39 +100,90 @@ class PConfig:
 
     def __init__(self):
         self.config: Dict[str, Any] = {}
+        # 最近一次加载/保存时配置文件的 (修改时间, 大小)
+        self._file_stamp: Optional[Tuple[int, int]] = None
+        # 是否有未写入文件的修改，以及 batch() 的嵌套层数
+        self._dirty = False
+        self._batch_depth = 0
         self.load()
 
+    def _stat_config_file(self) -> Optional[Tuple[int, int]]:
+        """获取配置文件的 (修改时间, 大小)，文件不存在时返回None"""
+        try:
+            st = os.stat(self.CONFIG_FILE)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def has_changed(self) -> bool:
+        """配置文件自上次加载/保存后是否被外部修改"""
+        stamp = self._stat_config_file()
+        return stamp is not None and stamp != self._file_stamp
+
     def load(self) -> Dict[str, Any]:
         """加载配置文件，如果不存在或损坏则使用默认值"""
+        self._file_stamp = self._stat_config_file()
         try:
-            if not os.path.exists(self.CONFIG_FILE):
+            # stat 已经说明文件是否存在，无需再调用 os.path.exists
+            if self._file_stamp is None:
                 logger.warning("程序配置文件不存在，使用默认配置", file=self.CONFIG_FILE)
-                self.config = self.DEFAULT_CONFIG.copy()
+                self.config = copy.deepcopy(self.DEFAULT_CONFIG)
                 self.save()
                 return self.config
             
-            with open(self.CONFIG_FILE, 'r', encoding='utf-8') as f:
-                self.config = toml.load(f)
+            cached = _CACHE.get(self.CONFIG_FILE)
+            if cached is not None and cached[0] == self._file_stamp:
+                # 缓存的是已合并默认值的完整配置，无需重复检查
+                self.config = copy.deepcopy(cached[1])
+                logger.debug("程序配置文件未变化，使用已解析的配置")
+                return self.config
+            
+            with open(self.CONFIG_FILE, 'rb') as f:
+                self.config = tomllib.load(f)
                 logger.info("成功加载程序配置文件")
             
             # 确保配置结构完整（合并默认值）
             if self._ensure_config_integrity():
                 logger.info("配置结构已更新，正在保存...")
-                self.save()
+                self.save()  # 保存时同时更新缓存
+            else:
+                _CACHE[self.CONFIG_FILE] = (self._file_stamp, copy.deepcopy(self.config))
             
             return self.config
             
         except Exception as e:
             logger.error("加载程序配置文件失败，使用默认配置", error=str(e))
-            self.config = self.DEFAULT_CONFIG.copy()
+            self.config = copy.deepcopy(self.DEFAULT_CONFIG)
             return self.config
 
+    @contextlib.contextmanager
+    def batch(self):
+        """批量修改配置：期间调用 save() 只记录待保存，退出时最多写入一次文件"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def flush(self) -> bool:
+        """有未保存的修改时写入文件"""
+        if not self._dirty:
+            return True
+        return self.save()
+
     def save(self) -> bool:
-        """保存当前配置到文件"""
+        """保存当前配置到文件（在 batch() 中调用时推迟到退出 batch 时统一保存）"""
+        if self._batch_depth:
+            self._dirty = True
+            return True
         try:
             os.makedirs(os.path.dirname(self.CONFIG_FILE), exist_ok=True)
-            with open(self.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                toml.dump(self.config, f)
+            atomic_write(self.CONFIG_FILE, tomli_w.dumps(drop_none(self.config)).encode("utf-8"))
+            self._file_stamp = self._stat_config_file()
+            _CACHE[self.CONFIG_FILE] = (self._file_stamp, copy.deepcopy(self.config))
+            self._dirty = False
             logger.info("程序配置文件保存成功")
             return True
         except Exception as e:
@@ -124,9 +193,8 @@ class PConfig:
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置值，支持点分隔的嵌套键"""
         try:
-            keys = key.split('.')
             value = self.config
-            for k in keys:
+            for k in _split_key(key):
                 value = value[k]
             return value
         except KeyError:
@@ -135,11 +203,12 @@ class PConfig:
     def set(self, key: str, value: Any) -> None:
         """设置配置值，支持点分隔的嵌套键"""
         try:
-            keys = key.split('.')
+            keys = _split_key(key)
             d = self.config
             for k in keys[:-1]:
                 d = d.setdefault(k, {})
             d[keys[-1]] = value
+            self._dirty = True
         except Exception as e:
             logger.error("设置程序配置值失败", key=key, error=str(e))
 
@@ -158,7 +227,7 @@ class PConfig:
     def reset_to_default(self) -> bool:
         """将配置重置为默认值并保存"""
         logger.info("正在将程序配置重置为默认值")
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         return self.save()
 
     def _ensure_config_integrity(self) -> bool:
@@ -176,25 +245,30 @@ class PConfig:
             modified = True
             logger.info("检测到旧配置文件，已将 first_run 初始化为 False")
 
-        # 2. 递归合并默认配置
-        if self._recursive_update(self.config, self.DEFAULT_CONFIG):
+        # 2. 合并缺失的默认配置
+        if self._merge_defaults(self.config, self.DEFAULT_CONFIG):
             modified = True
             
         return modified
 
-    def _recursive_update(self, target: Dict, source: Dict) -> bool:
-        """递归更新字典，返回是否有变更"""
+    def _merge_defaults(self, target: Dict, source: Dict) -> bool:
+        """把 source 中缺失的项补到 target（用显式栈逐层处理，不做递归调用），返回是否有变更"""
         changed = False
-        for k, v in source.items():
-            if k == "first_run":
-                continue # 已在外部处理
-                
-            if k not in target:
-                target[k] = v
-                changed = True
-            elif isinstance(v, dict) and isinstance(target[k], dict):
-                if self._recursive_update(target[k], v):
+        stack = [(target, source)]
+        while stack:
+            target, source = stack.pop()
+            for k, v in source.items():
+                if k == "first_run":
+                    continue # 已在外部处理
+                    
+                if k not in target:
+                    # 深拷贝默认值，避免之后修改配置时连带修改 DEFAULT_CONFIG
+                    target[k] = copy.deepcopy(v)
                     changed = True
+                elif isinstance(v, dict):
+                    sub_target = target[k]
+                    if isinstance(sub_target, dict):
+                        stack.append((sub_target, v))
         return changed
 
 # 全局程序配置实例
@@ -4,15 +4,9 @@
 负责独立下载和安装各种开发组件
 """
 
-from .component_manager import ComponentManager
-from .nodejs_downloader import NodeJSDownloader
-from .vscode_downloader import VSCODEDownloader
-from .git_downloader import GitDownloader
-from .go_downloader import GoDownloader
-from .python_downloader import PythonDownloader
-from .mongodb_downloader import MongoDBDownloader
-from .sqlitestudio_downloader import SQLiteStudioDownloader
-from .napcat_downloader import NapCatDownloader
+import importlib
+
+from .component_manager import ComponentManager, DOWNLOADER_REGISTRY
 
 __all__ = [
     'ComponentManager',
@@ -24,4 +18,13 @@ __all__ = [
     'MongoDBDownloader',
     'SQLiteStudioDownloader',
     'NapCatDownloader'
-]
\ No newline at end of file
+]
+
+# 下载器类按名称延迟导入，导入本包时不加载各下载器模块
+_LAZY_EXPORTS = {class_name: module_name for module_name, class_name in DOWNLOADER_REGISTRY.values()}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
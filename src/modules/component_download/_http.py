@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+共享HTTP会话
+所有下载器共用一个 requests.Session：对同一主机的后续请求（版本查询、HEAD检查、下载、重试）
+以及并发的版本预取都复用连接池中已建立的TCP/TLS连接
+"""
+
+import os
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+
+GITHUB_API_HOST = "api.github.com"
+
+
+class _GitHubAPIAuth(AuthBase):
+    """只对GitHub API请求附加 Accept 头及（若设置了 GITHUB_TOKEN）令牌，其他主机不会收到令牌"""
+
+    def __init__(self, token):
+        self.token = token
+
+    def __call__(self, request):
+        if urlsplit(request.url).hostname == GITHUB_API_HOST:
+            request.headers.setdefault("Accept", "application/vnd.github+json")
+            if self.token:
+                # 带令牌时API限额从每小时60次提升到5000次
+                request.headers["Authorization"] = f"Bearer {self.token}"
+        return request
+
+
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+http_session.headers["User-Agent"] = "MaiCore-Start"
+http_session.auth = _GitHubAPIAuth(os.environ.get("GITHUB_TOKEN"))
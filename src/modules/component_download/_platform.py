@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""
+平台信息
+在导入时计算一次操作系统和CPU架构，供各下载器共用
+"""
+
+import platform
+
+SYSTEM = platform.system().lower()
+IS_ARM64 = platform.machine().lower() in ('arm64', 'aarch64')
+
+
+def arch_name(x64_name: str) -> str:
+    """返回下载文件名中使用的架构名称：ARM64平台为'arm64'，其余平台（默认按64位x86处理）为x64_name"""
+    return 'arm64' if IS_ARM64 else x64_name
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+发布信息缓存
+按URL在磁盘上缓存GitHub releases接口的响应体及其ETag/Last-Modified，
+配合条件请求使用：服务器返回304时直接复用缓存内容，不再重复下载完整JSON。
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from ...core.fileio import atomic_write
+from ...core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_DIR = Path.cwd() / "Temporary" / ".release_cache"
+
+
+def _cache_path(url: str) -> Path:
+    return CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+
+def load(url: str) -> Tuple[Dict[str, str], Optional[Any]]:
+    """读取缓存，返回 (条件请求头, 缓存的响应体)；无可用缓存时返回 ({}, None)"""
+    try:
+        with open(_cache_path(url), "rb") as f:
+            entry = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}, None
+
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    if not headers:
+        return {}, None
+    return headers, entry.get("body")
+
+
+def store(url: str, response_headers: Mapping[str, str], body: Any) -> None:
+    """保存响应体及其校验头；服务器未提供ETag/Last-Modified时不缓存"""
+    etag = response_headers.get("ETag")
+    last_modified = response_headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+
+    entry = {"url": url, "etag": etag, "last_modified": last_modified, "body": body}
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        atomic_write(str(_cache_path(url)), json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+    except OSError as e:
+        logger.warning("写入发布信息缓存失败", url=url, error=str(e))
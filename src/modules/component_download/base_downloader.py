@@ -11,12 +11,16 @@ import tempfile
 import zipfile
 from pathlib import Path
 from typing import Optional, Tuple
-import structlog
+from ...core.logging import get_logger
 from tqdm import tqdm
 
 from ...ui.interface import ui
+from ._http import http_session
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
+
+# 下载时每次读取/写入的块大小
+DOWNLOAD_CHUNK_SIZE = 1 << 20
 
 
 class BaseDownloader:
@@ -25,6 +29,8 @@ class BaseDownloader:
     def __init__(self, name: str):
         self.name = name
         self.temp_dir = None
+        # 批量下载时预先获取的版本列表（见 prefetch）
+        self._prefetched_versions = None
     
     def __enter__(self):
         """上下文管理器入口"""
@@ -40,7 +46,7 @@ class BaseDownloader:
         """下载文件并显示进度，支持重试"""
         try:
             # 检查网络连接
-            response = requests.head(url, timeout=10, verify=False)
+            response = http_session.head(url, timeout=10, verify=False)
             if response.status_code >= 400:
                 ui.print_error(f"URL无效或文件不存在: {url}")
                 return False
@@ -54,10 +60,11 @@ class BaseDownloader:
                 ui.print_info(f"正在下载 {filename}... (尝试 {retry + 1}/{max_retries})")
                 logger.info("开始下载文件", url=url, filename=filename, retry=retry+1)
                 
-                response = requests.get(url, stream=True, timeout=30, verify=False)
+                response = http_session.get(url, stream=True, timeout=30, verify=False)
                 response.raise_for_status()
                 
                 total_size = int(response.headers.get('content-length', 0))
+                actual_size = 0
                 
                 with open(filename, 'wb') as file, tqdm(
                     desc=filename,
@@ -66,14 +73,21 @@ class BaseDownloader:
                     unit_scale=True,
                     unit_divisor=1024,
                 ) as progress_bar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            file.write(chunk)
-                            progress_bar.update(len(chunk))
+                    # 预先按预期大小分配文件空间，减少边写边扩展造成的碎片
+                    if total_size > 0:
+                        file.truncate(total_size)
+                    try:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            if chunk:
+                                file.write(chunk)
+                                actual_size += len(chunk)
+                                progress_bar.update(len(chunk))
+                    finally:
+                        # 截掉预分配但未写入的部分（下载中断时同样执行，避免留下补零的“完整”文件）
+                        file.truncate()
                 
-                # 验证文件大小
+                # 验证文件大小（按实际写入的字节数，预分配后文件大小不能反映下载进度）
                 if total_size > 0:
-                    actual_size = os.path.getsize(filename)
                     if actual_size < total_size * 0.98:  # 允许2%的误差
                         ui.print_warning(f"文件下载不完整: 预期 {total_size} 字节, 实际 {actual_size} 字节")
                         if retry < max_retries - 1:
@@ -81,6 +95,7 @@ class BaseDownloader:
                             continue
                         else:
                             ui.print_error("达到最大重试次数，文件可能不完整")
+                            self._remove_partial_file(filename)
                             return False
                 
                 ui.print_success(f"{filename} 下载完成")
@@ -98,12 +113,24 @@ class BaseDownloader:
                     continue
                 else:
                     ui.print_error("达到最大重试次数，下载失败")
+                    self._remove_partial_file(filename)
                     return False
                     
         ui.print_error(f"下载失败：达到最大重试次数 {max_retries}")
         logger.error("文件下载失败", url=url)
+        self._remove_partial_file(filename)
         return False
     
+    @staticmethod
+    def _remove_partial_file(filename: str):
+        """删除下载失败留下的不完整文件，避免之后被当作可用的安装包"""
+        try:
+            os.remove(filename)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("删除不完整的下载文件失败", filename=filename, error=str(e))
+    
     def extract_archive(self, archive_path: str, extract_to: str) -> bool:
         """解压文件"""
         try:
@@ -165,6 +192,14 @@ class BaseDownloader:
             logger.error("安装程序运行异常", installer=installer_path, error=str(e))
             return False
     
+    def prefetch(self) -> None:
+        """预先完成不需要交互的网络查询（如版本列表），批量下载时并发执行 - 子类可以重写"""
+    
+    def _take_prefetched_versions(self):
+        """取出预先获取的版本列表（只使用一次，之后重新获取时仍会联网）"""
+        versions, self._prefetched_versions = self._prefetched_versions, None
+        return versions
+    
     def get_download_url(self) -> str:
         """获取下载链接 - 子类必须实现"""
         raise NotImplementedError("子类必须实现 get_download_url 方法")
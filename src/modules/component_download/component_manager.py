@@ -5,42 +5,62 @@
 """
 
 import os
+import re
+import fnmatch
+import importlib
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import structlog
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from ...core.logging import get_logger
 
 from ...ui.interface import ui
-from .nodejs_downloader import NodeJSDownloader
-from .vscode_downloader import VSCODEDownloader
-from .git_downloader import GitDownloader
-from .go_downloader import GoDownloader
-from .python_downloader import PythonDownloader
-from .mongodb_downloader import MongoDBDownloader
-from .sqlitestudio_downloader import SQLiteStudioDownloader
-from .napcat_downloader import NapCatDownloader
-from .webui_downloader import WebUIDownloader
 
-logger = structlog.get_logger(__name__)
+if TYPE_CHECKING:
+    from .base_downloader import BaseDownloader
+
+logger = get_logger(__name__)
+
+# 组件键 -> (下载器模块, 下载器类名)；下载器在首次使用时才导入并实例化
+DOWNLOADER_REGISTRY = {
+    'nodejs': ('.nodejs_downloader', 'NodeJSDownloader'),
+    'vscode': ('.vscode_downloader', 'VSCODEDownloader'),
+    'git': ('.git_downloader', 'GitDownloader'),
+    'go': ('.go_downloader', 'GoDownloader'),
+    'python': ('.python_downloader', 'PythonDownloader'),
+    'mongodb': ('.mongodb_downloader', 'MongoDBDownloader'),
+    'sqlitestudio': ('.sqlitestudio_downloader', 'SQLiteStudioDownloader'),
+    'napcat': ('.napcat_downloader', 'NapCatDownloader'),
+    'webui': ('.webui_downloader', 'WebUIDownloader'),
+}
+
+# 各组件安装包的文件名模式，合并为一个正则，清理时只需扫描一次临时目录
+_CLEANUP_PATTERNS = {
+    'nodejs': ['nodejs*.exe', 'nodejs*.msi'],
+    'vscode': ['VSCode*.exe', 'VSCode*.zip'],
+    'git': ['Git*.exe', 'Git*.msi'],
+    'go': ['go*.msi', 'go*.tar.gz'],  # 修正Go的清理模式
+    'python': ['python*.exe', 'python*.msi'],
+    'mongodb': ['mongodb*.exe', 'mongodb*.msi'],
+    'sqlitestudio': ['SQLiteStudio*.exe', 'SQLiteStudio*.zip'],
+    'napcat': ['NapCat*.zip'],
+    'webui': ['webui*.zip']
+}
+# 与 Path.glob 一致：Windows 下不区分大小写
+_CLEANUP_RES = {
+    key: re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns),
+                    re.IGNORECASE if os.name == 'nt' else 0)
+    for key, patterns in _CLEANUP_PATTERNS.items()
+}
 
 
 class ComponentManager:
     """组件下载管理器"""
     
     def __init__(self):
-        # 组件下载器映射
-        self.downloaders = {
-            'nodejs': NodeJSDownloader(),
-            'vscode': VSCODEDownloader(),
-            'git': GitDownloader(),
-            'go': GoDownloader(),
-            'python': PythonDownloader(),
-            'mongodb': MongoDBDownloader(),
-            'sqlitestudio': SQLiteStudioDownloader(),
-            'napcat': NapCatDownloader(),
-            'webui': WebUIDownloader()
-        }
+        # 已实例化的组件下载器，由 _get_downloader 按需创建
+        self._instances: Dict[str, "BaseDownloader"] = {}
         
         # 组件信息
         self.components_info = {
@@ -90,6 +110,20 @@ class ComponentManager:
                 'icon': '🌐'
             }
         }
+        # 菜单序号对应的组件键（按 components_info 的顺序）
+        self._component_keys = tuple(self.components_info)
+        # 组件菜单表格，按所用的主题颜色缓存；用户修改主题颜色后重新构建
+        self._menu_table = None
+        self._menu_table_colors = None
+    
+    def _get_downloader(self, component_key: str) -> "BaseDownloader":
+        """获取组件下载器，首次访问时导入并实例化"""
+        downloader = self._instances.get(component_key)
+        if downloader is None:
+            module_name, class_name = DOWNLOADER_REGISTRY[component_key]
+            module = importlib.import_module(module_name, __package__)
+            downloader = self._instances[component_key] = getattr(module, class_name)()
+        return downloader
     
     def get_temporary_directory(self) -> Path:
         """获取或创建临时目录"""
@@ -103,6 +137,17 @@ class ComponentManager:
         ui.components.show_title("组件下载中心", symbol="📦")
         
         # 显示组件列表
+        colors = (ui.colors["table_header"], ui.colors["primary"], ui.colors["border"])
+        if self._menu_table is None or self._menu_table_colors != colors:
+            self._menu_table = self._build_menu_table()
+            self._menu_table_colors = colors
+        ui.console.print(self._menu_table)
+        ui.console.print("\n可输入多个序号（如 1,3,5）批量下载  [Q] 返回上级菜单", style=ui.colors["info"])
+        
+        return self._get_component_choice()
+    
+    def _build_menu_table(self):
+        """构建组件列表表格"""
         from rich.table import Table
         table = Table(
             show_header=True,
@@ -117,21 +162,17 @@ class ComponentManager:
         table.add_column("状态", style="yellow", width=10, justify="center")
         
         for i, (key, info) in enumerate(self.components_info.items(), 1):
-            status = "✅ 可下载" if key in self.downloaders else "❌ 暂不支持"
+            status = "✅ 可下载" if key in DOWNLOADER_REGISTRY else "❌ 暂不支持"
             table.add_row(
                 f"[{i}]",
                 f"{info['icon']} {info['name']}",
                 info['description'],
                 status
             )
-        
-        ui.console.print(table)
-        ui.console.print("\n[Q] 返回上级菜单", style=ui.colors["info"])
-        
-        return self._get_component_choice()
+        return table
     
-    def _get_component_choice(self) -> Optional[str]:
-        """获取用户选择的组件"""
+    def _get_component_choice(self) -> Optional[List[str]]:
+        """获取用户选择的组件（支持以逗号或空格分隔多个序号），返回组件键列表"""
         while True:
             choice = ui.get_input("请选择要下载的组件：").strip().upper()
             
@@ -139,10 +180,10 @@ class ComponentManager:
                 return None
             
             try:
-                choice_num = int(choice)
-                if 1 <= choice_num <= len(self.components_info):
-                    component_key = list(self.components_info.keys())[choice_num - 1]
-                    return component_key
+                choice_nums = [int(part) for part in choice.replace(',', ' ').replace('，', ' ').split()]
+                if choice_nums and all(1 <= num <= len(self._component_keys) for num in choice_nums):
+                    # 去重并保持输入顺序
+                    return list(dict.fromkeys(self._component_keys[num - 1] for num in choice_nums))
                 else:
                     ui.print_error("无效选项，请重新选择")
             except ValueError:
@@ -150,7 +191,7 @@ class ComponentManager:
     
     def download_component(self, component_key: str) -> bool:
         """下载指定组件"""
-        if component_key not in self.downloaders:
+        if component_key not in DOWNLOADER_REGISTRY:
             ui.print_error(f"组件 '{component_key}' 不受支持")
             return False
         
@@ -162,7 +203,7 @@ class ComponentManager:
             temp_dir = self.get_temporary_directory()
             
             # 执行下载
-            downloader = self.downloaders[component_key]
+            downloader = self._get_downloader(component_key)
             success = downloader.download_and_install(temp_dir)
             
             if success:
@@ -190,35 +231,24 @@ class ComponentManager:
         """清理安装包"""
         try:
             # 根据组件类型清理相关文件
-            patterns = {
-                'nodejs': ['nodejs*.exe', 'nodejs*.msi'],
-                'vscode': ['VSCode*.exe', 'VSCode*.zip'],
-                'git': ['Git*.exe', 'Git*.msi'],
-                'go': ['go*.msi', 'go*.tar.gz'],  # 修正Go的清理模式
-                'python': ['python*.exe', 'python*.msi'],
-                'mongodb': ['mongodb*.exe', 'mongodb*.msi'],
-                'sqlitestudio': ['SQLiteStudio*.exe', 'SQLiteStudio*.zip'],
-                'napcat': ['NapCat*.zip'],
-                'webui': ['webui*.zip']
-            }
-            
-            if component_key in patterns:
-                for pattern in patterns[component_key]:
-                    for file in temp_dir.glob(pattern):
-                        if file.is_file():
-                            self._safe_delete_file(file)
+            pattern = _CLEANUP_RES.get(component_key)
+            if pattern is not None:
+                with os.scandir(temp_dir) as entries:
+                    files = [Path(entry.path) for entry in entries
+                             if pattern.match(entry.name) and entry.is_file()]
+                for file in files:
+                    self._safe_delete_file(file)
             
             ui.print_success("安装包清理完成")
             
         except Exception as e:
             ui.print_warning(f"清理安装包时发生错误：{str(e)}")
     
-    def _safe_delete_file(self, file_path: Path, max_retries: int = 5, retry_delay: float = 1.0):
-        """安全删除文件，支持重试和强制删除"""
+    def _safe_delete_file(self, file_path: Path, max_retries: int = 2, retry_delay: float = 1.0):
+        """安全删除文件，文件被占用时按指数退避重试，仍失败则在Windows上安排重启后删除"""
         import time
         import os
         import stat
-        import subprocess
         
         for attempt in range(max_retries):
             try:
@@ -226,60 +256,23 @@ class ComponentManager:
                 if not file_path.exists():
                     return
                 
-                # 尝试修改文件权限（Windows）
-                if os.name == 'nt':
-                    try:
-                        os.chmod(str(file_path), stat.S_IWRITE)
-                    except:
-                        pass
+                # 尝试修改文件权限（去掉只读属性）
+                try:
+                    os.chmod(str(file_path), stat.S_IWRITE | stat.S_IREAD)
+                except OSError:
+                    pass
                 
-                # 尝试普通删除
                 file_path.unlink()
                 ui.print_info(f"已删除：{file_path.name}")
                 return
                 
             except PermissionError:
-                # 文件被占用，尝试强制删除
+                # 文件被占用，等待后重试
                 if attempt < max_retries - 1:
-                    ui.print_info(f"文件被占用，尝试强制删除 ({attempt + 1}/{max_retries}): {file_path.name}")
-                    
-                    try:
-                        time.sleep(retry_delay)
-                        
-                        # Windows下使用PowerShell强制删除
-                        if os.name == 'nt':
-                            # 使用PowerShell的Remove-Item -Force
-                            cmd = f'Remove-Item -Path "{file_path}" -Force -ErrorAction SilentlyContinue'
-                            result = subprocess.run(
-                                ['powershell', '-Command', cmd],
-                                capture_output=True,
-                                text=True,
-                                timeout=10
-                            )
-                        else:
-                            # Linux/macOS下使用rm命令强制删除
-                            try:
-                                os.chmod(str(file_path), 0o777)
-                            except:
-                                pass
-                            subprocess.run(['rm', '-f', str(file_path)],
-                                         capture_output=True,
-                                         timeout=10)
-                        
-                        # 等待一下再检查
-                        time.sleep(retry_delay * 0.5)
-                        
-                        # 检查是否删除成功
-                        if not file_path.exists():
-                            ui.print_info(f"已强制删除：{file_path.name}")
-                            return
-                        
-                    except subprocess.TimeoutExpired:
-                        ui.print_warning(f"删除命令超时 ({attempt + 1}/{max_retries})")
-                    except Exception as force_error:
-                        ui.print_warning(f"强制删除失败 ({attempt + 1}/{max_retries}): {str(force_error)}")
-                    
-                    time.sleep(retry_delay)
+                    ui.print_info(f"文件被占用，稍后重试 ({attempt + 1}/{max_retries}): {file_path.name}")
+                    time.sleep(retry_delay * 2 ** attempt)
+                elif os.name == 'nt' and self._delete_on_reboot(file_path):
+                    ui.print_info(f"文件仍被占用，已安排在下次重启时删除：{file_path.name}")
                 else:
                     ui.print_warning(f"无法删除文件（文件可能正在使用中）：{file_path.name}")
                     ui.print_info("建议稍后手动删除该文件")
@@ -287,15 +280,42 @@ class ComponentManager:
             except Exception as e:
                 if attempt < max_retries - 1:
                     ui.print_warning(f"删除文件失败，重试中 ({attempt + 1}/{max_retries}): {str(e)}")
-                    time.sleep(retry_delay)
+                    time.sleep(retry_delay * 2 ** attempt)
                 else:
                     ui.print_warning(f"无法删除文件：{file_path.name}")
                     ui.print_info("建议稍后手动删除该文件")
     
+    @staticmethod
+    def _delete_on_reboot(file_path: Path) -> bool:
+        """通过 MoveFileExW 安排系统在下次重启时删除文件（需要管理员权限），成功返回True"""
+        import ctypes
+        
+        MOVEFILE_DELAY_UNTIL_REBOOT = 0x4
+        try:
+            return bool(ctypes.windll.kernel32.MoveFileExW(str(file_path), None, MOVEFILE_DELAY_UNTIL_REBOOT))
+        except Exception as e:
+            logger.warning("安排重启后删除失败", file=str(file_path), error=str(e))
+            return False
+    
+    @staticmethod
+    def _prefetch_quietly(downloader: "BaseDownloader") -> None:
+        """在工作线程中预取版本列表；多个线程的提示信息只写日志，避免控制台输出交错"""
+        with ui.quiet():
+            downloader.prefetch()
+    
     def download_multiple_components(self, component_keys: List[str]) -> Dict[str, bool]:
         """批量下载组件"""
         results = {}
         
+        # 各组件的版本列表查询相互独立且无需交互，先在线程池中并发完成；
+        # 之后的版本选择、下载和安装需要用户输入，仍逐个进行
+        downloaders = [self._get_downloader(key) for key in component_keys if key in DOWNLOADER_REGISTRY]
+        if len(downloaders) > 1:
+            ui.print_info(f"正在获取 {len(downloaders)} 个组件的版本信息...")
+            with ThreadPoolExecutor(max_workers=min(4, len(downloaders))) as executor:
+                list(executor.map(self._prefetch_quietly, downloaders))
+            ui.print_info("版本信息获取完成")
+        
         for key in component_keys:
             ui.print_info(f"正在下载组件 {key} ({len(results) + 1}/{len(component_keys)})")
             results[key] = self.download_component(key)
@@ -317,7 +337,7 @@ class ComponentManager:
             return {'status': 'unknown', 'message': '组件信息不存在'}
         
         # 检查下载器是否存在
-        if component_key in self.downloaders:
+        if component_key in DOWNLOADER_REGISTRY:
             return {
                 'status': 'available',
                 'message': '组件可下载',
@@ -3,71 +3,83 @@
 Git下载器
 """
 
-import platform
 import os
+import re
 import subprocess
 import ctypes
+import orjson
 import requests
 from pathlib import Path
 from typing import Optional, List, Dict
-import structlog
+from ...core.logging import get_logger
 
 from ...ui.interface import ui
 from .base_downloader import BaseDownloader
+from ._http import http_session
+from ...utils.common import is_admin
+from ._platform import SYSTEM, arch_name
+from . import _release_cache
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
+
+GIT_RELEASES_URL = "https://api.github.com/repos/git-for-windows/git/releases"
+
+
+def _slim_release(release: Dict) -> Dict:
+    """只保留版本列表用到的字段，丢弃上传者、反应数等其余数据"""
+    return {
+        "tag_name": release["tag_name"],
+        "name": release["name"],
+        "published_at": release["published_at"],
+        "assets": [
+            {"name": asset["name"], "browser_download_url": asset["browser_download_url"], "size": asset["size"]}
+            for asset in release["assets"]
+        ],
+    }
 
 
 class GitDownloader(BaseDownloader):
     """Git下载器"""
     
+    # Windows 64位安装包，排除 preview/test 版本
+    _ASSET_RE = re.compile(r'^(?!.*(?:preview|test))[^/]*64-bit\.exe$', re.IGNORECASE)
+    
     def __init__(self):
         super().__init__("Git")
-        self.system = platform.system().lower()
-        self.arch = platform.machine().lower()
-        
-        # 标准化架构名称
-        if self.arch in ['x86_64', 'amd64']:
-            self.arch = '64'
-        elif self.arch in ['arm64', 'aarch64']:
-            self.arch = 'arm64'
-        else:
-            self.arch = '64'
+        self.system = SYSTEM
+        self.arch = arch_name('64')
     
     def get_git_versions(self) -> List[Dict]:
         """获取Git版本列表"""
         try:
             ui.print_info("正在获取Git最新版本信息...")
             
-            # GitHub API获取releases
-            response = requests.get(
-                "https://api.github.com/repos/git-for-windows/git/releases",
-                timeout=10
-            )
-            response.raise_for_status()
+            # GitHub API获取releases（带ETag条件请求，未变化时服务器返回304，直接使用本地缓存）
+            headers, cached_releases = _release_cache.load(GIT_RELEASES_URL)
+            response = http_session.get(GIT_RELEASES_URL, headers=headers, timeout=10)
             
-            releases = response.json()
-            ui.print_info(f"获取到 {len(releases)} 个发布版本")
+            if response.status_code == 304 and cached_releases is not None:
+                releases = cached_releases
+                logger.info("Git版本列表未变化，使用缓存", url=GIT_RELEASES_URL)
+            else:
+                response.raise_for_status()
+                # 只使用前10个版本的必要字段，缓存也只保存这部分
+                releases = [_slim_release(release) for release in orjson.loads(response.content)[:10]]
+                _release_cache.store(GIT_RELEASES_URL, response.headers, releases)
             versions = []
             
             # 处理前10个版本
-            for i, release in enumerate(releases[:10]):
+            for release in releases:
                 tag_name = release['tag_name']
                 version_name = release['name']
                 published_at = release['published_at']
                 
-                ui.print_info(f"处理版本 {i+1}: {tag_name}")
-                
                 # 查找Windows 64位安装包 - 放宽条件
                 found_asset = None
                 for asset in release['assets']:
-                    asset_name = asset['name']
-                    ui.print_info(f"  检查资产: {asset_name}")
-                    if ('64-bit.exe' in asset_name and
-                        'preview' not in asset_name.lower() and
-                        'test' not in asset_name.lower()):
+                    if self._ASSET_RE.match(asset['name']):
                         found_asset = asset
-                        ui.print_info(f"  找到Git安装包: {asset_name}")
+                        logger.debug("找到Git安装包", tag=tag_name, asset=asset['name'])
                         break
                 
                 if found_asset:
@@ -80,11 +92,10 @@ class GitDownloader(BaseDownloader):
                         "version": tag_name,
                         "size": found_asset['size']
                     })
-                    ui.print_info(f"添加版本: {tag_name}")
                 else:
-                    ui.print_info(f"未找到适合的安装包: {tag_name}")
+                    logger.debug("未找到适合的安装包", tag=tag_name)
             
-            ui.print_info(f"最终找到 {len(versions)} 个可用版本")
+            ui.print_info(f"扫描 {len(releases)} 个发布版本，找到 {len(versions)} 个可用版本")
             if not versions:
                 # 如果没有找到版本，返回默认版本
                 ui.print_warning("未找到任何版本，使用默认版本")
@@ -114,11 +125,15 @@ class GitDownloader(BaseDownloader):
             }
         ]
     
+    def prefetch(self) -> None:
+        """预先获取Git版本列表"""
+        self._prefetched_versions = self.get_git_versions()
+    
     def select_version(self) -> Optional[Dict]:
         """选择Git版本"""
         try:
             # 获取版本列表
-            versions = self.get_git_versions()
+            versions = self._take_prefetched_versions() or self.get_git_versions()
             
             if not versions:
                 ui.print_error("未找到可用的Git版本")
@@ -328,9 +343,7 @@ class GitDownloader(BaseDownloader):
                 return False
             
             # 检查是否有管理员权限
-            is_admin = ctypes.windll.shell32.IsUserAnAdmin()
-            
-            if is_admin:
+            if is_admin():
                 # 已有管理员权限，直接安装
                 ui.print_info("正在以管理员权限安装...")
                 result = subprocess.run(
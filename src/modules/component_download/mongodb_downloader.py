@@ -3,20 +3,21 @@
 MongoDB下载器
 """
 
-import platform
 import os
 import subprocess
 import ctypes
-import requests
 import re
 from pathlib import Path
 from typing import Optional, List
-import structlog
+from ...core.logging import get_logger
 
 from ...ui.interface import ui
 from .base_downloader import BaseDownloader
+from ._http import http_session
+from ...utils.common import is_admin
+from ._platform import SYSTEM, arch_name
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class MongoDBDownloader(BaseDownloader):
@@ -24,16 +25,8 @@ class MongoDBDownloader(BaseDownloader):
     
     def __init__(self):
         super().__init__("MongoDB")
-        self.system = platform.system().lower()
-        self.arch = platform.machine().lower()
-        
-        # 标准化架构名称
-        if self.arch in ['x86_64', 'amd64']:
-            self.arch = 'x86_64'
-        elif self.arch in ['arm64', 'aarch64']:
-            self.arch = 'arm64'
-        else:
-            self.arch = 'x86_64'
+        self.system = SYSTEM
+        self.arch = arch_name('x86_64')
         
         self.selected_version = None
 
@@ -62,7 +55,7 @@ class MongoDBDownloader(BaseDownloader):
                 else:
                     ui.print_info("正在从GitHub获取版本列表...")
                 
-                response = requests.get(url, timeout=10)
+                response = http_session.get(url, timeout=10)
                 response.raise_for_status()
                 tags = response.json()
                 versions = []
@@ -104,12 +97,16 @@ class MongoDBDownloader(BaseDownloader):
         # 理论上不会到这里，但作为保险返回默认版本
         return self._get_default_versions()
 
+    def prefetch(self) -> None:
+        """预先获取MongoDB版本列表"""
+        self._prefetched_versions = self.fetch_versions()
+    
     def select_version(self) -> Optional[str]:
         """让用户选择版本"""
         using_fallback = False
         
         while True:  # 外层循环，支持重新获取
-            versions = self.fetch_versions()
+            versions = self._take_prefetched_versions() or self.fetch_versions()
             
             if not versions:
                 ui.print_warning("无法获取版本列表，将使用默认版本 7.0.4")
@@ -307,9 +304,7 @@ class MongoDBDownloader(BaseDownloader):
                 return False
             
             # 检查是否有管理员权限
-            is_admin = ctypes.windll.shell32.IsUserAnAdmin()
-            
-            if is_admin:
+            if is_admin():
                 # 已有管理员权限，直接使用 msiexec 安装
                 ui.print_info("正在以管理员权限安装...")
                 result = subprocess.run(
@@ -8,13 +8,13 @@ import os
 import tempfile
 from pathlib import Path
 from typing import Optional, Dict, List
-import structlog
+from ...core.logging import get_logger
 
 from ...ui.interface import ui
 from .base_downloader import BaseDownloader
 from ...modules.deployment_core.napcat_deployer import NapCatDeployer
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class NapCatDownloader(BaseDownloader):
@@ -94,6 +94,10 @@ class NapCatDownloader(BaseDownloader):
             }
         ]
     
+    def prefetch(self) -> None:
+        """预先获取NapCat版本列表"""
+        self._prefetched_versions = self.get_napcat_versions()
+    
     def select_version(self) -> Optional[Dict]:
         """选择NapCat版本"""
         # 是否使用默认版本（重试耗尽的标记）
@@ -102,7 +106,7 @@ class NapCatDownloader(BaseDownloader):
         while True:  # 外层循环，支持重新获取
             try:
                 # 获取版本列表
-                versions = self.get_napcat_versions()
+                versions = self._take_prefetched_versions() or self.get_napcat_versions()
                 
                 if not versions:
                     ui.print_error("未找到可用的NapCat版本")
@@ -3,18 +3,19 @@
 Node.js下载器
 """
 
-import platform
 import os
 import subprocess
 import ctypes
 from pathlib import Path
 from typing import Optional
-import structlog
+from ...core.logging import get_logger
 
 from ...ui.interface import ui
 from .base_downloader import BaseDownloader
+from ...utils.common import is_admin
+from ._platform import SYSTEM, arch_name
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class NodeJSDownloader(BaseDownloader):
@@ -22,16 +23,8 @@ class NodeJSDownloader(BaseDownloader):
     
     def __init__(self):
         super().__init__("Node.js")
-        self.system = platform.system().lower()
-        self.arch = platform.machine().lower()
-        
-        # 标准化架构名称
-        if self.arch in ['x86_64', 'amd64']:
-            self.arch = 'x64'
-        elif self.arch in ['arm64', 'aarch64']:
-            self.arch = 'arm64'
-        else:
-            self.arch = 'x64'  # 默认使用x64
+        self.system = SYSTEM
+        self.arch = arch_name('x64')
     
     def get_download_url(self) -> str:
         """获取Node.js下载链接"""
@@ -172,9 +165,7 @@ class NodeJSDownloader(BaseDownloader):
                 return False
             
             # 检查是否有管理员权限
-            is_admin = ctypes.windll.shell32.IsUserAnAdmin()
-            
-            if is_admin:
+            if is_admin():
                 # 已有管理员权限，直接使用 msiexec 安装
                 ui.print_info("正在以管理员权限安装...")
                 result = subprocess.run(
@@ -5,18 +5,19 @@ Python下载器
 """
 
 import os
-import platform
 import shutil
 import subprocess
 import ctypes
 from pathlib import Path
 from typing import Optional
-import structlog
+from ...core.logging import get_logger
 
 from ...ui.interface import ui
 from .base_downloader import BaseDownloader
+from ...utils.common import is_admin
+from ._platform import SYSTEM, arch_name
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class PythonDownloader(BaseDownloader):
@@ -24,16 +25,8 @@ class PythonDownloader(BaseDownloader):
     
     def __init__(self):
         super().__init__("Python")
-        self.system = platform.system().lower()
-        self.arch = platform.machine().lower()
-        
-        # 标准化架构名称
-        if self.arch in ['x86_64', 'amd64']:
-            self.arch = 'amd64'
-        elif self.arch in ['arm64', 'aarch64']:
-            self.arch = 'arm64'
-        else:
-            self.arch = 'amd64'  # 默认使用amd64
+        self.system = SYSTEM
+        self.arch = arch_name('amd64')
     
     def get_local_installer_path(self) -> Optional[Path]:
         """获取本地安装包路径"""
@@ -228,9 +221,7 @@ class PythonDownloader(BaseDownloader):
                 return False
             
             # 检查是否有管理员权限
-            is_admin = ctypes.windll.shell32.IsUserAnAdmin()
-            
-            if is_admin:
+            if is_admin():
                 # 已有管理员权限，直接安装
                 ui.print_info("正在以管理员权限安装...")
                 
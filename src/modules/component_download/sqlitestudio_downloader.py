@@ -4,15 +4,15 @@ SQLiteStudio下载器
 """
 
 import os
-import platform
 from pathlib import Path
 from typing import Optional
-import structlog
+from ...core.logging import get_logger
 
 from ...ui.interface import ui
 from .base_downloader import BaseDownloader
+from ._platform import SYSTEM, arch_name
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class SQLiteStudioDownloader(BaseDownloader):
@@ -20,16 +20,8 @@ class SQLiteStudioDownloader(BaseDownloader):
     
     def __init__(self):
         super().__init__("SQLiteStudio")
-        self.system = platform.system().lower()
-        self.arch = platform.machine().lower()
-        
-        # 标准化架构名称
-        if self.arch in ['x86_64', 'amd64']:
-            self.arch = 'x86_64'
-        elif self.arch in ['arm64', 'aarch64']:
-            self.arch = 'arm64'
-        else:
-            self.arch = 'x86_64'
+        self.system = SYSTEM
+        self.arch = arch_name('x86_64')
     
     def get_download_url(self) -> str:
         """获取SQLiteStudio下载链接"""
@@ -3,19 +3,20 @@
 Visual Studio Code下载器
 """
 
-import platform
 import os
 import subprocess
 import ctypes
 import requests
 from pathlib import Path
 from typing import Optional, List, Dict
-import structlog
+from ...core.logging import get_logger
 
 from ...ui.interface import ui
 from .base_downloader import BaseDownloader
+from ._http import http_session
+from ._platform import SYSTEM, arch_name
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class VSCODEDownloader(BaseDownloader):
@@ -23,16 +24,8 @@ class VSCODEDownloader(BaseDownloader):
     
     def __init__(self):
         super().__init__("VSCode")
-        self.system = platform.system().lower()
-        self.arch = platform.machine().lower()
-        
-        # 标准化架构名称
-        if self.arch in ['x86_64', 'amd64']:
-            self.arch = 'x64'
-        elif self.arch in ['arm64', 'aarch64']:
-            self.arch = 'arm64'
-        else:
-            self.arch = 'x64'
+        self.system = SYSTEM
+        self.arch = arch_name('x64')
     
     def get_vscode_versions(self) -> List[Dict]:
         """获取VSCode版本列表"""
@@ -40,7 +33,7 @@ class VSCODEDownloader(BaseDownloader):
             ui.print_info("正在获取VSCode最新版本信息...")
             
             # GitHub API获取releases - VSCode不在GitHub发布资产，只获取版本信息
-            response = requests.get(
+            response = http_session.get(
                 "https://api.github.com/repos/microsoft/vscode/releases",
                 timeout=10
             )
@@ -117,11 +110,15 @@ class VSCODEDownloader(BaseDownloader):
             }
         ]
     
+    def prefetch(self) -> None:
+        """预先获取VSCode版本列表"""
+        self._prefetched_versions = self.get_vscode_versions()
+    
     def select_version(self) -> Optional[Dict]:
         """选择VSCode版本"""
         try:
             # 获取版本列表
-            versions = self.get_vscode_versions()
+            versions = self._take_prefetched_versions() or self.get_vscode_versions()
             
             if not versions:
                 ui.print_error("未找到可用的VSCode版本")
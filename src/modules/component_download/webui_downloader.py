@@ -10,12 +10,13 @@ import tempfile
 import zipfile
 from pathlib import Path
 from typing import Optional
-import structlog
+from ...core.logging import get_logger
 
 from ...ui.interface import ui
 from .base_downloader import BaseDownloader
+from ._http import http_session
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class WebUIDownloader(BaseDownloader):
@@ -33,9 +34,8 @@ class WebUIDownloader(BaseDownloader):
     def get_available_branches(self) -> list:
         """获取可用的分支列表"""
         try:
-            import requests
             url = f"https://api.github.com/repos/{self.repo}/branches"
-            response = requests.get(url, timeout=10)
+            response = http_session.get(url, timeout=10)
             response.raise_for_status()
             
             branches = response.json()
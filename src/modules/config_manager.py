@@ -2,7 +2,7 @@
 配置管理模块
 负责配置的创建、修改、删除等操作
 """
-import structlog
+from ..core.logging import get_logger
 import os
 from typing import Dict, Any, Optional, List, Tuple
 from ..core.config import config_manager
@@ -10,7 +10,7 @@ from ..utils.common import validate_path, get_input_with_validation
 from ..utils.detector import auto_detector
 from ..ui.interface import ui
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class ConfigManager:
@@ -220,6 +220,16 @@ class ConfigManager:
         Returns:
             选中的配置或None
         """
+        selected = self.select_named_configuration()
+        return selected[1] if selected else None
+    
+    def select_named_configuration(self) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        选择配置，同时返回配置集名称
+        
+        Returns:
+            (配置集名称, 选中的配置) 或None
+        """
         configurations = self.config.get_all_configurations()
         if not configurations:
             ui.print_warning("没有可用的配置")
@@ -236,17 +246,12 @@ class ConfigManager:
                 return None
             
             # 根据序列号查找配置
-            selected_config = None
-            for cfg in configurations.values():
+            for name, cfg in configurations.items():
                 if (cfg.get("serial_number") == choice or 
                     str(cfg.get("absolute_serial_number")) == choice):
-                    selected_config = cfg
-                    break
+                    return name, cfg
             
-            if selected_config:
-                return selected_config
-            else:
-                ui.print_error("未找到匹配的实例序列号！")
+            ui.print_error("未找到匹配的实例序列号！")
     
     def edit_configuration(self, config_name: str) -> bool:
         """
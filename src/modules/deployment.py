@@ -10,10 +10,9 @@ import shutil
 import subprocess
 import tempfile
 from typing import Any, Dict, Optional, Tuple
-import structlog
 
 from ..core.config import config_manager
-from ..core.logging import set_console_log_level, reset_console_log_level
+from ..core.logging import get_logger, set_console_log_level, reset_console_log_level
 from ..ui.interface import ui
 from ..utils.common import validate_path, open_files_in_editor
 from ..utils.version_detector import compare_versions
@@ -29,7 +28,7 @@ from .deployment_core import (
     InstanceUpdater
 )
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class DeploymentManager:
@@ -14,13 +14,13 @@ import zipfile
 from pathlib import Path
 from typing import Tuple, Optional, List, Dict
 import requests
-import structlog
+from ...core.logging import get_logger
 from tqdm import tqdm
 
 from ...ui.interface import ui
 from ...core.p_config import p_config_manager
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class BaseDeployer:
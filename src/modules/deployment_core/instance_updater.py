@@ -11,13 +11,13 @@ import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List
-import structlog
+from ...core.logging import get_logger
 
 from ...ui.interface import ui
 from ...core.config import config_manager
 from .base_deployer import BaseDeployer
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class InstanceUpdater(BaseDeployer):
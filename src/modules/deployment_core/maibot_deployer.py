@@ -8,14 +8,14 @@ import re
 import shutil
 import tempfile
 from typing import Dict, Optional
-import structlog
+from ...core.logging import get_logger
 
 from .base_deployer import BaseDeployer
 from .version_manager import VersionManager
 from ...ui.interface import ui
 from ...utils.version_detector import get_version_requirements, compare_versions
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class MaiBotDeployer(BaseDeployer):
@@ -8,14 +8,14 @@ import re
 import shutil
 import tempfile
 from typing import Dict, Optional, Tuple
-import structlog
+from ...core.logging import get_logger
 
 from .base_deployer import BaseDeployer
 from .version_manager import VersionManager
 from .mofox_webui_deployer import MoFoxWebUIDeployer
 from ...ui.interface import ui
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class MoFoxBotDeployer(BaseDeployer):
@@ -9,7 +9,7 @@ import shutil
 import tempfile
 import zipfile
 import requests
-import structlog
+from ...core.logging import get_logger
 import time
 from typing import Dict, Optional, Tuple
 from pathlib import Path
@@ -17,7 +17,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskPr
 
 from ...ui.interface import ui
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class MoFoxWebUIDeployer:
@@ -13,13 +13,13 @@ import tempfile
 import time
 import zipfile
 from typing import Dict, List, Optional
-import structlog
+from ...core.logging import get_logger
 import requests
 
 from .base_deployer import BaseDeployer
 from ...ui.interface import ui
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class NapCatDeployer(BaseDeployer):
@@ -6,14 +6,14 @@
 import time
 from typing import Dict, List, Optional
 import requests
-import structlog
+from ...core.logging import get_logger
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.table import Table
 
 from ...ui.interface import ui
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class VersionManager:
@@ -5,7 +5,7 @@
 import os
 import shutil
 import uuid
-import structlog
+from ..core.logging import get_logger
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
@@ -15,7 +15,7 @@ from ..utils.version_detector import has_builtin_webui
 from ..ui.interface import ui
 from .launcher import launcher
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class InstanceMultiLauncher:
@@ -579,8 +579,10 @@ class InstanceMultiLauncher:
                 return
             elif choice == "A":
                 if ui.confirm("确定要停止所有运行中的实例吗？"):
-                    for instance in running_instances:
-                        self.stop_multi_instance(instance["id"])
+                    # 每停止一个实例都会保存一次，合并为最后统一写入
+                    with config_manager.batch():
+                        for instance in running_instances:
+                            self.stop_multi_instance(instance["id"])
             else:
                 try:
                     index = int(choice) - 1
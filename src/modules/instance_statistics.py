@@ -8,13 +8,13 @@ import json
 import time
 import webbrowser
 import subprocess
-import structlog
+from ..core.logging import get_logger
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
 from ..ui.interface import ui
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class InstanceStatisticsManager:
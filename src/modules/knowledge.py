@@ -4,12 +4,12 @@
 """
 import os
 import subprocess
-import structlog
+from ..core.logging import get_logger
 from typing import Dict, Any, Optional
 from ..ui.interface import ui
 from pathlib import Path
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class KnowledgeBuilder:
@@ -5,9 +5,10 @@
 import os
 import shutil
 import subprocess
+import threading
 import time
 import webbrowser
-import structlog
+from ..core.logging import get_logger
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
 import psutil
@@ -17,7 +18,7 @@ from ..ui.interface import ui
 from ..utils.common import check_process, validate_path
 from ..utils.version_detector import is_legacy_version, is_legacy_version_with_bot_type, has_builtin_webui
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 # --- 内部辅助类 ---
 
@@ -28,6 +29,19 @@ class _ProcessManager:
     """
     def __init__(self):
         self.running_processes: List[Dict[str, Any]] = []
+        # 状态监控的后台采集线程与界面线程（stop/restart）会同时访问 running_processes，
+        # 所有读写都需持有此锁；终止进程等耗时操作在锁外进行
+        self._lock = threading.RLock()
+
+    def find_process(self, pid: int) -> Optional[Dict[str, Any]]:
+        """按PID查找托管进程信息。"""
+        with self._lock:
+            return next((info for info in self.running_processes if info.get("process") and info["process"].pid == pid), None)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """返回托管进程列表的副本，供其他线程安全遍历。"""
+        with self._lock:
+            return list(self.running_processes)
 
     def start_in_new_cmd(self, command: str, cwd: str, title: str) -> Optional[subprocess.Popen]:
         """在新的CMD窗口中启动命令。"""
@@ -54,7 +68,8 @@ class _ProcessManager:
                 "cwd": cwd,
                 "start_time": time.time()
             }
-            self.running_processes.append(process_info)
+            with self._lock:
+                self.running_processes.append(process_info)
             ui.print_success(f"组件 '{title}' 启动成功！")
             return process
         except Exception as e:
@@ -65,7 +80,7 @@ class _ProcessManager:
     def stop_all(self):
         """停止所有由该管理器启动的进程。"""
         # 创建一个pid列表的副本进行迭代，因为stop_process会修改running_processes列表
-        pids_to_stop = [info["process"].pid for info in self.running_processes if info.get("process")]
+        pids_to_stop = [info["process"].pid for info in self.snapshot() if info.get("process")]
         
         if not pids_to_stop:
             return
@@ -81,9 +96,11 @@ class _ProcessManager:
     def get_running_processes_info(self) -> List[Dict]:
         """获取当前仍在运行的进程信息，包括资源占用。"""
         active_processes = []
-        # 过滤掉已经结束的进程
-        self.running_processes = [p for p in self.running_processes if p["process"].poll() is None]
-        for info in self.running_processes:
+        # 过滤掉已经结束的进程（在锁内完成过滤和回写，避免覆盖其他线程同时追加的进程）
+        with self._lock:
+            self.running_processes = [p for p in self.running_processes if p["process"].poll() is None]
+            running = list(self.running_processes)
+        for info in running:
             try:
                 p = psutil.Process(info["process"].pid)
                 info["pid"] = p.pid
@@ -101,7 +118,7 @@ class _ProcessManager:
 
     def stop_process(self, pid: int) -> bool:
         """通过PID停止单个进程及其子进程。"""
-        process_info = next((info for info in self.running_processes if info.get("process") and info["process"].pid == pid), None)
+        process_info = self.find_process(pid)
         
         if not process_info:
             logger.warning("尝试停止一个非托管进程", pid=pid)
@@ -151,14 +168,15 @@ class _ProcessManager:
             return False
         finally:
             # 无论成功与否，都从管理列表中移除
-            if process_info in self.running_processes:
-                self.running_processes.remove(process_info)
+            with self._lock:
+                if process_info in self.running_processes:
+                    self.running_processes.remove(process_info)
         
         return True
 
     def restart_process(self, pid: int) -> bool:
         """通过PID重启单个进程。"""
-        process_info = next((info for info in self.running_processes if info.get("process") and info["process"].pid == pid), None)
+        process_info = self.find_process(pid)
             
         if process_info:
             command = process_info["command"]
@@ -624,6 +642,8 @@ class MaiLauncher:
         self._components: Dict[str, _LaunchComponent] = {}
         self._config: Optional[Dict[str, Any]] = None
         self._process_cache: Dict[int, psutil.Process] = {}
+        # _process_cache 可能同时被状态监控的后台线程和界面线程访问
+        self._cache_lock = threading.Lock()
 
     @staticmethod
     def _get_python_command(config: Dict[str, Any], cwd: str) -> str:
@@ -912,7 +932,7 @@ class MaiLauncher:
         # 添加启动器自身的PID
         pids = [os.getpid()]
         # 添加所有由_process_manager管理的子进程PID
-        pids.extend([info["process"].pid for info in self._process_manager.running_processes if info.get("process") and info["process"].poll() is None])
+        pids.extend([info["process"].pid for info in self._process_manager.snapshot() if info.get("process") and info["process"].poll() is None])
         return pids
 
     def show_running_processes(self):
@@ -926,56 +946,53 @@ class MaiLauncher:
         table.add_column("内存 (MB)", style="yellow", justify="right")
         table.add_column("运行时间 (s)", style="blue", justify="right")
 
-        current_pids = {info["process"].pid for info in managed_procs_info}
-        current_pids.add(os.getpid())
+        with self._cache_lock:
+            current_pids = {info["process"].pid for info in managed_procs_info}
+            current_pids.add(os.getpid())
 
-        # 清理已结束进程的缓存
-        for pid in list(self._process_cache.keys()):
-            if pid not in current_pids:
-                del self._process_cache[pid]
+            # 清理已结束进程的缓存
+            for pid in list(self._process_cache.keys()):
+                if pid not in current_pids:
+                    del self._process_cache[pid]
         
-        all_process_meta = [{"pid": os.getpid(), "title": "麦麦启动器 (主程序)"}]
-        for info in managed_procs_info:
-            all_process_meta.append({"pid": info["process"].pid, "title": info["title"], "start_time": info["start_time"]})
+            all_process_meta = [{"pid": os.getpid(), "title": "麦麦启动器 (主程序)"}]
+            for info in managed_procs_info:
+                all_process_meta.append({"pid": info["process"].pid, "title": info["title"], "start_time": info["start_time"]})
 
-        if not all_process_meta:
-            ui.print_info("当前没有由本启动器启动的正在运行的进程。")
-            return table
-
-        for meta in all_process_meta:
-            pid = meta["pid"]
-            try:
-                p = self._process_cache.get(pid)
-                if p is None:
-                    p = psutil.Process(pid)
-                    p.cpu_percent()  # 第一次调用返回0，但会初始化计时器
-                    self._process_cache[pid] = p
-                    cpu_percent = 0.0
-                else:
-                    cpu_percent = p.cpu_percent() # 后续调用将返回有意义的值
+            for meta in all_process_meta:
+                pid = meta["pid"]
+                try:
+                    p = self._process_cache.get(pid)
+                    if p is None:
+                        p = psutil.Process(pid)
+                        p.cpu_percent()  # 第一次调用返回0，但会初始化计时器
+                        self._process_cache[pid] = p
+                        cpu_percent = 0.0
+                    else:
+                        cpu_percent = p.cpu_percent() # 后续调用将返回有意义的值
                 
-                memory_mb = p.memory_info().rss / (1024 * 1024)
-                running_time = time.time() - (meta.get("start_time") or p.create_time())
-
-                table.add_row(
-                    str(pid),
-                    meta['title'],
-                    f"{cpu_percent:.2f}",
-                    f"{memory_mb:.2f}",
-                    f"{int(running_time)}"
-                )
-            except (psutil.NoSuchProcess, Exception) as e:
-                logger.warning("获取进程信息失败", pid=pid, error=str(e))
-                if pid in self._process_cache:
-                    del self._process_cache[pid]
-        
+                    memory_mb = p.memory_info().rss / (1024 * 1024)
+                    running_time = time.time() - (meta.get("start_time") or p.create_time())
+
+                    table.add_row(
+                        str(pid),
+                        meta['title'],
+                        f"{cpu_percent:.2f}",
+                        f"{memory_mb:.2f}",
+                        f"{int(running_time)}"
+                    )
+                except (psutil.NoSuchProcess, Exception) as e:
+                    logger.warning("获取进程信息失败", pid=pid, error=str(e))
+                    if pid in self._process_cache:
+                        del self._process_cache[pid]
+
         return table
 
     def get_process_details(self, pid: int) -> Optional[Dict[str, Any]]:
         """获取单个进程的详细信息（不包括冲突的CPU数据）。"""
         try:
             p = psutil.Process(pid)
-            managed_info = next((info for info in self._process_manager.running_processes if info.get("process") and info["process"].pid == pid), None)
+            managed_info = self._process_manager.find_process(pid)
             
             details = {
                 "PID": p.pid,
@@ -7,14 +7,14 @@ import os
 import subprocess
 import zipfile
 import requests
-import structlog
+from ..core.logging import get_logger
 import re
 from typing import Optional, Tuple
 from pathlib import Path
 from tqdm import tqdm
 from ..ui.interface import ui
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class MongoDBInstaller:
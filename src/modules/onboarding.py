@@ -9,7 +9,7 @@ import random
 import tempfile
 import webbrowser
 from pathlib import Path
-import structlog
+from ..core.logging import get_logger
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm
@@ -30,7 +30,7 @@ from .component_download.vscode_downloader import VSCODEDownloader
 from .component_download.git_downloader import GitDownloader
 from .deployment import deployment_manager
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 class WipeRevealView:
     """擦除揭示视图，用于实现平滑的从色块到内容的过渡"""
@@ -14,7 +14,7 @@ import time
 import warnings
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import structlog
+from ..core.logging import get_logger
 from tqdm import tqdm
 from ..ui.interface import ui
 from ..utils.common import validate_path
@@ -23,7 +23,7 @@ from ..utils.notifier import windows_notifier
 # 忽略SSL警告（用于GitHub API访问）
 warnings.filterwarnings('ignore', message='Unverified HTTPS request')
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class WebUIInstaller:
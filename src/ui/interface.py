@@ -5,7 +5,9 @@
 """
 import time
 import os
-import structlog
+import threading
+from contextlib import contextmanager
+from ..core.logging import get_logger
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
@@ -16,7 +18,7 @@ from .theme import COLORS, SYMBOLS
 from .menus import Menus
 from .components import Components
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class UI:
@@ -28,6 +30,21 @@ class UI:
         self.symbols = SYMBOLS
         self.menus = Menus(self.console)
         self.components = Components(self.console)
+        # 按线程记录是否静默：后台线程（如并发预取版本列表）的提示只写日志，不输出到控制台
+        self._thread_state = threading.local()
+
+    @contextmanager
+    def quiet(self):
+        """在当前线程内暂停 print_* 的控制台输出（仍记录日志）"""
+        previous = self._is_quiet()
+        self._thread_state.quiet = True
+        try:
+            yield
+        finally:
+            self._thread_state.quiet = previous
+
+    def _is_quiet(self) -> bool:
+        return getattr(self._thread_state, "quiet", False)
 
     def clear_screen(self):
         """清屏"""
@@ -119,24 +136,29 @@ class UI:
 
     def print_success(self, message: str):
         logger.info(f"输出成功信息: {message}")
-        self.console.print(f"{self.symbols['success']} {message}", style=self.colors["success"])
+        if not self._is_quiet():
+            self.console.print(f"{self.symbols['success']} {message}", style=self.colors["success"])
     
     def print_error(self, message: str):
         logger.error(f"输出错误信息: {message}")
-        self.console.print(f"{self.symbols['error']} {message}", style=self.colors["error"])
+        if not self._is_quiet():
+            self.console.print(f"{self.symbols['error']} {message}", style=self.colors["error"])
     
     def print_warning(self, message: str):
         # 仅在日志中记录完整警告信息，控制台输出保持简洁
         logger.warning(f"警告: {message}")
-        self.console.print(f"{self.symbols['warning']} {message}", style=self.colors["warning"])
+        if not self._is_quiet():
+            self.console.print(f"{self.symbols['warning']} {message}", style=self.colors["warning"])
     
     def print_info(self, message: str):
         logger.info(f"输出提示信息: {message}")
-        self.console.print(f"{self.symbols['info']} {message}", style=self.colors["info"])
+        if not self._is_quiet():
+            self.console.print(f"{self.symbols['info']} {message}", style=self.colors["info"])
 
     def print_attention(self, message: str):
         logger.warning(f"输出注意信息: {message}")
-        self.console.print(f"{self.symbols['attention']} {message}", style=self.colors["attention"])
+        if not self._is_quiet():
+            self.console.print(f"{self.symbols['attention']} {message}", style=self.colors["attention"])
     
     def get_input(self, prompt_text: str, default: str = "") -> str:
         logger.info(f"请求用户输入: {prompt_text}", default=default)
@@ -6,7 +6,7 @@ UI菜单模块
 import json
 import random
 from pathlib import Path
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 
 from .theme import COLORS, SYMBOLS
@@ -19,23 +19,35 @@ class Menus:
         self.console = console
         self.colors = COLORS
         self.symbols = SYMBOLS
+        # 每日一言语录缓存：文件未修改时直接从内存中重新抽取
+        self._quotes = []
+        self._quotes_stamp = None
         self.daily_quote = self._load_daily_quote()
 
+    def _load_quotes(self):
+        """加载语录列表，文件修改时间和大小未变化时复用上次解析的结果"""
+        # 获取项目根目录路径
+        project_root = Path(__file__).parent.parent.parent
+        quote_file = project_root / "data" / "Golden_sentence.json"
+        
+        stat = quote_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._quotes_stamp:
+            with open(quote_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._quotes = [quote["content"] for quote in data.get("goldenQuotes", [])]
+            self._quotes_stamp = stamp
+        return self._quotes
+
     def _load_daily_quote(self):
         """从JSON文件加载随机每日一言"""
         try:
-            # 获取项目根目录路径
-            project_root = Path(__file__).parent.parent.parent
-            quote_file = project_root / "data" / "Golden_sentence.json"
-            
-            with open(quote_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                quotes = data.get("goldenQuotes", [])
-                if quotes:
-                    return random.choice(quotes)["content"]
-                else:
-                    return "促进多元化艺术创作发展普及"
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            quotes = self._load_quotes()
+            if quotes:
+                return random.choice(quotes)
+            else:
+                return "促进多元化艺术创作发展普及"
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
             # 如果文件不存在或解析失败，返回默认文字
             return "促进多元化艺术创作发展普及"
 
@@ -44,8 +56,25 @@ class Menus:
         self.daily_quote = self._load_daily_quote()
         return self.daily_quote
 
-    def print_header(self):
-        """打印程序头部"""
+    def _print_lines(self, *renderables):
+        """将多行菜单内容合并为一个 Group，只调用一次 console.print 输出
+
+        字符串或 (文本, 样式) 元组会按 console.print 的规则解析标记和表情，
+        其它对象（如 Panel）原样放入。
+        """
+        items = []
+        for item in renderables:
+            if isinstance(item, str):
+                items.append(self.console.render_str(item))
+            elif isinstance(item, tuple):
+                text, style = item
+                items.append(self.console.render_str(text, style=style))
+            else:
+                items.append(item)
+        self.console.print(Group(*items))
+
+    def _header_lines(self):
+        """程序头部的各行内容"""
         header_text = (
  """
 ooo        ooooo  .oooooo.           .oooooo..o     .                          .   
@@ -57,11 +86,17 @@ ooo        ooooo  .oooooo.           .oooooo..o     .                          .
 o&o        o&&&o `Y&bood&P'         &*`&&&&&P'    `&&&` `Y&&&``qo d&&&b      `&&&`
 """
         )
-        self.console.print(header_text, style=self.colors["header"])
-        # 每日一言和刷新选项在同一行显示,用 | 分割,使用斜体
-        self.console.print(f"[italic]{self.daily_quote} | [R] {self.symbols['refresh']} 刷新[/italic]", style=self.colors["header"])
-        self.console.print(f"\n{self.symbols['rocket']} 麦麦核心启动器控制台", style=self.colors["header"])
-        self.console.print("——————————", style=self.colors["border"])
+        return [
+            (header_text, self.colors["header"]),
+            # 每日一言和刷新选项在同一行显示,用 | 分割,使用斜体
+            (f"[italic]{self.daily_quote} | [R] {self.symbols['refresh']} 刷新[/italic]", self.colors["header"]),
+            (f"\n{self.symbols['rocket']} 麦麦核心启动器控制台", self.colors["header"]),
+            ("——————————", self.colors["border"]),
+        ]
+
+    def print_header(self):
+        """打印程序头部"""
+        self._print_lines(*self._header_lines())
 
     def show_main_menu(self, has_active_instance: bool = False):
         """显示主菜单
@@ -69,33 +104,30 @@ o&o        o&&&o `Y&bood&P'         &*`&&&&&P'    `&&&` `Y&&&``qo d&&&b      `&&
         Args:
             has_active_instance: 是否有活跃实例，用于决定显示"运行实例"还是"实例多开"
         """
-        self.print_header()
-        
-        self.console.print("====>>启动类<<====")
         if has_active_instance:
-            self.console.print(f" [A] {self.symbols['rocket']} 实例多开", style=self.colors["success"])
+            launch_line = (f" [A] {self.symbols['rocket']} 实例多开", self.colors["success"])
         else:
-            self.console.print(f" [A] {self.symbols['rocket']} 运行实例", style=self.colors["success"])
-        
-        self.console.print("====>>配置类<<====")
-        self.console.print(f" [B] {self.symbols['config']} 配置管理（新建/修改/检查配置）", style=self.colors["warning"])
-        
-        self.console.print("====>>功能类<<====")
-        self.console.print(f" [C] {self.symbols['knowledge']} 知识库构建", style=self.colors["secondary"])
-        self.console.print(f" [D] {self.symbols['database']} 数据库迁移（MongoDB → SQLite）", style=self.colors["secondary"])
-        self.console.print(f" [E] {self.symbols['plugin']} 插件管理（目前只支持MaiBot）", style=self.colors["primary"])
+            launch_line = (f" [A] {self.symbols['rocket']} 运行实例", self.colors["success"])
         
-        self.console.print("====>>部署类<<====")
-        self.console.print(f" [F] {self.symbols['deployment']} 实例部署辅助系统", style=self.colors["error"])
-        
-        self.console.print("====>>进程管理<<====")
-        self.console.print(f" [G] {self.symbols['status']} 查看运行状态", style=self.colors["info"])
-        
-        self.console.print("====>>杂项类<<====")
-        self.console.print(f" [H] {self.symbols['config']} 杂项（关于/程序设置）", style=self.colors["info"])
-        
-        self.console.print("====>>退出类<<====")
-        self.console.print(f" [Q] {self.symbols['quit']} 退出程序", style=self.colors["exit"])
+        self._print_lines(
+            *self._header_lines(),
+            "====>>启动类<<====",
+            launch_line,
+            "====>>配置类<<====",
+            (f" [B] {self.symbols['config']} 配置管理（新建/修改/检查配置）", self.colors["warning"]),
+            "====>>功能类<<====",
+            (f" [C] {self.symbols['knowledge']} 知识库构建", self.colors["secondary"]),
+            (f" [D] {self.symbols['database']} 数据库迁移（MongoDB → SQLite）", self.colors["secondary"]),
+            (f" [E] {self.symbols['plugin']} 插件管理（目前只支持MaiBot）", self.colors["primary"]),
+            "====>>部署类<<====",
+            (f" [F] {self.symbols['deployment']} 实例部署辅助系统", self.colors["error"]),
+            "====>>进程管理<<====",
+            (f" [G] {self.symbols['status']} 查看运行状态", self.colors["info"]),
+            "====>>杂项类<<====",
+            (f" [H] {self.symbols['config']} 杂项（关于/程序设置）", self.colors["info"]),
+            "====>>退出类<<====",
+            (f" [Q] {self.symbols['quit']} 退出程序", self.colors["exit"]),
+        )
 
     def show_config_menu(self):
         """显示配置菜单"""
@@ -104,17 +136,16 @@ o&o        o&&&o `Y&bood&P'         &*`&&&&&P'    `&&&` `Y&&&``qo d&&&b      `&&
             style=self.colors["warning"],
             title="配置管理"
         )
-        self.console.print(panel)
-        
-        self.console.print("====>>配置新建<<====")
-        self.console.print(f" [A] {self.symbols['new']} 自动检索实例", style=self.colors["success"])
-        self.console.print(f" [B] {self.symbols['edit']} 手动配置", style=self.colors["success"])
-        
-        self.console.print("====>>配置管理<<====")
-        self.console.print(f" [C] {self.symbols['config']} 配置管理（查看/编辑/删除配置）", style=self.colors["info"])
-        
-        self.console.print("====>>返回<<====")
-        self.console.print(f" [Q] {self.symbols['back']} 返回上级", style=self.colors["exit"])
+        self._print_lines(
+            panel,
+            "====>>配置新建<<====",
+            (f" [A] {self.symbols['new']} 自动检索实例", self.colors["success"]),
+            (f" [B] {self.symbols['edit']} 手动配置", self.colors["success"]),
+            "====>>配置管理<<====",
+            (f" [C] {self.symbols['config']} 配置管理（查看/编辑/删除配置）", self.colors["info"]),
+            "====>>返回<<====",
+            (f" [Q] {self.symbols['back']} 返回上级", self.colors["exit"]),
+        )
 
     def show_config_management_menu(self):
         """显示统一的配置管理菜单"""
@@ -123,20 +154,20 @@ o&o        o&&&o `Y&bood&P'         &*`&&&&&P'    `&&&` `Y&&&``qo d&&&b      `&&
             style=self.colors["info"],
             title="配置管理"
         )
-        self.console.print(panel)
-        
-        self.console.print("====>>配置操作<<====")
-        self.console.print(f" [A] {self.symbols['view']} 查看配置详情", style=self.colors["info"])
-        self.console.print(f" [B] {self.symbols['edit']} 直接编辑配置", style=self.colors["warning"])
-        self.console.print(f" [C] {self.symbols['view']} 可视化编辑配置", style=self.colors["success"])
-        self.console.print(f" [D] {self.symbols['validate']} 验证配置", style=self.colors["success"])
-        self.console.print(f" [E] {self.symbols['new']} 新建配置集", style=self.colors["success"])
-        self.console.print(f" [F] {self.symbols['delete']} 删除配置集", style=self.colors["error"])
-        self.console.print(f" [G] {self.symbols['edit']} 打开实例配置文件", style=self.colors["info"])
-        self.console.print(f" [H] {self.symbols['folder']} 打开实例所在目录", style=self.colors["info"])
-        
-        self.console.print("====>>返回<<====")
-        self.console.print(f" [Q] {self.symbols['back']} 返回上级", style=self.colors["exit"])
+        self._print_lines(
+            panel,
+            "====>>配置操作<<====",
+            (f" [A] {self.symbols['view']} 查看配置详情", self.colors["info"]),
+            (f" [B] {self.symbols['edit']} 直接编辑配置", self.colors["warning"]),
+            (f" [C] {self.symbols['view']} 可视化编辑配置", self.colors["success"]),
+            (f" [D] {self.symbols['validate']} 验证配置", self.colors["success"]),
+            (f" [E] {self.symbols['new']} 新建配置集", self.colors["success"]),
+            (f" [F] {self.symbols['delete']} 删除配置集", self.colors["error"]),
+            (f" [G] {self.symbols['edit']} 打开实例配置文件", self.colors["info"]),
+            (f" [H] {self.symbols['folder']} 打开实例所在目录", self.colors["info"]),
+            "====>>返回<<====",
+            (f" [Q] {self.symbols['back']} 返回上级", self.colors["exit"]),
+        )
 
     def show_instance_plugin_menu(self, instance_name: str):
         """显示实例的插件管理菜单"""
@@ -145,15 +176,15 @@ o&o        o&&&o `Y&bood&P'         &*`&&&&&P'    `&&&` `Y&&&``qo d&&&b      `&&
             style=self.colors["primary"],
             title="插件管理"
         )
-        self.console.print(panel)
-        
-        self.console.print("====>> 插件操作 <<====")
-        self.console.print(f" [A] {self.symbols['new']} 安装新插件", style=self.colors["success"])
-        self.console.print(f" [B] {self.symbols['delete']} 卸载已安装的插件", style=self.colors["error"])
-        self.console.print(f" [C] {self.symbols['view']} 查看已安装插件列表", style=self.colors["info"])
-        
-        self.console.print("====>> 返回 <<====")
-        self.console.print(f" [Q] {self.symbols['back']} 返回主菜单", style=self.colors["exit"])
+        self._print_lines(
+            panel,
+            "====>> 插件操作 <<====",
+            (f" [A] {self.symbols['new']} 安装新插件", self.colors["success"]),
+            (f" [B] {self.symbols['delete']} 卸载已安装的插件", self.colors["error"]),
+            (f" [C] {self.symbols['view']} 查看已安装插件列表", self.colors["info"]),
+            "====>> 返回 <<====",
+            (f" [Q] {self.symbols['back']} 返回主菜单", self.colors["exit"]),
+        )
 
     def show_misc_menu(self):
         """显示杂项菜单"""
@@ -162,16 +193,16 @@ o&o        o&&&o `Y&bood&P'         &*`&&&&&P'    `&&&` `Y&&&``qo d&&&b      `&&
             style=self.colors["info"],
             title="杂项"
         )
-        self.console.print(panel)
-        
-        self.console.print("====>>功能<<====")
-        self.console.print(f" [A] {self.symbols['about']} 关于本程序", style=self.colors["info"])
-        self.console.print(f" [B] {self.symbols['edit']} 程序设置", style=self.colors["warning"])
-        self.console.print(f" [C] {self.symbols['download']} 组件下载", style=self.colors["success"])
-        self.console.print(f" [D] {self.symbols['status']} 查看实例运行数据", style=self.colors["secondary"])
-        
-        self.console.print("====>>返回<<====")
-        self.console.print(f" [Q] {self.symbols['back']} 返回上级", style=self.colors["exit"])
+        self._print_lines(
+            panel,
+            "====>>功能<<====",
+            (f" [A] {self.symbols['about']} 关于本程序", self.colors["info"]),
+            (f" [B] {self.symbols['edit']} 程序设置", self.colors["warning"]),
+            (f" [C] {self.symbols['download']} 组件下载", self.colors["success"]),
+            (f" [D] {self.symbols['status']} 查看实例运行数据", self.colors["secondary"]),
+            "====>>返回<<====",
+            (f" [Q] {self.symbols['back']} 返回上级", self.colors["exit"]),
+        )
 
     def show_program_settings_menu(
         self,
@@ -4,7 +4,7 @@
 负责插件的查询、安装、卸载和管理
 """
 import shutil
-import structlog
+from ..core.logging import get_logger
 import requests
 import os
 import subprocess
@@ -19,7 +19,7 @@ from rich.console import Console
 from packaging.version import parse as parse_version, Version, InvalidVersion
 from ..modules.config_manager import config_mgr
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 class PluginManager:
     REPO_BASE = "https://raw.githubusercontent.com/Mai-with-u/plugin-repo/main"
@@ -5,26 +5,9 @@ UI主题模块
 """
 from src.core.p_config import p_config_manager
 
-# 默认颜色定义 (作为备用)
-DEFAULT_COLORS = {
-    "primary": "#BADFFA",
-    "success": "#4AF933",
-    "warning": "#F2FF5D",
-    "error": "#FF6B6B",
-    "info": "#6DA0FD",
-    "secondary": "#00FFBB",
-    "danger": "#FF6B6B",  # 别名 for error
-    "exit": "#7E1DE4",
-    "header": "#BADFFA",
-    "title": "bold magenta",
-    "border": "bright_black",
-    "table_header": "bold magenta",
-    "cyan": "cyan",
-    "white": "white",
-    "green": "green",
-    "blue": "#005CFA",
-    "attention":"#FF45F6"
-}
+# 默认颜色定义 (作为备用)，与程序配置的默认主题共用同一份定义
+# 复制一份：恢复默认颜色时会原地修改 COLORS，不能改动 DEFAULT_CONFIG 本身
+DEFAULT_COLORS = dict(p_config_manager.DEFAULT_CONFIG["theme"])
 
 # 从配置文件加载颜色，如果失败则使用默认值
 COLORS = p_config_manager.get_theme_colors() or DEFAULT_COLORS
@@ -5,12 +5,13 @@
 import os
 import sys
 import ctypes
+import functools
 import subprocess
 import re
-import structlog
+from ..core.logging import get_logger
 from typing import Optional, Tuple
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 def setup_console():
@@ -25,15 +26,93 @@ def setup_console():
             logger.warning("设置Windows控制台失败", error=str(e))
 
 
+class _KEY_EVENT_RECORD(ctypes.Structure):
+    _fields_ = [
+        ("bKeyDown", ctypes.c_int),
+        ("wRepeatCount", ctypes.c_ushort),
+        ("wVirtualKeyCode", ctypes.c_ushort),
+        ("wVirtualScanCode", ctypes.c_ushort),
+        ("UnicodeChar", ctypes.c_wchar),
+        ("dwControlKeyState", ctypes.c_ulong),
+    ]
+
+
+class _INPUT_EVENT(ctypes.Union):
+    # 实际的联合体还包含鼠标/窗口大小/焦点等记录，大小均不超过16字节
+    _fields_ = [("KeyEvent", _KEY_EVENT_RECORD), ("_size", ctypes.c_byte * 16)]
+
+
+class _INPUT_RECORD(ctypes.Structure):
+    _fields_ = [("EventType", ctypes.c_ushort), ("Event", _INPUT_EVENT)]
+
+
+_KEY_EVENT = 0x0001
+# 单独按下时 msvcrt.kbhit() 不会报告的修饰键：Shift/Ctrl/Alt/CapsLock/Win/NumLock/ScrollLock
+_MODIFIER_KEYS = frozenset((0x10, 0x11, 0x12, 0x14, 0x5B, 0x5C, 0x90, 0x91))
+_INPUT_PEEK_SIZE = 64
+
+
+def _is_key_input(record: _INPUT_RECORD) -> bool:
+    """判断输入记录是否为 msvcrt.getwch() 可读取的按键按下事件"""
+    if record.EventType != _KEY_EVENT:
+        return False
+    key = record.Event.KeyEvent
+    return bool(key.bKeyDown) and (key.UnicodeChar != '\0' or key.wVirtualKeyCode not in _MODIFIER_KEYS)
+
+
+def wait_for_console_input(timeout: float) -> bool:
+    """
+    阻塞等待控制台按键输入，直到有按键或超时。
+    
+    Windows下通过 WaitForSingleObject 等待控制台输入句柄，按键到达时立即返回，
+    无需按固定频率轮询。msvcrt.getwch() 只消耗按键按下记录，缓冲区中残留的按键抬起、
+    鼠标、焦点、窗口大小等记录会让句柄一直处于有信号状态，因此被这类记录唤醒时
+    将其读出丢弃后继续等待。其他平台退化为 sleep。
+    
+    Args:
+        timeout: 最长等待时间（秒）
+        
+    Returns:
+        是否在超时前收到了按键输入
+    """
+    import time
+    timeout = max(0.0, timeout)
+    if sys.platform == 'win32':
+        try:
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
+            records = (_INPUT_RECORD * _INPUT_PEEK_SIZE)()
+            count = ctypes.c_ulong()
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = max(0.0, deadline - time.monotonic())
+                if kernel32.WaitForSingleObject(handle, int(remaining * 1000)) != 0:  # 非 WAIT_OBJECT_0
+                    return False
+                if not kernel32.PeekConsoleInputW(handle, records, _INPUT_PEEK_SIZE, ctypes.byref(count)):
+                    return True
+                first_key = next((i for i in range(count.value) if _is_key_input(records[i])), None)
+                # 丢弃第一个按键之前（或全部）的非按键记录
+                discard = count.value if first_key is None else first_key
+                if discard:
+                    kernel32.ReadConsoleInputW(handle, records, discard, ctypes.byref(count))
+                if first_key is not None:
+                    return True
+        except Exception:
+            pass
+    time.sleep(timeout)
+    return False
+
+
 def clear_screen():
     """清屏"""
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
+@functools.lru_cache(maxsize=1)
 def is_admin() -> bool:
-    """检查是否以管理员权限运行"""
+    """检查是否以管理员权限运行（进程运行期间权限不会变化，结果只查询一次）"""
     try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
     except:
         return False
 
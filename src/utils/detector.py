@@ -3,10 +3,10 @@
 负责自动检测麦麦和适配器路径
 """
 import os
-import structlog
+from ..core.logging import get_logger
 from typing import Optional
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class AutoDetector:
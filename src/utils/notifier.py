@@ -8,7 +8,7 @@ import threading
 from pathlib import Path
 from typing import Optional
 
-import structlog
+from src.core.logging import get_logger
 
 from src.core.p_config import p_config_manager
 
@@ -37,7 +37,7 @@ except ImportError:  # pragma: no cover - optional dependency
     Notification = None  # type: ignore
     WINOTIFY_AVAILABLE = False
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class WindowsNotifier:
@@ -6,11 +6,11 @@ import os
 import socket
 import re
 import toml
-import structlog
+from ..core.logging import get_logger
 from typing import Dict, List, Optional, Tuple, Set
 from pathlib import Path
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class PortManager:
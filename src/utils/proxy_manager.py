@@ -3,11 +3,11 @@
 负责处理HTTP/HTTPS/SOCKS代理配置和应用
 """
 import os
-import structlog
+from src.core.logging import get_logger
 from typing import Dict, Optional, Any
 from src.core.p_config import p_config_manager
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class ProxyManager:
@@ -253,7 +253,8 @@ class ProxyManager:
             'username': proxy_cfg.get('username', ''),
             'has_password': bool(proxy_cfg.get('password', '')),
             'exclude_hosts': proxy_cfg.get('exclude_hosts', ''),
-            'proxy_url': self.get_proxy_url() if self.is_enabled() else None
+            # get_proxy_url 在未启用代理时本身就返回 None，无需再单独查询启用状态
+            'proxy_url': self.get_proxy_url()
         }
 
 
@@ -7,7 +7,7 @@ import threading
 from pathlib import Path
 from typing import Callable, Optional
 
-import structlog
+from ..core.logging import get_logger
 
 try:  # Optional dependencies; gracefully degrade if unavailable.
     from PIL import Image  # type: ignore
@@ -16,7 +16,7 @@ except ImportError:  # pragma: no cover - handled at runtime
     Image = None  # type: ignore
     pystray = None  # type: ignore
 
-logger = structlog.get_logger(__name__)
+logger = get_logger(__name__)
 
 
 class SystemTrayManager:
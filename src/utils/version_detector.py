@@ -6,8 +6,8 @@
 import re
 import os
 from typing import Tuple, Optional, Dict, Any
-import structlog
-logger = structlog.get_logger(__name__)
+from ..core.logging import get_logger
+logger = get_logger(__name__)
 
 
 def has_builtin_webui(version: str) -> bool: